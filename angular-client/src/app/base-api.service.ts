@@ -1,6 +1,6 @@
 import { Injectable } from '@angular/core';
-import {HttpClient} from '@angular/common/http';
-import {Observable} from 'rxjs';
+import {HttpClient, HttpResponse} from '@angular/common/http';
+import {EMPTY, Observable, expand, reduce} from 'rxjs';
 
 @Injectable({
   providedIn: 'root'
@@ -28,6 +28,19 @@ export class BaseApiService {
     return this.httpClient.get<T[]>(`${this.apiUrl}/${path}`);
   }
 
+  public getAllPages<T>(path: string): Observable<T[]> {
+    const getPage = (url: string) => this.httpClient.get<T[]>(url, {observe: 'response'});
+
+    return getPage(`${this.apiUrl}/${path}`).pipe(
+      expand((response: HttpResponse<T[]>) => {
+        const nextPageUrl = this.getNextPageUrl(response);
+
+        return nextPageUrl ? getPage(nextPageUrl) : EMPTY;
+      }),
+      reduce((items: T[], response: HttpResponse<T[]>) => items.concat(response.body ?? []), []),
+    );
+  }
+
   public post<T>(path: string, body: {}): Observable<T> {
     return this.httpClient.post<T>(`${this.apiUrl}/${path}`, body);
   }
@@ -39,4 +52,10 @@ export class BaseApiService {
   public delete<T>(path: string): Observable<T> {
     return this.httpClient.delete<T>(`${this.apiUrl}/${path}`);
   }
+
+  private getNextPageUrl(response: HttpResponse<unknown>): string | null {
+    const match = response.headers.get('Link')?.match(/<([^>]*)>;\s*rel="next"/);
+
+    return match ? match[1] : null;
+  }
 }
@@ -11,7 +11,7 @@ import {BaseApiService} from './base-api.service';
 export class GuestService extends BaseApiService {
 
   public getAllGuests(): Observable<Guest[]> {
-    return this.getAll<Guest>("guest/all");
+    return this.getAllPages<Guest>("guest/all?expand=accessibility_options&limit=1000");
   }
 
   public getById(id: number): Observable<Guest> {
@@ -4,12 +4,24 @@ import { useState, useEffect } from 'react';
 import { Guest } from '@/types/guest';
 import AddGuestForm from "@/app/add_guest/AddGuestForm";
 
+const fetchAllPages = async (url: string): Promise<Guest[]> => {
+    const items: Guest[] = [];
+    let nextPageUrl: string | undefined = url;
+
+    while (nextPageUrl) {
+        const res = await fetch(nextPageUrl);
+        items.push(...await res.json());
+        nextPageUrl = res.headers.get('Link')?.match(/<([^>]*)>;\s*rel="next"/)?.[1];
+    }
+
+    return items;
+};
+
 const GetGuestData = () => {
-    const [response, setResponse] = useState([]);
+    const [response, setResponse] = useState<Guest[]>([]);
 
     useEffect(() => {
-        fetch(`${process.env.NEXT_PUBLIC_API_URL}/guest/all`)
-            .then(res => res.json())
+        fetchAllPages(`${process.env.NEXT_PUBLIC_API_URL}/guest/all?limit=1000`)
             .then(data => setResponse(data));
     }, []);
 
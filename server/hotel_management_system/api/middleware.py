@@ -0,0 +1,110 @@
+"""A module containing the middlewares of the app."""
+
+import math
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from hotel_management_system.concurrency import fan_out_scope
+from hotel_management_system.db import database
+from hotel_management_system.loader import loader_scope
+from hotel_management_system.pool import read_your_writes_scope
+
+
+class LoaderScopeMiddleware:
+    """
+    A class representing the middleware opening a loader scope for every HTTP request,
+    so the entities loaded by the services are shared within the request only.
+
+    It also opens the fan-out scope of the request, so all its concurrent lookups
+    share one bound on the connections they take.
+    """
+
+    app: ASGIApp
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        The initializer of the `loader scope middleware`.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle a request inside its own loader and fan-out scopes.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel receiving the request messages.
+            send (Send): The channel sending the response messages.
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with fan_out_scope():
+            async with loader_scope():
+                await self.app(scope, receive, send)
+
+
+class ReadYourWritesMiddleware:
+    """
+    A class representing the middleware keeping the reads of a client on the primary database
+    for a while after its writes, so the replica lag never hides them.
+
+    A request making a write sets a cookie lasting the read-your-writes window,
+    and the requests sending it back read from the primary.
+    """
+
+    COOKIE_NAME = "read_primary"
+
+    app: ASGIApp
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        The initializer of the `read your writes middleware`.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle a request inside its own read-your-writes scope.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel receiving the request messages.
+            send (Send): The channel sending the response messages.
+        """
+
+        if scope["type"] != "http" or database.replica is None:
+            await self.app(scope, receive, send)
+            return
+
+        window = database.read_your_writes_window
+        pinned = self.COOKIE_NAME in HTTPConnection(scope).cookies
+
+        with read_your_writes_scope(window if pinned else 0.0) as pin:
+            pinned_until = pin.until
+
+            async def send_with_cookie(message: Message) -> None:
+                if message["type"] == "http.response.start" and pin.until > pinned_until:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "set-cookie",
+                        f"{self.COOKIE_NAME}=1; Max-Age={math.ceil(pin.until - time.monotonic())}; "
+                        f"Path=/; HttpOnly; SameSite=Lax",
+                    )
+
+                await send(message)
+
+            await self.app(scope, receive, send_with_cookie)
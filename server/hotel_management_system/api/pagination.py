@@ -0,0 +1,17 @@
+"""A module containing the helpers of the paginated endpoints."""
+
+from fastapi import Request, Response
+
+
+def set_next_page_link(request: Request, response: Response, after: int) -> None:
+    """Function pointing the client to the page following the returned one with a `Link` header.
+
+    The link repeats the query of the request, with the `after` cursor moved to the last returned key.
+
+    Args:
+        request (Request): The request of the returned page.
+        response (Response): The response to add the header to.
+        after (int): The key of the last returned item.
+    """
+
+    response.headers["Link"] = f'<{request.url.include_query_params(after=after)}>; rel="next"'
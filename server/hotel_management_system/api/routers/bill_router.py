@@ -1,14 +1,16 @@
 """A module containing bill management endpoints."""
 
-from typing import Iterable
+from typing import Iterable, List
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
+from hotel_management_system.api.pagination import set_next_page_link
+from hotel_management_system.config import config
 from hotel_management_system.container import Container
 from hotel_management_system.core.services.i_pricing_detail_service import IPricingDetailService
 from hotel_management_system.core.services.i_reservation_service import IReservationService
 from hotel_management_system.core.services.i_room_service import IRoomService
-from hotel_management_system.core.domains.bill import Bill, BillIn
+from hotel_management_system.core.domains.bill import Bill, BillExpansion, BillIn
 from hotel_management_system.core.services.i_bill_service import IBillService
 
 router = APIRouter()
@@ -55,18 +57,35 @@ async def create_bill(
 @router.get("/all", response_model=Iterable[Bill], status_code=200)
 @inject
 async def get_all_bills(
+        request: Request,
+        response: Response,
+        after: int | None = None,
+        limit: int = Query(config.PAGE_SIZE_DEFAULT, ge=1, le=config.PAGE_SIZE_MAX),
+        expand: List[BillExpansion] = Query([]),
         service: IBillService = Depends(Provide[Container.bill_service]),
 ) -> Iterable:
     """
-    Retrieve all bills.
+    Retrieve the bills of a page of reservations, ordered by reservation ID.
+
+    Bills have no ID of their own, so a page holds every bill of at most `limit` reservations.
+    A full page comes with a `Link` header pointing to the next one.
 
     Args:
+        request (Request): The request of the page.
+        response (Response): The response of the page.
+        after (int | None, optional): The reservation ID of the last bills of the previous page. Defaults to None.
+        limit (int, optional): The maximum number of reservations on the page. Defaults to `PAGE_SIZE_DEFAULT`.
+        expand (List[BillExpansion], optional): The nested data to include. Defaults to none.
         service (IBillService, optional): The service to fetch all bills.
 
     Returns:
-        Iterable: A collection of all bills.
+        Iterable: A collection of bills.
     """
-    bills = await service.get_all()
+    bills = await service.get_all(after, limit, expand)
+
+    if len({bill.reservation_id for bill in bills}) == limit:
+        set_next_page_link(request, response, bills[-1].reservation_id)
+
     return bills
 
 
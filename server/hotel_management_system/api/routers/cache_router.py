@@ -0,0 +1,20 @@
+"""A module containing cache monitoring endpoints."""
+
+from typing import Dict
+
+from fastapi import APIRouter
+
+from hotel_management_system.cache import caches
+
+router = APIRouter()
+
+
+@router.get("/stats", response_model=dict, status_code=200)
+async def get_cache_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get the size and the hit and miss counters of every in-process cache.
+
+    Returns:
+        Dict[str, Dict[str, int]]: The statistics keyed by the cache name.
+    """
+    return {name: cache.stats() for name, cache in caches.items()}
@@ -0,0 +1,119 @@
+"""A module containing data export endpoints."""
+
+from datetime import date
+from typing import AsyncIterator, Dict
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from hotel_management_system.container import Container
+from hotel_management_system.core.domains.export import ExportFormat
+from hotel_management_system.core.services.i_export_service import IExportService
+
+router = APIRouter()
+
+MEDIA_TYPES: Dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+@router.get("/reservations", response_class=StreamingResponse, status_code=200)
+@inject
+async def export_reservations(
+        start_date: date | None = Query(None, alias="from"),
+        end_date: date | None = Query(None, alias="to"),
+        guest_id: int | None = None,
+        export_format: ExportFormat = Query("ndjson", alias="format"),
+        export_service: IExportService = Depends(Provide[Container.export_service]),
+) -> StreamingResponse:
+    """
+    Stream the reservations starting in a date range, ordered by start date.
+
+    Args:
+        start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+        end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+        guest_id (int | None, optional): The ID of the guest to restrict the reservations to. Defaults to None.
+        export_format (ExportFormat, optional): The format of the export. Defaults to NDJSON.
+        export_service (IExportService, optional): The injected export service dependency.
+
+    Returns:
+        StreamingResponse: The reservations, one per line.
+    """
+    chunks = export_service.export_reservations(export_format, start_date, end_date, guest_id)
+
+    return stream_export(chunks, "reservations", export_format)
+
+
+@router.get("/bills", response_class=StreamingResponse, status_code=200)
+@inject
+async def export_bills(
+        start_date: date | None = Query(None, alias="from"),
+        end_date: date | None = Query(None, alias="to"),
+        guest_id: int | None = None,
+        export_format: ExportFormat = Query("ndjson", alias="format"),
+        export_service: IExportService = Depends(Provide[Container.export_service]),
+) -> StreamingResponse:
+    """
+    Stream the bills, with their prices, of the reservations starting in a date range.
+
+    Args:
+        start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+        end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+        guest_id (int | None, optional): The ID of the guest to restrict the bills to. Defaults to None.
+        export_format (ExportFormat, optional): The format of the export. Defaults to NDJSON.
+        export_service (IExportService, optional): The injected export service dependency.
+
+    Returns:
+        StreamingResponse: The bills, one per line.
+    """
+    chunks = export_service.export_bills(export_format, start_date, end_date, guest_id)
+
+    return stream_export(chunks, "bills", export_format)
+
+
+@router.get("/invoices", response_class=StreamingResponse, status_code=200)
+@inject
+async def export_invoices(
+        start_date: date | None = Query(None, alias="from"),
+        end_date: date | None = Query(None, alias="to"),
+        guest_id: int | None = None,
+        export_format: ExportFormat = Query("ndjson", alias="format"),
+        export_service: IExportService = Depends(Provide[Container.export_service]),
+) -> StreamingResponse:
+    """
+    Stream the invoices issued in a date range, with their total sums.
+
+    Args:
+        start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+        end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+        guest_id (int | None, optional): The ID of the guest to restrict the invoices to. Defaults to None.
+        export_format (ExportFormat, optional): The format of the export. Defaults to NDJSON.
+        export_service (IExportService, optional): The injected export service dependency.
+
+    Returns:
+        StreamingResponse: The invoices, one per line.
+    """
+    chunks = export_service.export_invoices(export_format, start_date, end_date, guest_id)
+
+    return stream_export(chunks, "invoices", export_format)
+
+
+def stream_export(chunks: AsyncIterator[str], name: str, export_format: ExportFormat) -> StreamingResponse:
+    """
+    Wrap the chunks of an export into a response downloaded as a file.
+
+    Args:
+        chunks (AsyncIterator[str]): The chunks of the export.
+        name (str): The name of the exported data, used as the file name.
+        export_format (ExportFormat): The format of the export.
+
+    Returns:
+        StreamingResponse: The response sending each chunk as soon as it is encoded.
+    """
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'},
+    )
@@ -2,18 +2,19 @@
 
 from typing import List
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
+from hotel_management_system.api.pagination import set_next_page_link
+from hotel_management_system.config import config
 from hotel_management_system.container import Container
-from hotel_management_system.core.domains.guest import Guest, GuestIn
+from hotel_management_system.core.domains.guest import Guest, GuestExpansion, GuestIn, GuestSearchMode
 from hotel_management_system.core.domains.guest_accessibility_option import GuestAccessibilityOptionIn
+from hotel_management_system.core.repositories.i_unit_of_work import IUnitOfWork
 from hotel_management_system.core.services.i_accessibility_option_service import IAccessibilityOptionService
 from hotel_management_system.core.services.i_guest_accessibility_option_service import IGuestAccessibilityOptionService
 from hotel_management_system.core.services.i_guest_service import IGuestService
 from hotel_management_system.core.services.i_reservation_service import IReservationService
 
-from hotel_management_system.api.routers.reservation_router import delete_reservation
-
 router = APIRouter()
 
 
@@ -72,18 +73,33 @@ async def create_guest(
 @router.get("/all", response_model=List[Guest], status_code=200)
 @inject
 async def get_all_guests(
+        request: Request,
+        response: Response,
+        after: int | None = None,
+        limit: int = Query(config.PAGE_SIZE_DEFAULT, ge=1, le=config.PAGE_SIZE_MAX),
+        expand: List[GuestExpansion] = Query([]),
         guest_service: IGuestService = Depends(Provide[Container.guest_service]),
 ) -> List:
     """
-    Retrieve all guests.
+    Retrieve a page of guests, ordered by ID.
+
+    A full page comes with a `Link` header pointing to the next one.
 
     Args:
+        request (Request): The request of the page.
+        response (Response): The response of the page.
+        after (int | None, optional): The ID of the last guest of the previous page. Defaults to None.
+        limit (int, optional): The maximum number of guests on the page. Defaults to `PAGE_SIZE_DEFAULT`.
+        expand (List[GuestExpansion], optional): The nested data to include. Defaults to none.
         guest_service (IGuestService, optional): The service for fetching all guest data.
 
     Returns:
-        List: A collection of all guests.
+        List: A collection of guests.
     """
-    guests = await guest_service.get_all()
+    guests = await guest_service.get_all(after, limit, expand)
+
+    if len(guests) == limit:
+        set_next_page_link(request, response, guests[-1].id)
 
     return guests
 
@@ -155,22 +171,25 @@ async def get_guest_by_last_name(
 
 @router.get("/needle/{needle}", response_model=List[Guest], status_code=200)
 @inject
-async def get_by_needle_in_name(
+async def search_guests(
         needle: str,
+        mode: GuestSearchMode = "similar",
+        limit: int = Query(config.GUEST_SEARCH_LIMIT, ge=1, le=config.PAGE_SIZE_MAX),
         guest_service: IGuestService = Depends(Provide[Container.guest_service]),
-) -> dict | None:
+) -> List[Guest]:
     """
-    Retrieve guests by a needle (substring) in their first or last name.
+    Search for guests by their name, email, phone number or city, best matches first.
 
     Args:
-        needle (str): The substring to search for in names.
+        needle (str): The text to search for.
+        mode (GuestSearchMode, optional): "similar" for fuzzy matching, "prefix" for autocomplete. Defaults to "similar".
+        limit (int, optional): The maximum number of guests. Defaults to `GUEST_SEARCH_LIMIT`.
         guest_service (IGuestService, optional): The service for fetching guest data.
 
     Returns:
-        List[Guest]: A list of guests whose first or last name contains the given needle.
+        List[Guest]: The matching guests, ordered by their similarity to the needle.
     """
-    if guests := await guest_service.get_by_needle_in_name(needle):
-        return guests
+    return await guest_service.search(needle, mode, limit)
 
 
 @router.put("/{guest_id}", response_model=Guest, status_code=201)
@@ -226,33 +245,59 @@ async def update_guest(
 async def delete_guest(
         guest_id: int,
         guest_service: IGuestService = Depends(Provide[Container.guest_service]),
-        guest_accessibility_option_service: IGuestAccessibilityOptionService = Depends(
-            Provide[Container.guest_accessibility_option_service]),
         reservation_service: IReservationService = Depends(Provide[Container.reservation_service]),
+        unit_of_work: IUnitOfWork = Depends(Provide[Container.unit_of_work]),
 ) -> None:
     """
-    Delete a guest along with their accessibility options.
+    Delete a guest along with their reservations and accessibility options, in a single transaction.
+
+    The invoices of the reservations are deleted too, as they hold the guest's name and address.
 
     Args:
         guest_id (int): The ID of the guest to delete.
         guest_service (IGuestService, optional): The service for managing guest data.
-        guest_accessibility_option_service (IGuestAccessibilityOptionService, optional): The service for managing guest accessibility options.
+        reservation_service (IReservationService, optional): The service for managing reservations.
+        unit_of_work (IUnitOfWork, optional): The unit of work the deletes are committed in.
 
     Raises:
         HTTPException: 404 if the guest does not exist.
     """
-    if not await guest_service.get_by_id(guest_id=guest_id):
-        raise HTTPException(status_code=404, detail="Guest not found")
+    async with unit_of_work.begin():
+        await reservation_service.delete_by_guest_ids([guest_id])
 
-    reservations = await reservation_service.get_by_guest_id(guest_id)
-    for reservation in reservations:
-        await delete_reservation(reservation.id)
+        if not await guest_service.delete_guests([guest_id]):
+            raise HTTPException(status_code=404, detail="Guest not found")
 
-    guest_accessibility_options = await guest_accessibility_option_service.get_by_guest_id(guest_id)
-    for guest_accessibility_option in guest_accessibility_options:
-        await guest_accessibility_option_service.delete_guest_accessibility_option(guest_id,
-                                                                                   guest_accessibility_option.accessibility_option_id)
+    return
 
-    await guest_service.delete_guest(guest_id)
 
-    return
+@router.post("/purge", response_model=dict, status_code=200)
+@inject
+async def purge_guests(
+        guest_ids: List[int],
+        guest_service: IGuestService = Depends(Provide[Container.guest_service]),
+        reservation_service: IReservationService = Depends(Provide[Container.reservation_service]),
+        unit_of_work: IUnitOfWork = Depends(Provide[Container.unit_of_work]),
+) -> dict:
+    """
+    Delete many guests along with their reservations and accessibility options, e.g. for GDPR erasure requests.
+
+    The invoices issued for the reservations are deleted along with them, as they hold the
+    guest's name and address, so keep an export of any invoice that must be retained for
+    accounting before purging. The number of statements does not depend on the number of
+    guests or their stays, and the whole purge is committed in a single transaction.
+
+    Args:
+        guest_ids (List[int]): The IDs of the guests to delete. Unknown IDs are skipped.
+        guest_service (IGuestService, optional): The service for managing guest data.
+        reservation_service (IReservationService, optional): The service for managing reservations.
+        unit_of_work (IUnitOfWork, optional): The unit of work the deletes are committed in.
+
+    Returns:
+        dict: The IDs of the deleted guests and reservations.
+    """
+    async with unit_of_work.begin():
+        reservation_ids = await reservation_service.delete_by_guest_ids(guest_ids)
+        deleted_guest_ids = await guest_service.delete_guests(guest_ids)
+
+    return {"guest_ids": deleted_guest_ids, "reservation_ids": reservation_ids}
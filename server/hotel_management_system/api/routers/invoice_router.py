@@ -2,10 +2,12 @@
 
 from typing import List
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
+from hotel_management_system.api.pagination import set_next_page_link
+from hotel_management_system.config import config
 from hotel_management_system.container import Container
-from hotel_management_system.core.domains.invoice import Invoice, InvoiceIn
+from hotel_management_system.core.domains.invoice import Invoice, InvoiceExpansion, InvoiceIn
 from hotel_management_system.core.services.i_invoice_service import IInvoiceService
 
 router = APIRouter()
@@ -37,18 +39,34 @@ async def create_invoice(
 @router.get("/all", response_model=List[Invoice], status_code=200)
 @inject
 async def get_all_invoices(
+        request: Request,
+        response: Response,
+        after: int | None = None,
+        limit: int = Query(config.PAGE_SIZE_DEFAULT, ge=1, le=config.PAGE_SIZE_MAX),
+        expand: List[InvoiceExpansion] = Query([]),
         invoice_service: IInvoiceService = Depends(Provide[Container.invoice_service]),
 ) -> List:
     """
-    Retrieve all invoices.
+    Retrieve a page of invoices, ordered by ID.
+
+    A full page comes with a `Link` header pointing to the next one.
 
     Args:
+        request (Request): The request of the page.
+        response (Response): The response of the page.
+        after (int | None, optional): The ID of the last invoice of the previous page. Defaults to None.
+        limit (int, optional): The maximum number of invoices on the page. Defaults to `PAGE_SIZE_DEFAULT`.
+        expand (List[InvoiceExpansion], optional): The nested data to include. Defaults to none.
         invoice_service (IInvoiceService, optional): The service for fetching all invoice data.
 
     Returns:
-        List: A collection of all invoices.
+        List: A collection of invoices.
     """
-    invoices = await invoice_service.get_all()
+    invoices = await invoice_service.get_all(after, limit, expand)
+
+    if len(invoices) == limit:
+        set_next_page_link(request, response, invoices[-1].id)
+
     return invoices
 
 
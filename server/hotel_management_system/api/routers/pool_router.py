@@ -0,0 +1,37 @@
+"""A module containing connection pool monitoring endpoints."""
+
+from typing import Dict
+
+from fastapi import APIRouter, HTTPException
+
+from hotel_management_system.db import database
+
+router = APIRouter()
+
+
+@router.get("/stats", response_model=dict, status_code=200)
+async def get_pool_stats() -> Dict[str, float]:
+    """
+    Get the size and the connections in use of the database pool, and the time spent waiting for them.
+
+    Returns:
+        Dict[str, float]: The statistics of the pool, with the wait times in milliseconds.
+    """
+    return database.pool_stats()
+
+
+@router.get("/replica/stats", response_model=dict, status_code=200)
+async def get_replica_pool_stats() -> Dict[str, float]:
+    """
+    Get the size and the connections in use of the read replica pool, and the time spent waiting for them.
+
+    Raises:
+        HTTPException: 404 if no read replica is configured.
+
+    Returns:
+        Dict[str, float]: The statistics of the pool, with the wait times in milliseconds.
+    """
+    if database.replica is None:
+        raise HTTPException(status_code=404, detail="No read replica is configured")
+
+    return database.replica.pool_stats()
@@ -1,64 +1,39 @@
 """A module containing report generation endpoints."""
 
-from typing import List
-from datetime import date, datetime
+from datetime import date
+from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Path
 
-from hotel_management_system.core.domains.reservation import Reservation
-from hotel_management_system.core.services.i_reservation_service import IReservationService
+from hotel_management_system.core.domains.analytics import LengthOfStayBucket, PerformanceSummary, RoomUtilization
+from hotel_management_system.core.domains.raport import RaportGranularity
+from hotel_management_system.core.services.i_analytics_service import IAnalyticsService
+from hotel_management_system.core.services.i_raport_service import IRaportService
 from hotel_management_system.container import Container
-from hotel_management_system.core.services.i_room_service import IRoomService
 
 raport_router = APIRouter()
 
 
-async def generate_raport(
-        reservations: List[Reservation],
-        room_service: IRoomService = Depends(Provide(Container.room_service)),
-) -> dict:
-    """
-    Generate a report based on the given reservations.
-
-    Args:
-        reservations (List[Reservation]): A list of reservations.
-        room_service (IRoomService, optional): The service for retrieving room data.
-
-    Returns:
-        dict: A dictionary containing the report details.
-    """
-    all_rooms = await room_service.get_all()
-
-    return {
-        "reserved_rooms_count": len(reservations),
-        "free_rooms_count": len(all_rooms) - len(reservations),
-        "total_income": sum([reservation.get_cost() for reservation in reservations]),
-        "total_guests_count": sum([reservation.number_of_guests for reservation in reservations]),
-        "total_guests_with_accessibilities_count": len([reservation.guest for reservation in reservations if
-                                                        len(reservation.guest.accessibility_options) > 0])
-    }
-
-
 @raport_router.get("/date/{date}", response_model=dict, status_code=201)
 @inject
 async def date_raport(
         date: date,
-        reservation_service: IReservationService = Depends(Provide[Container.reservation_service]),
+        raport_service: IRaportService = Depends(Provide[Container.raport_service]),
 ) -> dict:
     """
     Generate a report for a specific date.
 
     Args:
         date (date): The date for which to generate the report.
-        reservation_service (IReservationService, optional): The service for retrieving reservations.
+        raport_service (IRaportService, optional): The service summarizing reservations.
 
     Returns:
         dict: A dictionary containing the report for the specified date.
     """
-    reservations = await reservation_service.get_between_dates(date, date)
+    raport = await raport_service.get_between_dates(date, date)
 
-    return await generate_raport(reservations)
+    return raport.model_dump()
 
 
 @raport_router.get("/date/{start_date}/{end_date}", response_model=dict, status_code=201)
@@ -66,7 +41,7 @@ async def date_raport(
 async def between_dates_raport(
         start_date: date,
         end_date: date,
-        reservation_service: IReservationService = Depends(Provide[Container.reservation_service]),
+        raport_service: IRaportService = Depends(Provide[Container.raport_service]),
 ) -> dict:
     """
     Generate a report for a range of dates.
@@ -74,86 +49,89 @@ async def between_dates_raport(
     Args:
         start_date (date): The start date for the report.
         end_date (date): The end date for the report.
-        reservation_service (IReservationService, optional): The service for retrieving reservations.
+        raport_service (IRaportService, optional): The service summarizing reservations.
 
     Returns:
         dict: A dictionary containing the report for the specified date range.
     """
-    reservations = await reservation_service.get_between_dates(start_date, end_date)
+    raport = await raport_service.get_between_dates(start_date, end_date)
 
-    return await generate_raport(reservations)
+    return raport.model_dump()
 
 
 @raport_router.get("/today", response_model=dict, status_code=201)
 @inject
 async def todays_raport(
-        reservation_service: IReservationService = Depends(Provide[Container.reservation_service]),
+        raport_service: IRaportService = Depends(Provide[Container.raport_service]),
 ) -> dict:
     """
     Generate a report for today.
 
     Args:
-        reservation_service (IReservationService, optional): The service for retrieving reservations.
+        raport_service (IRaportService, optional): The service summarizing reservations.
 
     Returns:
         dict: A dictionary containing the report for today.
     """
-    today = datetime.today()
-    reservations = await reservation_service.get_between_dates(today, today)
+    today = date.today()
+    raport = await raport_service.get_between_dates(today, today)
 
-    return await generate_raport(reservations)
+    return raport.model_dump()
 
 
 @raport_router.get("/year/{year}", response_model=dict, status_code=201)
 @inject
-async def yearly_raport(
+async def yearly_breakdown_raport(
         year: int,
+        granularity: RaportGranularity = "month",
+        raport_service: IRaportService = Depends(Provide[Container.raport_service]),
 ) -> dict:
     """
-    Generate a report for a specific year.
+    Generate a report for a specific year, broken down per month, week or day.
 
     Args:
         year (int): The year for which to generate the report.
+        granularity (RaportGranularity, optional): The length of a single period. Defaults to "month".
+        raport_service (IRaportService, optional): The service summarizing reservations.
 
     Returns:
-        dict: A dictionary containing the report for the specified year.
+        dict: A dictionary of reports keyed by the month number, or by the first day of the week or day.
     """
+    raports = await raport_service.get_breakdown_by_year(year, granularity)
 
-    summaries = {}
-
-    for i in range(1, 13):
-        summaries[i] = await monthly_raport(year, i)
-
-    return summaries
+    return {
+        (period_start.month if granularity == "month" else period_start.isoformat()): raport.model_dump()
+        for period_start, raport in raports.items()
+    }
 
 
 @raport_router.get("/year/{year}/summary", response_model=dict, status_code=201)
 @inject
 async def yearly_raport(
         year: int,
-        reservation_service: IReservationService = Depends(Provide[Container.reservation_service]),
+        raport_service: IRaportService = Depends(Provide[Container.raport_service]),
 ) -> dict:
     """
     Generate a report for a specific year.
 
     Args:
         year (int): The year for which to generate the report.
-        reservation_service (IReservationService, optional): The service for retrieving reservations.
+        raport_service (IRaportService, optional): The service summarizing reservations.
 
     Returns:
         dict: A dictionary containing the report for the specified year.
     """
-    reservations_this_year = await reservation_service.get_by_year(year)
+    raport = await raport_service.get_by_year(year)
 
-    return await generate_raport(reservations_this_year)
+    return raport.model_dump()
 
 
 @raport_router.get("/year/{year}/month/{month_number}", response_model=dict, status_code=201)
 @inject
 async def monthly_raport(
         year: int,
-        month_number: int,
-        reservation_service: IReservationService = Depends(Provide[Container.reservation_service]),
+        month_number: int = Path(ge=1, le=12),
+        raport_service: IRaportService = Depends(Provide[Container.raport_service]),
 ) -> dict:
     """
     Generate a report for a specific month in a given year.
@@ -161,11 +139,100 @@ async def monthly_raport(
     Args:
         year (int): The year for which to generate the report.
         month_number (int): The month number (1-12) for which to generate the report.
-        reservation_service (IReservationService, optional): The service for retrieving reservations.
+        raport_service (IRaportService, optional): The service summarizing reservations.
 
     Returns:
         dict: A dictionary containing the report for the specified year and month.
     """
-    reservations_this_month = await reservation_service.get_by_month(year, month_number)
+    raport = await raport_service.get_by_month(year, month_number)
+
+    return raport.model_dump()
+
+
+@raport_router.get("/analytics/performance/{start_date}/{end_date}", response_model=PerformanceSummary, status_code=200)
+@inject
+async def performance_analytics(
+        start_date: date,
+        end_date: date,
+        analytics_service: IAnalyticsService = Depends(Provide[Container.analytics_service]),
+) -> PerformanceSummary:
+    """
+    Compute the occupancy rate, ADR and RevPAR of a range of dates.
+
+    Args:
+        start_date (date): The start date of the range.
+        end_date (date): The end date of the range, inclusive.
+        analytics_service (IAnalyticsService, optional): The service computing the indicators.
+
+    Returns:
+        PerformanceSummary: The indicators of the range, with the room nights and revenue they derive from.
+
+    Raises:
+        HTTPException: If the end date is before the start date.
+    """
+    if end_date < start_date:
+        raise HTTPException(status_code=422, detail="End date cannot be before the start date")
+
+    return await analytics_service.get_performance(start_date, end_date)
+
+
+@raport_router.get(
+    "/analytics/length_of_stay/{start_date}/{end_date}",
+    response_model=Iterable[LengthOfStayBucket],
+    status_code=200,
+)
+@inject
+async def length_of_stay_analytics(
+        start_date: date,
+        end_date: date,
+        analytics_service: IAnalyticsService = Depends(Provide[Container.analytics_service]),
+) -> Iterable:
+    """
+    Compute the histogram of the lengths of stay of the rooms reserved from a range of dates.
+
+    Args:
+        start_date (date): The first arrival date.
+        end_date (date): The last arrival date, inclusive.
+        analytics_service (IAnalyticsService, optional): The service computing the indicators.
+
+    Returns:
+        Iterable: The number of reserved rooms per number of nights, skipping empty buckets.
+
+    Raises:
+        HTTPException: If the end date is before the start date.
+    """
+    if end_date < start_date:
+        raise HTTPException(status_code=422, detail="End date cannot be before the start date")
+
+    return await analytics_service.get_length_of_stay(start_date, end_date)
+
+
+@raport_router.get(
+    "/analytics/room_utilization/{start_date}/{end_date}",
+    response_model=Iterable[RoomUtilization],
+    status_code=200,
+)
+@inject
+async def room_utilization_analytics(
+        start_date: date,
+        end_date: date,
+        analytics_service: IAnalyticsService = Depends(Provide[Container.analytics_service]),
+) -> Iterable:
+    """
+    Compute the share of the nights of a range of dates each room was sold for.
+
+    Args:
+        start_date (date): The start date of the range.
+        end_date (date): The end date of the range, inclusive.
+        analytics_service (IAnalyticsService, optional): The service computing the indicators.
+
+    Returns:
+        Iterable: The utilization of every room, ordered by room ID.
+
+    Raises:
+        HTTPException: If the end date is before the start date.
+    """
+    if end_date < start_date:
+        raise HTTPException(status_code=422, detail="End date cannot be before the start date")
 
-    return await generate_raport(reservations_this_month)
+    return await analytics_service.get_room_utilization(start_date, end_date)
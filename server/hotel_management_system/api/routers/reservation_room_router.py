@@ -35,6 +35,7 @@ async def create_reservation_room(
 
     Raises:
         HTTPException: If the room ID or reservation ID is not found.
+        HTTPException: If the room is already reserved in the period of the reservation.
     """
     if not await room_service.get_by_id(reservation_room.room_id):
         raise HTTPException(status_code=404, detail="Room id not found")
@@ -44,7 +45,10 @@ async def create_reservation_room(
 
     new_reservation_room = await reservation_room_service.add_reservation_room(reservation_room)
 
-    return new_reservation_room.model_dump() if new_reservation_room else {}
+    if not new_reservation_room:
+        raise HTTPException(status_code=409, detail="Room is already reserved in this period")
+
+    return new_reservation_room.model_dump()
 
 
 @router.get("/all", response_model=Iterable[ReservationRoom], status_code=200)
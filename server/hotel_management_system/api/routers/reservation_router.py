@@ -3,18 +3,17 @@
 from datetime import date
 from typing import Iterable, List
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
+from hotel_management_system.api.pagination import set_next_page_link
+from hotel_management_system.config import config
 from hotel_management_system.container import Container
-from hotel_management_system.core.domains.bill import BillIn
-from hotel_management_system.core.domains.reservation import Reservation, ReservationIn
-from hotel_management_system.core.domains.reservation_room import ReservationRoomIn
+from hotel_management_system.core.domains.reservation import Reservation, ReservationExpansion, ReservationIn
 from hotel_management_system.core.domains.room import Room
 from hotel_management_system.core.services.i_accessibility_option_service import IAccessibilityOptionService
-from hotel_management_system.core.services.i_bill_service import IBillService
+from hotel_management_system.core.services.i_availability_service import IAvailabilityService
 from hotel_management_system.core.services.i_guest_service import IGuestService
 from hotel_management_system.core.services.i_pricing_detail_service import IPricingDetailService
-from hotel_management_system.core.services.i_reservation_room_service import IReservationRoomService
 from hotel_management_system.core.services.i_reservation_service import IReservationService
 from hotel_management_system.core.services.i_room_service import IRoomService
 
@@ -49,10 +48,14 @@ async def create_best_reservation(
         Reservation | dict: The reservation details or an empty dictionary if no reservation is created.
 
     Raises:
+        HTTPException: If reservation end date is less or equal the start date.
         HTTPException: If the guest does not exist.
         HTTPException: If there are not enough available rooms.
         HTTPException: If the accessibility option does not exist.
     """
+    if reservation.end_date <= reservation.start_date:
+        raise HTTPException(status_code=409, detail="Reservation end date cannot be before the start date")
+
     if not await guest_service.get_by_id(reservation.guest_id):
         raise HTTPException(status_code=404, detail=f"No guest with id: {reservation.guest_id}")
 
@@ -99,23 +102,25 @@ async def create_reservation(
         room_ids: List[int],
         reservation_service: IReservationService = Depends(Provide[Container.reservation_service]),
         room_service: IRoomService = Depends(Provide[Container.room_service]),
-        reservation_room_service: IReservationRoomService = Depends(Provide[Container.reservation_room_service]),
         guest_service: IGuestService = Depends(Provide[Container.guest_service]),
-        bill_service: IBillService = Depends(Provide[Container.bill_service]),
         pricing_detail_service: IPricingDetailService = Depends(Provide[Container.pricing_detail_service]),
+        availability_service: IAvailabilityService = Depends(Provide[Container.availability_service]),
 ) -> Reservation | dict:
     """
     Create a new reservation and assign rooms to it.
 
+    The reservation, its rooms and its nightly bills are written in a single transaction.
+    The rooms are claimed through the room_occupancy table, whose exclusion constraint
+    rejects a stay overlapping another one in the same room, even under concurrent requests.
+
     Args:
         reservation (ReservationIn): The reservation data.
         room_ids (List[int]): The list of room IDs to reserve.
         reservation_service (IReservationService, optional): The injected reservation service dependency.
         room_service (IRoomService, optional): The injected room service dependency.
-        reservation_room_service (IReservationRoomService, optional): The injected reservation room service dependency.
         guest_service (IGuestService, optional): The injected guest service dependency.
-        bill_service (IBillService, optional): The injected bill service dependency.
         pricing_detail_service (IPricingDetailService, optional): The injected pricing detail service dependency.
+        availability_service (IAvailabilityService, optional): The injected availability service dependency.
 
     Returns:
         Reservation | dict: The new reservation details or an empty dictionary if the reservation was not created.
@@ -125,6 +130,7 @@ async def create_reservation(
         HTTPException: If the guest is not found
         HTTPException: If the rooms are not found
         HTTPException: If no pricing detail is found.
+        HTTPException: If one of the rooms is already reserved in the period.
     """
     if reservation.end_date <= reservation.start_date:
         raise HTTPException(status_code=409, detail="Reservation end date cannot be before the start date")
@@ -132,34 +138,29 @@ async def create_reservation(
     if not await guest_service.get_by_id(reservation.guest_id):
         raise HTTPException(status_code=404, detail=f"No guest with id: {reservation.guest_id}")
 
+    room_ids = list(dict.fromkeys(room_ids))
+    existing_room_ids = set(await room_service.get_existing_ids(room_ids))
+
     for id in room_ids:
-        if not await room_service.get_by_id(id):
+        if id not in existing_room_ids:
             raise HTTPException(status_code=404, detail=f"No room with id: {id}")
 
-    new_reservation = await reservation_service.add_reservation(reservation)
-
-    if new_reservation:
-        for id in room_ids:
-            new_reservation_room = ReservationRoomIn(reservation_id=new_reservation.id, room_id=id)
-            await reservation_room_service.add_reservation_room(new_reservation_room)
-
     pricing_detail = await pricing_detail_service.get_by_name("Doba hotelowa")
 
     if not pricing_detail:
-        await reservation_service.delete_reservation(new_reservation.id)
         raise HTTPException(status_code=404, detail="No pricing detail found")
 
-    for day in range(reservation.get_duration()):
-        for id in room_ids:
-            await bill_service.add_bill(BillIn(
-                room_id=id,
-                pricing_detail_id=pricing_detail.id,
-                reservation_id=new_reservation.id
-            ))
+    free_room_ids = await availability_service.get_free_room_ids(room_ids, reservation.start_date, reservation.end_date)
+
+    if len(free_room_ids) < len(room_ids):
+        raise HTTPException(status_code=409, detail="Room is already reserved in this period")
+
+    new_reservation = await reservation_service.add_reservation_with_rooms(reservation, room_ids, pricing_detail.id)
 
-    new_reservation = await reservation_service.get_by_id(new_reservation.id)
+    if not new_reservation:
+        raise HTTPException(status_code=409, detail="Room is already reserved in this period")
 
-    return new_reservation if new_reservation else {}
+    return new_reservation
 
 
 @router.get("/free_rooms", response_model=Iterable[Room], status_code=200)
@@ -179,25 +180,46 @@ async def get_all_free_rooms(
 
     Returns:
         Iterable[Room]: A list of free rooms.
+
+    Raises:
+        HTTPException: If the end date is before the start date.
     """
+    if end_date < start_date:
+        raise HTTPException(status_code=422, detail="End date cannot be before the start date")
+
     return await service.get_free_rooms(start_date, end_date)
 
 
 @router.get("/all", response_model=Iterable[Reservation], status_code=200)
 @inject
 async def get_all_reservations(
+        request: Request,
+        response: Response,
+        after: int | None = None,
+        limit: int = Query(config.PAGE_SIZE_DEFAULT, ge=1, le=config.PAGE_SIZE_MAX),
+        expand: List[ReservationExpansion] = Query([]),
         service: IReservationService = Depends(Provide[Container.reservation_service]),
 ) -> Iterable:
     """
-    Get all reservations.
+    Get a page of reservations, ordered by ID.
+
+    A full page comes with a `Link` header pointing to the next one.
 
     Args:
+        request (Request): The request of the page.
+        response (Response): The response of the page.
+        after (int | None, optional): The ID of the last reservation of the previous page. Defaults to None.
+        limit (int, optional): The maximum number of reservations on the page. Defaults to `PAGE_SIZE_DEFAULT`.
+        expand (List[ReservationExpansion], optional): The nested data to include. Defaults to none.
         service (IReservationService, optional): The injected reservation service dependency.
 
     Returns:
         Iterable[Reservation]: A collection of reservation details.
     """
-    reservations = await service.get_all()
+    reservations = await service.get_all(after, limit, expand)
+
+    if len(reservations) == limit:
+        set_next_page_link(request, response, reservations[-1].id)
 
     return reservations
 
@@ -225,6 +247,29 @@ async def get_all_reservations_between_months(
     return reservations
 
 
+@router.get("/all/active_in_month/", response_model=Iterable[Reservation], status_code=200)
+@inject
+async def get_all_reservations_active_in_month(
+        year: int,
+        month_number: int = Query(ge=1, le=12),
+        service: IReservationService = Depends(Provide[Container.reservation_service]),
+) -> Iterable:
+    """
+    Get all reservations whose stay overlaps the specified month.
+
+    Args:
+        year (int): The year of the reservations.
+        month_number (int): The month number (1 for January, 12 for December).
+        service (IReservationService, optional): The injected reservation service dependency.
+
+    Returns:
+        Iterable[Reservation]: A collection of reservations active during the month.
+    """
+    reservations = await service.get_active_by_month(year, month_number)
+
+    return reservations
+
+
 @router.get("/{reservation_id}", response_model=Reservation, status_code=200)
 @inject
 async def get_reservation_by_id(
@@ -300,13 +345,20 @@ async def update_reservation(
         dict: The updated reservation details.
 
     Raises:
+        HTTPException: If reservation end date is less or equal the start date.
         HTTPException: If the reservation does not exist.
+        HTTPException: If the new dates collide with another stay in one of its rooms.
     """
+    if updated_reservation.end_date <= updated_reservation.start_date:
+        raise HTTPException(status_code=409, detail="Reservation end date cannot be before the start date")
+
     if await service.get_by_id(reservation_id=reservation_id):
-        await service.update_reservation(
+        if not await service.update_reservation(
             reservation_id=reservation_id,
             data=updated_reservation,
-        )
+        ):
+            raise HTTPException(status_code=409, detail="Room is already reserved in this period")
+
         return {**updated_reservation.dict(), "id": reservation_id}
 
     raise HTTPException(status_code=404, detail="Reservation not found")
@@ -317,28 +369,19 @@ async def update_reservation(
 async def delete_reservation(
         reservation_id: int,
         reservation_service: IReservationService = Depends(Provide[Container.reservation_service]),
-        reservation_room_service: IReservationRoomService = Depends(Provide[Container.reservation_room_service]),
-        bill_service: IBillService = Depends(Provide[Container.bill_service])
 ) -> None:
     """
-    Delete a reservation by ID.
+    Delete a reservation by ID, along with its invoices, bills and rooms, in a single transaction.
 
     Args:
         reservation_id (int): The ID of the reservation.
         reservation_service (IReservationService, optional): The injected reservation service dependency.
-        reservation_room_service (IReservationRoomService, optional): The injected reservation_room service dependency.
+
     Raises:
         HTTPException: If the reservation is not found.
     """
 
-    if not await reservation_service.get_by_id(reservation_id=reservation_id):
+    if not await reservation_service.delete_reservation(reservation_id):
         raise HTTPException(status_code=404, detail="Reservation not found")
 
-    await bill_service.delete_bill_by_reservation_id(reservation_id)
-
-    for reservation_room in await reservation_room_service.get_by_reservation_id(reservation_id):
-        await reservation_room_service.delete_reservation_room(reservation_room.room_id, reservation_id)
-
-    await reservation_service.delete_reservation(reservation_id)
-
     return
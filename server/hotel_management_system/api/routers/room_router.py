@@ -4,10 +4,12 @@ A module containing room endpoints.
 
 from typing import Iterable, List
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
+from hotel_management_system.api.pagination import set_next_page_link
+from hotel_management_system.config import config
 from hotel_management_system.container import Container
-from hotel_management_system.core.domains.room import Room, RoomIn
+from hotel_management_system.core.domains.room import Room, RoomExpansion, RoomIn
 from hotel_management_system.core.domains.room_accessibility_option import RoomAccessibilityOptionIn
 from hotel_management_system.core.services.i_accessibility_option_service import IAccessibilityOptionService
 from hotel_management_system.core.services.i_room_accessibility_option_service import IRoomAccessibilityOptionService
@@ -65,18 +67,34 @@ async def create_room(
 @router.get("/all", response_model=Iterable[Room], status_code=200)
 @inject
 async def get_all_rooms(
+        request: Request,
+        response: Response,
+        after: int | None = None,
+        limit: int = Query(config.PAGE_SIZE_DEFAULT, ge=1, le=config.PAGE_SIZE_MAX),
+        expand: List[RoomExpansion] = Query([]),
         service: IRoomService = Depends(Provide[Container.room_service]),
 ) -> Iterable:
     """
-    Retrieve all rooms in the system.
+    Retrieve a page of the rooms in the system, ordered by ID.
+
+    A full page comes with a `Link` header pointing to the next one.
 
     Args:
+        request (Request): The request of the page.
+        response (Response): The response of the page.
+        after (int | None, optional): The ID of the last room of the previous page. Defaults to None.
+        limit (int, optional): The maximum number of rooms on the page. Defaults to `PAGE_SIZE_DEFAULT`.
+        expand (List[RoomExpansion], optional): The nested data to include. Defaults to none.
         service (IRoomService): The injected room service dependency.
 
     Returns:
         Iterable: A collection of rooms.
     """
-    rooms = await service.get_all()
+    rooms = await service.get_all(after, limit, expand)
+
+    if len(rooms) == limit:
+        set_next_page_link(request, response, rooms[-1].id)
+
     return rooms
 
 
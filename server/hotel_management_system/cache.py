@@ -0,0 +1,110 @@
+"""A module providing in-process caches."""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from hotel_management_system.pool import read_from_primary
+
+caches: Dict[str, "TTLCache"] = {}
+
+
+class TTLCache:
+    """
+    A class representing a bounded, least recently used cache whose entries expire after a TTL.
+
+    Values are deep-copied on the way in and out, so callers may freely mutate the
+    models they get. Every cache registers itself in `caches` under its name.
+    """
+
+    name: str
+    max_size: int
+    ttl: float
+    hits: int
+    misses: int
+    _entries: "OrderedDict[Hashable, Tuple[float, Any]]"
+    _generation: int
+
+    def __init__(self, name: str, max_size: int, ttl: float) -> None:
+        """
+        The initializer of the `TTL cache`.
+
+        Args:
+            name (str): The name the cache is registered and reported under.
+            max_size (int): The maximum number of entries.
+            ttl (float): The lifetime of an entry, in seconds.
+        """
+
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._generation = 0
+
+        caches[name] = self
+
+    async def get_or_load(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value of a key, loading and caching it on a miss.
+
+        A value loaded while the cache was invalidated is returned but not cached,
+        as it may predate the write that caused the invalidation. Values are loaded
+        from the primary, so a lagging replica cannot refill the cache with stale data.
+
+        Args:
+            key (Hashable): The key of the value.
+            load (Callable[[], Awaitable[Any]]): The coroutine function loading the value.
+
+        Returns:
+            Any: The value of the key.
+        """
+
+        entry = self._entries.get(key)
+
+        if entry and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return copy.deepcopy(entry[1])
+
+        self.misses += 1
+        generation = self._generation
+        with read_from_primary():
+            value = await load()
+
+        if generation == self._generation:
+            self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """
+        Evict a single key, or every entry when no key is given.
+
+        Args:
+            key (Hashable | None, optional): The key to evict. Defaults to None.
+        """
+
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+        self._generation += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report the size and the hit and miss counters of the cache.
+
+        Returns:
+            Dict[str, int]: The number of entries, hits and misses.
+        """
+
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,117 @@
+"""A module providing bounded concurrent execution of independent lookups."""
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, List, TypeVar
+
+from hotel_management_system.config import config
+
+T = TypeVar("T")
+
+_serial: ContextVar[bool] = ContextVar("serial", default=False)
+_fan_out_slots: ContextVar[asyncio.Semaphore | None] = ContextVar("fan_out_slots", default=None)
+
+
+@contextmanager
+def fan_out_scope(limit: int | None = None) -> Iterator[None]:
+    """Function opening a scope, e.g. an HTTP request, sharing one bound among all its `gather_bounded` calls.
+
+    The task opening the scope holds one of the `limit` lookups in flight, and every other
+    task of a fan-out, however deeply nested, takes one of the remaining slots, so nested
+    fan-outs cannot multiply the connections taken by a request.
+
+    Args:
+        limit (int | None, optional): The maximum number of lookups in flight within the scope.
+            Defaults to None, meaning `FAN_OUT_CONCURRENCY`.
+
+    Yields:
+        None: Control to the code running inside the scope.
+    """
+
+    limit = config.FAN_OUT_CONCURRENCY if limit is None else limit
+    token = _fan_out_slots.set(asyncio.Semaphore(max(limit - 1, 0)))
+
+    try:
+        yield
+    finally:
+        _fan_out_slots.reset(token)
+
+
+@contextmanager
+def serial_scope() -> Iterator[None]:
+    """Function opening a scope, e.g. a transaction, in which `gather_bounded` awaits one at a time.
+
+    A concurrent lookup runs in a task of its own and so on a connection of its own, which
+    does not see the uncommitted writes of the transaction open on the current connection.
+
+    Yields:
+        None: Control to the code running inside the scope.
+    """
+
+    token = _serial.set(True)
+
+    try:
+        yield
+    finally:
+        _serial.reset(token)
+
+
+async def gather_bounded(*awaitables: Awaitable[T], limit: int | None = None) -> List[T]:
+    """Function awaiting independent lookups concurrently, with at most `limit` of them in flight.
+
+    Every lookup in flight holds a connection of the pool, so the limit keeps a fan-out
+    from taking the whole pool. The calling task always awaits lookups itself, and the other
+    workers each take a slot of the current `fan_out_scope` first, so the bound holds for
+    the whole scope rather than for each call. The workers still waiting for a slot when the
+    calling task runs out of lookups are cancelled, so a nested fan-out never waits on a slot
+    held by its parent. Outside a scope the slots are those of the call only. The first error
+    cancels the remaining lookups and is raised as is. Inside a `serial_scope` the lookups
+    are awaited one at a time on the current connection.
+
+    Args:
+        *awaitables (Awaitable[T]): The lookups, e.g. coroutines not awaited yet.
+        limit (int | None, optional): The maximum number of lookups in flight.
+            Defaults to None, meaning `FAN_OUT_CONCURRENCY`.
+
+    Returns:
+        List[T]: The results, in the order of the lookups.
+    """
+
+    limit = config.FAN_OUT_CONCURRENCY if limit is None else limit
+    results: List[T] = [None] * len(awaitables)  # type: ignore[list-item]
+    pending = iter(enumerate(awaitables))
+
+    slots = _fan_out_slots.get() or asyncio.Semaphore(limit - 1)
+    waiting = set()
+
+    async def worker() -> None:
+        for index, awaitable in pending:
+            results[index] = await awaitable
+
+    async def slot_worker() -> None:
+        async with slots:
+            waiting.discard(asyncio.current_task())
+            await worker()
+
+    try:
+        if _serial.get() or limit <= 1 or len(awaitables) <= 1:
+            await worker()
+        else:
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    for _ in range(min(limit, len(awaitables)) - 1):
+                        waiting.add(task_group.create_task(slot_worker()))
+
+                    await worker()
+
+                    for task in waiting:
+                        task.cancel()
+            except BaseExceptionGroup as errors:
+                raise errors.exceptions[0]
+    finally:
+        for _, awaitable in pending:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+
+    return results
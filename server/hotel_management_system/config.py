@@ -15,6 +15,26 @@ class AppConfig(BaseConfig):
     DB_NAME: Optional[str] = None
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 10
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_STATEMENT_TIMEOUT: float = 30.0
+    DB_CONNECTION_MAX_IDLE_TIME: float = 300.0
+    DB_CONNECTION_MAX_QUERIES: int = 50_000
+    DB_ECHO: bool = False
+    DB_REPLICA_HOST: Optional[str] = None
+    DB_READ_YOUR_WRITES_WINDOW: float = 2.0
+    REFERENCE_CACHE_TTL: float = 300.0
+    REFERENCE_CACHE_MAX_SIZE: int = 1024
+    INVALIDATION_CHANNEL: str = "invalidation"
+    INVALIDATION_RECONNECT_DELAY: float = 5.0
+    PAGE_SIZE_DEFAULT: int = 100
+    PAGE_SIZE_MAX: int = 1000
+    GUEST_SEARCH_LIMIT: int = 20
+    FAN_OUT_CONCURRENCY: int = 4
+    EXPORT_CHUNK_SIZE: int = 500
+    PARQUET_EXPORT_DIR: str = "exports"
+    PARQUET_EXPORT_BATCH_SIZE: int = 50_000
 
 
 config = AppConfig()
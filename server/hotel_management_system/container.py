@@ -3,17 +3,36 @@
 from dependency_injector.containers import DeclarativeContainer
 from dependency_injector.providers import Factory, Singleton
 
+from hotel_management_system.cache import TTLCache
+from hotel_management_system.config import config
+from hotel_management_system.db import db_dsn
+from hotel_management_system.loader import DataLoader
+
 from hotel_management_system.infrastructure.repositories.bill_repository import BillRepository
+from hotel_management_system.infrastructure.repositories.cached_accessibility_option_repository import \
+    CachedAccessibilityOptionRepository
+from hotel_management_system.infrastructure.repositories.cached_pricing_detail_repository import \
+    CachedPricingDetailRepository
+from hotel_management_system.infrastructure.repositories.cached_room_accessibility_option_repository import \
+    CachedRoomAccessibilityOptionRepository
+from hotel_management_system.infrastructure.repositories.cached_room_repository import CachedRoomRepository
+from hotel_management_system.infrastructure.repositories.daily_stats_repository import DailyStatsRepository
+from hotel_management_system.infrastructure.repositories.analytics_repository import AnalyticsRepository
 from hotel_management_system.infrastructure.repositories.guest_accessibility_option_repository import \
     GuestAccessibilityOptionRepository
 from hotel_management_system.infrastructure.repositories.guest_repository import \
     GuestRepository
 from hotel_management_system.infrastructure.repositories.invoice_repository import InvoiceRepository
 from hotel_management_system.infrastructure.repositories.pricing_detail_repository import PricingDetailRepository
+from hotel_management_system.infrastructure.repositories.raport_repository import RaportRepository
 from hotel_management_system.infrastructure.repositories.reservation_repository import ReservationRepository
 from hotel_management_system.infrastructure.repositories.reservation_room_repository import ReservationRoomRepository
 from hotel_management_system.infrastructure.repositories.room_repository import RoomRepository
+from hotel_management_system.infrastructure.repositories.unit_of_work import UnitOfWork
+from hotel_management_system.infrastructure.services.analytics_service import AnalyticsService
+from hotel_management_system.infrastructure.services.availability_service import AvailabilityService
 from hotel_management_system.infrastructure.services.bill_service import BillService
+from hotel_management_system.infrastructure.services.export_service import ExportService
 from hotel_management_system.infrastructure.services.guest_accessibility_option_service import \
     GuestAccessibilityOptionService
 from hotel_management_system.infrastructure.services.guest_service import GuestService
@@ -21,8 +40,10 @@ from hotel_management_system.infrastructure.repositories.accessibility_option_re
     AccessibilityOptionRepository
 from hotel_management_system.infrastructure.services.accessibility_option_service import \
     AccessibilityOptionService
+from hotel_management_system.infrastructure.services.invalidation_bus import InvalidationBus
 from hotel_management_system.infrastructure.services.invoice_service import InvoiceService
 from hotel_management_system.infrastructure.services.pricing_detail_service import PricingDetailService
+from hotel_management_system.infrastructure.services.raport_service import RaportService
 from hotel_management_system.infrastructure.services.reservation_room_service import ReservationRoomService
 from hotel_management_system.infrastructure.services.reservation_service import ReservationService
 from hotel_management_system.infrastructure.services.room_service import RoomService
@@ -34,22 +55,83 @@ from hotel_management_system.infrastructure.services.room_accessibility_option_s
 
 class Container(DeclarativeContainer):
     """Container class for dependency injecting purposes."""
+    invalidation_bus = Singleton(
+        InvalidationBus,
+        dsn=db_dsn,
+        channel=config.INVALIDATION_CHANNEL,
+        reconnect_delay=config.INVALIDATION_RECONNECT_DELAY,
+    )
+
     guest_repository = Singleton(GuestRepository)
-    accessibility_option_repository = Singleton(AccessibilityOptionRepository)
-    room_repository = Singleton(RoomRepository)
-    room_accessibility_option_repository = Singleton(RoomAccessibilityOptionRepository)
+    accessibility_option_repository = Singleton(
+        CachedAccessibilityOptionRepository,
+        repository=Singleton(AccessibilityOptionRepository),
+        cache=Singleton(
+            TTLCache,
+            name="accessibility_options",
+            max_size=config.REFERENCE_CACHE_MAX_SIZE,
+            ttl=config.REFERENCE_CACHE_TTL,
+        ),
+        invalidation_bus=invalidation_bus,
+    )
+    room_repository = Singleton(
+        CachedRoomRepository,
+        repository=Singleton(RoomRepository),
+        cache=Singleton(
+            TTLCache,
+            name="rooms",
+            max_size=config.REFERENCE_CACHE_MAX_SIZE,
+            ttl=config.REFERENCE_CACHE_TTL,
+        ),
+        invalidation_bus=invalidation_bus,
+    )
+    room_accessibility_option_repository = Singleton(
+        CachedRoomAccessibilityOptionRepository,
+        repository=Singleton(RoomAccessibilityOptionRepository),
+        cache=Singleton(
+            TTLCache,
+            name="room_accessibility_options",
+            max_size=config.REFERENCE_CACHE_MAX_SIZE,
+            ttl=config.REFERENCE_CACHE_TTL,
+        ),
+        invalidation_bus=invalidation_bus,
+    )
     guest_accessibility_option_repository = Singleton(GuestAccessibilityOptionRepository)
     reservation_repository = Singleton(ReservationRepository)
     reservation_room_repository = Singleton(ReservationRoomRepository)
-    pricing_detail_repository = Singleton(PricingDetailRepository)
+    pricing_detail_repository = Singleton(
+        CachedPricingDetailRepository,
+        repository=Singleton(PricingDetailRepository),
+        cache=Singleton(
+            TTLCache,
+            name="pricing_details",
+            max_size=config.REFERENCE_CACHE_MAX_SIZE,
+            ttl=config.REFERENCE_CACHE_TTL,
+        ),
+        invalidation_bus=invalidation_bus,
+    )
     bill_repository = Singleton(BillRepository)
     invoice_repository = Singleton(InvoiceRepository)
+    raport_repository = Singleton(RaportRepository)
+    analytics_repository = Singleton(AnalyticsRepository)
+    daily_stats_repository = Singleton(DailyStatsRepository)
+    unit_of_work = Singleton(UnitOfWork)
+
+    guest_loader = Singleton(DataLoader, batch_load=guest_repository.provided.get_many_hydrated)
+    room_loader = Singleton(DataLoader, batch_load=room_repository.provided.get_many_hydrated)
+    reservation_loader = Singleton(DataLoader, batch_load=reservation_repository.provided.get_many_hydrated)
+
+    availability_service = Singleton(
+        AvailabilityService,
+        repository=reservation_room_repository,
+    )
 
     guest_service = Factory(
         GuestService,
         guest_repository=guest_repository,
         accessibility_option_repository=accessibility_option_repository,
         guest_accessibility_option_repository=guest_accessibility_option_repository,
+        guest_loader=guest_loader,
     )
 
     accessibility_option_service = Factory(
@@ -59,7 +141,11 @@ class Container(DeclarativeContainer):
 
     reservation_room_service = Factory(
         ReservationRoomService,
-        repository=reservation_room_repository
+        repository=reservation_room_repository,
+        availability_service=availability_service,
+        invalidation_bus=invalidation_bus,
+        unit_of_work=unit_of_work,
+        reservation_loader=reservation_loader,
     )
 
     room_service = Factory(
@@ -68,22 +154,30 @@ class Container(DeclarativeContainer):
         room_accessibility_option_repository=room_accessibility_option_repository,
         accessibility_option_repository=accessibility_option_repository,
         reservation_room_service=reservation_room_service,
+        room_loader=room_loader,
     )
 
     room_accessibility_option_service = Factory(
         RoomAccessibilityOptionService,
-        repository=room_accessibility_option_repository
+        repository=room_accessibility_option_repository,
+        room_loader=room_loader,
     )
 
     guest_accessibility_option_service = Factory(
         GuestAccessibilityOptionService,
-        repository=guest_accessibility_option_repository
+        repository=guest_accessibility_option_repository,
+        daily_stats_repository=daily_stats_repository,
+        unit_of_work=unit_of_work,
+        guest_loader=guest_loader,
     )
 
     bill_service = Factory(
         BillService,
         bill_repository=bill_repository,
-        pricing_detail_repository=pricing_detail_repository
+        pricing_detail_repository=pricing_detail_repository,
+        daily_stats_repository=daily_stats_repository,
+        unit_of_work=unit_of_work,
+        reservation_loader=reservation_loader,
     )
 
     reservation_service = Factory(
@@ -92,12 +186,19 @@ class Container(DeclarativeContainer):
         reservation_room_service=reservation_room_service,
         guest_service=guest_service,
         room_service=room_service,
-        bill_service=bill_service
+        bill_service=bill_service,
+        availability_service=availability_service,
+        daily_stats_repository=daily_stats_repository,
+        invalidation_bus=invalidation_bus,
+        unit_of_work=unit_of_work,
+        reservation_loader=reservation_loader,
     )
 
     pricing_detail_service = Factory(
         PricingDetailService,
-        repository=pricing_detail_repository
+        repository=pricing_detail_repository,
+        daily_stats_repository=daily_stats_repository,
+        unit_of_work=unit_of_work,
     )
 
     invoice_service = Factory(
@@ -105,3 +206,21 @@ class Container(DeclarativeContainer):
         invoice_repository=invoice_repository,
         reservation_service=reservation_service
     )
+
+    raport_service = Factory(
+        RaportService,
+        repository=raport_repository
+    )
+
+    analytics_service = Factory(
+        AnalyticsService,
+        repository=analytics_repository,
+    )
+
+    export_service = Factory(
+        ExportService,
+        reservation_repository=reservation_repository,
+        bill_repository=bill_repository,
+        invoice_repository=invoice_repository,
+        chunk_size=config.EXPORT_CHUNK_SIZE,
+    )
@@ -1,6 +1,8 @@
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
+from hotel_management_system.core.domains.record_mapper import compile_record_mapper
+
 
 class AccessibilityOptionIn(BaseModel):
     """Model representing the DTO for creating or updating an accessibility option."""
@@ -26,9 +28,7 @@ class AccessibilityOption(AccessibilityOptionIn):
         Returns:
             AccessibilityOption: The model instance populated with the data from the DB record.
         """
-        record_dict = dict(record)
+        return _record_mapper(record)
+
 
-        return cls(
-            id=record_dict.get("id"),
-            name=record_dict.get("name"),
-        )
+_record_mapper = compile_record_mapper(AccessibilityOption, "id", "name")
@@ -0,0 +1,45 @@
+"""Module containing analytics-related domain models"""
+from datetime import date
+from typing import NamedTuple
+
+import numpy as np
+from pydantic import BaseModel
+
+# The day the stay columns count their days from.
+EPOCH = date(1970, 1, 1)
+
+
+class RoomStays(NamedTuple):
+    """Columns of the nights each room is held by a reservation, one element per reserved room.
+
+    Dates are counted in days since the `EPOCH`, so the spans can be computed with integer arithmetic.
+    The sorted IDs of all the rooms, reserved or not, come along as the denominator of the rates.
+    """
+    room_id: np.ndarray
+    start_day: np.ndarray
+    end_day: np.ndarray
+    revenue: np.ndarray
+    room_ids: np.ndarray
+
+
+class PerformanceSummary(BaseModel):
+    """Model representing the occupancy and revenue indicators of a period."""
+    room_nights_available: int
+    room_nights_sold: int
+    revenue: float
+    occupancy_rate: float
+    average_daily_rate: float
+    revenue_per_available_room: float
+
+
+class LengthOfStayBucket(BaseModel):
+    """Model representing the number of reserved rooms arriving for a given number of nights."""
+    nights: int
+    reserved_rooms_count: int
+
+
+class RoomUtilization(BaseModel):
+    """Model representing the share of the nights of a period a room was sold for."""
+    room_id: int
+    nights_sold: int
+    utilization: float
@@ -1,7 +1,13 @@
+from typing import Literal
+
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
 from hotel_management_system.core.domains.pricing_detail import PricingDetail
+from hotel_management_system.core.domains.record_mapper import compile_record_mapper
+
+# The nested data the bill list endpoint can include.
+BillExpansion = Literal["pricing_detail"]
 
 
 class BillIn(BaseModel):
@@ -30,10 +36,7 @@ class Bill(BillIn):
         Returns:
             Bill: The model instance populated with the data from the DB record.
         """
-        record_dict = dict(record)
+        return _record_mapper(record)
+
 
-        return cls(
-            room_id=record_dict.get("room_id"),
-            pricing_detail_id=record_dict.get("pricing_detail_id"),
-            reservation_id=record_dict.get("reservation_id"),
-        )
+_record_mapper = compile_record_mapper(Bill, "room_id", "pricing_detail_id", "reservation_id")
@@ -0,0 +1,4 @@
+"""Module containing export-related domain models"""
+from typing import Literal
+
+ExportFormat = Literal["ndjson", "csv"]
@@ -1,11 +1,18 @@
 """Module containing airport-related domain models"""
 
-from typing import Optional, List
+from typing import Optional, List, Literal
 
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
 from hotel_management_system.core.domains.accessibility_option import AccessibilityOption
+from hotel_management_system.core.domains.record_mapper import compile_record_mapper
+
+# The nested data the guest list endpoint can include.
+GuestExpansion = Literal["accessibility_options"]
+
+# How the guest search matches the needle: by trigram similarity, or as the start of a word.
+GuestSearchMode = Literal["similar", "prefix"]
 
 
 class GuestIn(BaseModel):
@@ -40,16 +47,18 @@ class Guest(GuestIn):
         Returns:
             GuestDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),
-            first_name=record_dict.get("first_name"),
-            last_name=record_dict.get("last_name"),
-            address=record_dict.get("address"),
-            city=record_dict.get("city"),
-            country=record_dict.get("country"),
-            zip_code=record_dict.get("zip_code"),
-            phone_number=record_dict.get("phone_number"),
-            email=record_dict.get("email"),
-        )
+        return _record_mapper(record)
+
+
+_record_mapper = compile_record_mapper(
+    Guest,
+    "id",
+    "first_name",
+    "last_name",
+    "address",
+    "city",
+    "country",
+    "zip_code",
+    "phone_number",
+    "email",
+)
@@ -1,6 +1,8 @@
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
+from hotel_management_system.core.domains.record_mapper import compile_record_mapper
+
 
 class GuestAccessibilityOptionIn(BaseModel):
     """Model representing the input DTO for creating or updating a guest's accessibility option."""
@@ -41,9 +43,7 @@ class GuestAccessibilityOption(GuestAccessibilityOptionIn):
         Returns:
             GuestAccessibilityOption: The model instance populated with the data from the DB record.
         """
-        record_dict = dict(record)
+        return _record_mapper(record)
 
-        return cls(
-            guest_id=record_dict.get("guest_id"),
-            accessibility_option_id=record_dict.get("accessibility_option_id"),
-        )
+
+_record_mapper = compile_record_mapper(GuestAccessibilityOption, "guest_id", "accessibility_option_id")
@@ -1,8 +1,13 @@
 import datetime
+from typing import Literal
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
+from hotel_management_system.core.domains.record_mapper import compile_record_mapper
 from hotel_management_system.core.domains.reservation import Reservation
 
+# The nested data the invoice list endpoint can include.
+InvoiceExpansion = Literal["reservation"]
+
 
 class InvoiceIn(BaseModel):
     """Model representing the input DTO for creating or updating an invoice."""
@@ -40,15 +45,17 @@ class Invoice(InvoiceIn):
         Returns:
             Invoice: The model instance populated with the data from the DB record.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),
-            date_of_issue=record_dict.get("date_of_issue"),
-            first_name=record_dict.get("first_name"),
-            last_name=record_dict.get("last_name"),
-            address=record_dict.get("address"),
-            nip=record_dict.get("nip"),
-            reservation_id=record_dict.get("reservation_id"),
-            total_sum=record_dict.get("total_sum", 0.0),
-        )
+        return _record_mapper(record)
+
+
+_record_mapper = compile_record_mapper(
+    Invoice,
+    "id",
+    "date_of_issue",
+    "first_name",
+    "last_name",
+    "address",
+    "nip",
+    "reservation_id",
+    "total_sum",
+)
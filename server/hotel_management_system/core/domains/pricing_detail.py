@@ -1,6 +1,8 @@
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
+from hotel_management_system.core.domains.record_mapper import compile_record_mapper
+
 
 class PricingDetailIn(BaseModel):
     """Model representing the input DTO for creating or updating pricing details."""
@@ -27,10 +29,7 @@ class PricingDetail(PricingDetailIn):
         Returns:
             PricingDetail: The DTO instance populated with the data from the DB record.
         """
-        record_dict = dict(record)
+        return _record_mapper(record)
+
 
-        return cls(
-            id=record_dict.get("id"),
-            name=record_dict.get("name"),
-            price=record_dict.get("price"),
-        )
+_record_mapper = compile_record_mapper(PricingDetail, "id", "name", "price")
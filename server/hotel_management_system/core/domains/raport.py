@@ -0,0 +1,45 @@
+"""Module containing raport-related domain models"""
+from typing import Literal
+
+from asyncpg import Record
+from pydantic import BaseModel, ConfigDict
+
+from hotel_management_system.core.domains.record_mapper import compile_record_mapper
+
+RaportGranularity = Literal["day", "week", "month"]
+
+
+class Raport(BaseModel):
+    """Model representing the summary figures of the reservations in a period."""
+    reserved_rooms_count: int
+    free_rooms_count: int
+    total_income: float
+    total_guests_count: int
+    total_guests_with_accessibilities_count: int
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+    @classmethod
+    def from_record(cls, record: Record) -> "Raport":
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record.
+
+        Returns:
+            Raport: The final DTO instance.
+        """
+        return _record_mapper(record)
+
+
+_record_mapper = compile_record_mapper(
+    Raport,
+    "reserved_rooms_count",
+    "free_rooms_count",
+    "total_income",
+    "total_guests_count",
+    "total_guests_with_accessibilities_count",
+)
@@ -0,0 +1,71 @@
+"""Module containing the compiled mappers building domain models from DB records without validating them again"""
+from copy import deepcopy
+from functools import partial
+from typing import Any, Callable, Dict, Mapping, Type, TypeVar
+
+from pydantic import BaseModel
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+def compile_record_mapper(model: Type[Model], *columns: str) -> Callable[[Mapping[str, Any]], Model]:
+    """Function compiling a function building instances of a domain model straight from DB records.
+
+    The values come from typed columns, so they are set as they are instead of being validated
+    again, the way `model_construct` does. The mapper is generated as the source of a function
+    reading the columns by name, so no work per field is left for the time a record is mapped.
+    Validation keeps running on the API input models.
+
+    Args:
+        model (Type[Model]): The domain model to build.
+        *columns (str): The fields read from the record. A field with a default keeps it when
+            the record lacks its column, the other fields always take their defaults.
+
+    Returns:
+        Callable[[Mapping[str, Any]], Model]: The mapper of a DB record into a model instance.
+    """
+
+    namespace: Dict[str, Any] = {"model": model, "new": object.__new__, "set_attribute": object.__setattr__}
+    reads = []
+    values = []
+
+    for index, (name, field) in enumerate(model.model_fields.items()):
+        default = f"default_{index}"
+
+        if name in columns and field.is_required():
+            value = f"record[{name!r}]"
+        elif name in columns:
+            # The `databases` records have no `get`, but every record raises `KeyError` for a missing column.
+            namespace[default] = field.default
+            value = f"value_{index}"
+            reads.append(
+                f"    try:\n"
+                f"        {value} = record[{name!r}]\n"
+                f"    except KeyError:\n"
+                f"        {value} = {default}\n"
+            )
+        elif field.default_factory is not None:
+            namespace[default] = field.default_factory
+            value = f"{default}()"
+        elif isinstance(field.default, (list, dict, set)):
+            namespace[default] = type(field.default) if not field.default else partial(deepcopy, field.default)
+            value = f"{default}()"
+        else:
+            namespace[default] = field.default
+            value = default
+
+        values.append(f"{name!r}: {value}")
+
+    source = (
+        "def map_record(record):\n"
+        f"{''.join(reads)}"
+        "    instance = new(model)\n"
+        f"    set_attribute(instance, '__dict__', {{{', '.join(values)}}})\n"
+        f"    set_attribute(instance, '__pydantic_fields_set__', {{{', '.join(map(repr, columns))}}})\n"
+        "    set_attribute(instance, '__pydantic_extra__', None)\n"
+        "    set_attribute(instance, '__pydantic_private__', None)\n"
+        "    return instance\n"
+    )
+    exec(compile(source, f"<record mapper of {model.__name__}>", "exec"), namespace)
+
+    return namespace["map_record"]
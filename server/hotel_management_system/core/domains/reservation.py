@@ -1,13 +1,17 @@
 import datetime
-from typing import List
+from typing import List, Literal
 
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
 from hotel_management_system.core.domains.bill import Bill
 from hotel_management_system.core.domains.guest import Guest
+from hotel_management_system.core.domains.record_mapper import compile_record_mapper
 from hotel_management_system.core.domains.room import Room
 
+# The nested data the reservation list endpoint can include.
+ReservationExpansion = Literal["guest", "rooms", "bills"]
+
 
 class ReservationIn(BaseModel):
     """Model representing the input DTO for creating or updating a reservation."""
@@ -43,15 +47,7 @@ class Reservation(ReservationIn):
         Returns:
             Reservation: The final Reservation DTO instance.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),
-            guest_id=record_dict.get("guest_id"),
-            start_date=record_dict.get("start_date"),
-            end_date=record_dict.get("end_date"),
-            number_of_guests=record_dict.get("number_of_guests"),
-        )
+        return _record_mapper(record)
 
     def get_cost(self) -> float:
         """Calculate the total cost for the reservation from linked bills."""
@@ -60,3 +56,6 @@ class Reservation(ReservationIn):
             if bill.pricing_detail:
                 cost += bill.pricing_detail.price
         return cost
+
+
+_record_mapper = compile_record_mapper(Reservation, "id", "guest_id", "start_date", "end_date", "number_of_guests")
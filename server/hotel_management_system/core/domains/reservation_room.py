@@ -1,6 +1,8 @@
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
+from hotel_management_system.core.domains.record_mapper import compile_record_mapper
+
 
 class ReservationRoomIn(BaseModel):
     """Model representing reservation_room's DTO attributes."""
@@ -27,9 +29,7 @@ class ReservationRoom(ReservationRoomIn):
             ReservationRoom: The final DTO instance.
         """
 
-        record_dict = dict(record)
+        return _record_mapper(record)
+
 
-        return cls(
-            reservation_id=record_dict.get("reservation_id"),
-            room_id=record_dict.get("room_id"),
-        )
+_record_mapper = compile_record_mapper(ReservationRoom, "reservation_id", "room_id")
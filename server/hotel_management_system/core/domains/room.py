@@ -1,10 +1,14 @@
 """Module containing room-related domain models"""
-from typing import List
+from typing import List, Literal
 
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
 from hotel_management_system.core.domains.accessibility_option import AccessibilityOption
+from hotel_management_system.core.domains.record_mapper import compile_record_mapper
+
+# The nested data the room list endpoint can include.
+RoomExpansion = Literal["accessibility_options"]
 
 
 class RoomIn(BaseModel):
@@ -32,12 +36,7 @@ class Room(RoomIn):
         Returns:
             Room: The final DTO instance.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),
-            alias=record_dict.get("alias"),
-        )
+        return _record_mapper(record)
 
     def correlation_coefficient(self, accessibility_options: List[AccessibilityOption]) -> int:
         """Calculates a coefficient based on matched accessibility options.
@@ -54,3 +53,6 @@ class Room(RoomIn):
                 coefficient += 1
 
         return coefficient
+
+
+_record_mapper = compile_record_mapper(Room, "id", "alias")
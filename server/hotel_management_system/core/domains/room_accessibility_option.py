@@ -5,6 +5,8 @@ from typing import Optional
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
+from hotel_management_system.core.domains.record_mapper import compile_record_mapper
+
 
 class RoomAccessibilityOptionIn(BaseModel):
     """Model representing room_accessibility's DTO attributes."""
@@ -30,9 +32,7 @@ class RoomAccessibilityOption(RoomAccessibilityOptionIn):
         Returns:
             RoomAccessibilityOption: The final DTO instance.
         """
-        record_dict = dict(record)
+        return _record_mapper(record)
+
 
-        return cls(
-            room_id=record_dict.get("room_id"),
-            accessibility_option_id=record_dict.get("accessibility_option_id"),
-        )
+_record_mapper = compile_record_mapper(RoomAccessibilityOption, "room_id", "accessibility_option_id")
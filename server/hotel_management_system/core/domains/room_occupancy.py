@@ -0,0 +1,35 @@
+"""Module containing room occupancy-related domain models"""
+import datetime
+
+from asyncpg import Record
+from pydantic import BaseModel, ConfigDict
+
+from hotel_management_system.core.domains.record_mapper import compile_record_mapper
+
+
+class RoomOccupancy(BaseModel):
+    """Model representing the nights [start_date, end_date) a room is held by a reservation."""
+    reservation_id: int
+    room_id: int
+    start_date: datetime.date
+    end_date: datetime.date
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+    @classmethod
+    def from_record(cls, record: Record) -> "RoomOccupancy":
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record.
+
+        Returns:
+            RoomOccupancy: The final DTO instance.
+        """
+        return _record_mapper(record)
+
+
+_record_mapper = compile_record_mapper(RoomOccupancy, "reservation_id", "room_id", "start_date", "end_date")
@@ -0,0 +1,28 @@
+"""
+Module for managing analytics repository abstractions.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+
+from hotel_management_system.core.domains.analytics import RoomStays
+
+
+class IAnalyticsRepository(ABC):
+    """
+    Abstract base class defining the interface for an analytics repository.
+    """
+
+    @abstractmethod
+    async def get_room_stays(self, start_date: date, end_date: date) -> RoomStays:
+        """
+        Retrieve the reserved rooms whose stay overlaps the provided period, with their share of the revenue,
+        along with the IDs of all the rooms.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+
+        Returns:
+            RoomStays: The columns of the reserved rooms, and the room IDs.
+        """
@@ -3,7 +3,8 @@ Module for managing bill repository abstractions.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import date
+from typing import AsyncIterator, List
 from hotel_management_system.core.domains.bill import BillIn, Bill
 
 
@@ -13,14 +14,44 @@ class IBillRepository(ABC):
     """
 
     @abstractmethod
-    async def get_all_bills(self) -> List[Bill]:
+    async def get_all_bills(self, after: int | None = None, limit: int | None = None) -> List[Bill]:
         """
         Retrieve all bills from the data storage.
 
+        Bills have no ID of their own, so they are paged by reservation: with a limit,
+        the bills of at most `limit` reservations following the `after` reservation ID
+        are returned, ordered by reservation ID.
+
+        Args:
+            after (int | None, optional): The reservation ID of the last bills of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of reservations. Defaults to None.
+
         Returns:
             List[Bill]: A list of all bills in the data storage.
         """
 
+    @abstractmethod
+    def iterate_bills(
+            self,
+            start_date: date | None = None,
+            end_date: date | None = None,
+            guest_id: int | None = None,
+    ) -> AsyncIterator[Bill]:
+        """
+        Stream the bills, with their pricing details, of the reservations starting in a date range,
+        ordered by reservation ID.
+
+        The rows are read through a server-side cursor, so memory stays constant however many match.
+
+        Args:
+            start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+            end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+            guest_id (int | None, optional): The ID of the guest to restrict the bills to. Defaults to None.
+
+        Yields:
+            Bill: The matching bills.
+        """
+
     @abstractmethod
     async def get_by_id(self, room_id: int, pricing_detail_id: int) -> Bill | None:
         """
@@ -0,0 +1,124 @@
+"""
+Module for managing daily_stats repository abstractions.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from hotel_management_system.core.domains.bill import BillIn
+
+
+class IDailyStatsRepository(ABC):
+    """
+    Abstract base class defining the interface for a daily_stats repository.
+
+    The daily stats are rollups of the raport figures keyed by the reservation start date.
+    They are kept current by applying the contribution of every written reservation or bill,
+    and of every write to the prices and guest accessibility options they are computed from:
+    the contribution is removed before the write and added back after it, in the same transaction.
+    """
+
+    @abstractmethod
+    async def add_reservation(self, reservation_id: int) -> None:
+        """
+        Add the contribution of a reservation and its bills to the daily stats.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+        """
+
+    @abstractmethod
+    async def remove_reservation(self, reservation_id: int) -> None:
+        """
+        Remove the contribution of a reservation and its bills from the daily stats.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+        """
+
+    @abstractmethod
+    async def add_bill(self, data: BillIn) -> None:
+        """
+        Add the contribution of a single bill to the daily stats.
+
+        Args:
+            data (BillIn): The details of the bill.
+        """
+
+    @abstractmethod
+    async def add_bills(self, reservation_id: int) -> None:
+        """
+        Add the contribution of all bills of a reservation to the daily stats.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+        """
+
+    @abstractmethod
+    async def remove_bills(self, reservation_id: int) -> None:
+        """
+        Remove the contribution of all bills of a reservation from the daily stats.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+        """
+
+    @abstractmethod
+    async def remove_reservations(self, reservation_ids: List[int]) -> None:
+        """
+        Remove the contribution of several reservations and their bills from the daily stats.
+
+        Args:
+            reservation_ids (List[int]): The IDs of the reservations.
+        """
+
+    @abstractmethod
+    async def add_pricing_detail_bills(self, pricing_detail_id: int) -> None:
+        """
+        Add the contribution of all bills of a pricing detail to the daily stats.
+
+        Args:
+            pricing_detail_id (int): The ID of the pricing detail.
+        """
+
+    @abstractmethod
+    async def remove_pricing_detail_bills(self, pricing_detail_id: int) -> None:
+        """
+        Remove the contribution of all bills of a pricing detail from the daily stats.
+
+        Args:
+            pricing_detail_id (int): The ID of the pricing detail.
+        """
+
+    @abstractmethod
+    async def remove_pricing_detail(self, pricing_detail_id: int) -> None:
+        """
+        Remove the daily revenue rows of a pricing detail that is being deleted.
+
+        Args:
+            pricing_detail_id (int): The ID of the pricing detail.
+        """
+
+    @abstractmethod
+    async def add_guest_accessibilities(self, guest_ids: List[int]) -> None:
+        """
+        Add the accessibility counters of the reservations of several guests to the daily stats.
+
+        Args:
+            guest_ids (List[int]): The IDs of the guests.
+        """
+
+    @abstractmethod
+    async def remove_guest_accessibilities(self, guest_ids: List[int]) -> None:
+        """
+        Remove the accessibility counters of the reservations of several guests from the daily stats.
+
+        Args:
+            guest_ids (List[int]): The IDs of the guests.
+        """
+
+    @abstractmethod
+    async def rebuild(self) -> None:
+        """
+        Recompute the daily stats from all reservations and bills.
+        """
@@ -4,7 +4,7 @@ Module for managing guest repository abstractions.
 
 from abc import ABC, abstractmethod
 from typing import List
-from hotel_management_system.core.domains.guest import GuestIn, Guest
+from hotel_management_system.core.domains.guest import GuestIn, Guest, GuestSearchMode
 
 
 class IGuestRepository(ABC):
@@ -13,10 +13,17 @@ class IGuestRepository(ABC):
     """
 
     @abstractmethod
-    async def get_all_guests(self) -> List[Guest]:
+    async def get_all_guests(self, after: int | None = None, limit: int | None = None) -> List[Guest]:
         """
         Retrieve all guests from the data storage.
 
+        Without a limit, every guest is returned ordered by first name; with a limit,
+        the page following the `after` ID, ordered by ID.
+
+        Args:
+            after (int | None, optional): The ID of the last guest of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of guests. Defaults to None.
+
         Returns:
             List[Guest]: A list of all guests.
         """
@@ -33,6 +40,18 @@ class IGuestRepository(ABC):
             Guest | None: The details of the guest if found, or None if not found.
         """
 
+    @abstractmethod
+    async def get_many_hydrated(self, guest_ids: List[int]) -> List[Guest]:
+        """
+        Retrieve guests together with their accessibility options, with a fixed number of queries.
+
+        Args:
+            guest_ids (List[int]): The IDs of the guests.
+
+        Returns:
+            List[Guest]: The found guests.
+        """
+
     @abstractmethod
     async def get_by_first_name(self, first_name: str) -> List[Guest] | None:
         """
@@ -58,15 +77,17 @@ class IGuestRepository(ABC):
         """
 
     @abstractmethod
-    async def get_by_needle_in_name(self, needle: str) -> List[Guest] | None:
+    async def search(self, needle: str, mode: GuestSearchMode = "similar", limit: int = 20) -> List[Guest]:
         """
-        Search for guests whose names contain a specific substring.
+        Search for guests by their name, email, phone number or city, best matches first.
 
         Args:
-            needle (str): A substring to search for within guest names.
+            needle (str): The text to search for.
+            mode (GuestSearchMode, optional): Whether to match similar words or word prefixes. Defaults to "similar".
+            limit (int, optional): The maximum number of guests. Defaults to 20.
 
         Returns:
-            List[Guest] | None: A list of guests whose names contain the substring, or None if no match is found.
+            List[Guest]: The matching guests, ordered by their similarity to the needle.
         """
 
     @abstractmethod
@@ -94,6 +115,20 @@ class IGuestRepository(ABC):
             Guest | None: The updated guest details, or None if the guest is not found.
         """
 
+    @abstractmethod
+    async def delete_guests(self, guest_ids: List[int]) -> List[int]:
+        """
+        Remove guests along with their accessibility options, with one statement per table.
+
+        The guests must no longer have reservations.
+
+        Args:
+            guest_ids (List[int]): The IDs of the guests to remove.
+
+        Returns:
+            List[int]: The IDs of the removed guests.
+        """
+
     @abstractmethod
     async def delete_guest(self, guest_id: int) -> bool:
         """
@@ -3,7 +3,8 @@ Module for managing invoice repository abstractions.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import date
+from typing import AsyncIterator, List
 from hotel_management_system.core.domains.invoice import InvoiceIn, Invoice
 
 
@@ -13,14 +14,42 @@ class IInvoiceRepository(ABC):
     """
 
     @abstractmethod
-    async def get_all_invoices(self) -> List[Invoice]:
+    async def get_all_invoices(self, after: int | None = None, limit: int | None = None) -> List[Invoice]:
         """
-        Retrieve all invoices from the data storage.
+        Retrieve all invoices from the data storage, together with their total sums.
+
+        Without a limit, every invoice is returned ordered by first name; with a limit,
+        the page following the `after` ID, ordered by ID.
+
+        Args:
+            after (int | None, optional): The ID of the last invoice of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of invoices. Defaults to None.
 
         Returns:
             List[Invoice]: A list of all invoices.
         """
 
+    @abstractmethod
+    def iterate_invoices(
+            self,
+            start_date: date | None = None,
+            end_date: date | None = None,
+            guest_id: int | None = None,
+    ) -> AsyncIterator[Invoice]:
+        """
+        Stream the invoices issued in a date range, together with their total sums, ordered by ID.
+
+        The rows are read through a server-side cursor, so memory stays constant however many match.
+
+        Args:
+            start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+            end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+            guest_id (int | None, optional): The ID of the guest to restrict the invoices to. Defaults to None.
+
+        Yields:
+            Invoice: The matching invoices.
+        """
+
     @abstractmethod
     async def get_by_id(self, invoice_id: int) -> Invoice | None:
         """
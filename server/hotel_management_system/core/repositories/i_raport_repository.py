@@ -0,0 +1,60 @@
+"""
+Module for managing raport repository abstractions.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict
+
+from hotel_management_system.core.domains.raport import Raport, RaportGranularity
+
+
+class IRaportRepository(ABC):
+    """
+    Abstract base class defining the interface for a raport repository.
+    """
+
+    @abstractmethod
+    async def get_between_dates(self, start_date: date, end_date: date) -> Raport:
+        """
+        Summarize the reservations starting between the provided start and end dates.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+
+        Returns:
+            Raport: The summary of the reservations.
+        """
+
+    @abstractmethod
+    async def get_by_month(self, year: int, month_number: int) -> Raport:
+        """
+        Summarize the reservations starting during the specified month.
+
+        Args:
+            year (int): The year of the reservations.
+            month_number (int): The month number (1 for January, 12 for December).
+
+        Returns:
+            Raport: The summary of the reservations.
+        """
+
+    @abstractmethod
+    async def get_breakdown(
+            self,
+            start_date: date,
+            end_date: date,
+            granularity: RaportGranularity,
+    ) -> Dict[date, Raport]:
+        """
+        Summarize the reservations starting between the provided dates, per day, week or month.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+            granularity (RaportGranularity): The length of a single period.
+
+        Returns:
+            Dict[date, Raport]: The summaries keyed by the first day of their period, including empty periods.
+        """
@@ -4,9 +4,9 @@ Module for managing reservation repository abstractions.
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List
+from typing import AsyncIterator, Collection, List
 
-from hotel_management_system.core.domains.reservation import ReservationIn, Reservation
+from hotel_management_system.core.domains.reservation import ReservationExpansion, ReservationIn, Reservation
 
 
 class IReservationRepository(ABC):
@@ -15,14 +15,42 @@ class IReservationRepository(ABC):
     """
 
     @abstractmethod
-    async def get_all_reservations(self) -> List[Reservation]:
+    async def get_all_reservations(self, after: int | None = None, limit: int | None = None) -> List[Reservation]:
         """
         Retrieve all reservations from the data storage.
 
+        Without a limit, every reservation is returned ordered by start date; with a limit,
+        the page following the `after` ID, ordered by ID.
+
+        Args:
+            after (int | None, optional): The ID of the last reservation of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of reservations. Defaults to None.
+
         Returns:
             List[Reservation]: A list of all reservations.
         """
 
+    @abstractmethod
+    def iterate_reservations(
+            self,
+            start_date: date | None = None,
+            end_date: date | None = None,
+            guest_id: int | None = None,
+    ) -> AsyncIterator[Reservation]:
+        """
+        Stream the reservations starting in a date range, ordered by start date.
+
+        The rows are read through a server-side cursor, so memory stays constant however many match.
+
+        Args:
+            start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+            end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+            guest_id (int | None, optional): The ID of the guest to restrict the reservations to. Defaults to None.
+
+        Yields:
+            Reservation: The matching reservations.
+        """
+
     @abstractmethod
     async def get_by_id(self, reservation_id: int) -> Reservation | None:
         """
@@ -35,6 +63,38 @@ class IReservationRepository(ABC):
             Reservation | None: The details of the reservation if found, or None if not found.
         """
 
+    @abstractmethod
+    async def get_by_guest_id(self, guest_id: int) -> List[Reservation]:
+        """
+        Retrieve reservations made by the specified guest.
+
+        Args:
+            guest_id (int): The ID of the guest.
+
+        Returns:
+            List[Reservation]: A list of reservations made by the guest.
+        """
+
+    @abstractmethod
+    async def get_many_hydrated(
+            self,
+            reservation_ids: List[int],
+            expand: Collection[ReservationExpansion] = ("guest", "rooms", "bills"),
+    ) -> List[Reservation]:
+        """
+        Retrieve reservations together with their guests, rooms, bills and accessibility options.
+
+        The related data for the whole batch is loaded with a fixed number of set-based
+        queries, regardless of how many reservations are requested.
+
+        Args:
+            reservation_ids (List[int]): The IDs of the reservations.
+            expand (Collection[ReservationExpansion], optional): The related data to load. Defaults to all of it.
+
+        Returns:
+            List[Reservation]: The hydrated reservations, in the order of the given IDs.
+        """
+
     @abstractmethod
     async def get_between_dates(self, start_date: date, end_date: date) -> List[Reservation]:
         """
@@ -42,7 +102,7 @@ class IReservationRepository(ABC):
 
         Args:
             start_date (date): The start date of the range.
-            end_date (date): The end date of the range.
+            end_date (date): The end date of the range, inclusive.
 
         Returns:
             List[Reservation]: A list of reservations made within the date range.
@@ -61,6 +121,44 @@ class IReservationRepository(ABC):
             List[Reservation]: A list of reservations made in the specified month.
         """
 
+    @abstractmethod
+    async def get_by_year(self, year: int) -> List[Reservation]:
+        """
+        Retrieve reservations made during the specified year.
+
+        Args:
+            year (int): The year of the reservations.
+
+        Returns:
+            List[Reservation]: A list of reservations made in the specified year.
+        """
+
+    @abstractmethod
+    async def get_active_between(self, start_date: date, end_date: date) -> List[Reservation]:
+        """
+        Retrieve reservations whose stay overlaps the provided period.
+
+        Args:
+            start_date (date): The first day of the period.
+            end_date (date): The end of the period, exclusive.
+
+        Returns:
+            List[Reservation]: A list of reservations active during the period.
+        """
+
+    @abstractmethod
+    async def get_active_by_month(self, year: int, month_number: int) -> List[Reservation]:
+        """
+        Retrieve reservations whose stay overlaps the specified month.
+
+        Args:
+            year (int): The year of the reservations.
+            month_number (int): The month number (1 for January, 12 for December).
+
+        Returns:
+            List[Reservation]: A list of reservations active during the specified month.
+        """
+
     @abstractmethod
     async def add_reservation(self, data: ReservationIn) -> Reservation | None:
         """
@@ -73,6 +171,25 @@ class IReservationRepository(ABC):
             Reservation | None: The newly added reservation, or None if the operation fails.
         """
 
+    @abstractmethod
+    async def add_reservation_with_rooms(
+            self,
+            data: ReservationIn,
+            room_ids: List[int],
+            pricing_detail_id: int,
+    ) -> Reservation | None:
+        """
+        Add a new reservation together with its rooms and one bill per room per night.
+
+        Args:
+            data (ReservationIn): The details of the new reservation.
+            room_ids (List[int]): The IDs of the rooms to reserve.
+            pricing_detail_id (int): The ID of the pricing detail billed for every night.
+
+        Returns:
+            Reservation | None: The newly added reservation, or None if one of the rooms is already reserved.
+        """
+
     @abstractmethod
     async def update_reservation(self, reservation_id: int, data: ReservationIn) -> Reservation | None:
         """
@@ -83,13 +200,38 @@ class IReservationRepository(ABC):
             data (ReservationIn): The updated details for the reservation.
 
         Returns:
-            Reservation | None: The updated reservation details, or None if the reservation is not found.
+            Reservation | None: The updated reservation details, or None if the reservation is not found
+                or its new dates collide with another stay in one of its rooms.
+        """
+
+    @abstractmethod
+    async def get_ids_by_guest_ids(self, guest_ids: List[int]) -> List[int]:
+        """
+        Retrieve the IDs of the reservations made by the specified guests.
+
+        Args:
+            guest_ids (List[int]): The IDs of the guests.
+
+        Returns:
+            List[int]: The IDs of the guests' reservations.
+        """
+
+    @abstractmethod
+    async def delete_reservations(self, reservation_ids: List[int]) -> List[int]:
+        """
+        Remove reservations along with their invoices, bills and rooms, with one statement per table.
+
+        Args:
+            reservation_ids (List[int]): The IDs of the reservations to remove.
+
+        Returns:
+            List[int]: The IDs of the removed reservations.
         """
 
     @abstractmethod
     async def delete_reservation(self, reservation_id: int) -> bool:
         """
-        Remove a reservation from the data storage.
+        Remove a reservation from the data storage, along with its invoices, bills and rooms.
 
         Args:
             reservation_id (int): The ID of the reservation to remove.
@@ -3,9 +3,11 @@ Module for managing reservation_room repository abstractions.
 """
 
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import List
 
 from hotel_management_system.core.domains.reservation_room import ReservationRoomIn, ReservationRoom
+from hotel_management_system.core.domains.room_occupancy import RoomOccupancy
 
 
 class IReservationRoomRepository(ABC):
@@ -22,6 +24,40 @@ class IReservationRoomRepository(ABC):
             List[ReservationRoom]: A list of all reservation rooms.
         """
 
+    @abstractmethod
+    async def get_all_room_occupancies(self) -> List[RoomOccupancy]:
+        """
+        Retrieve every reserved room together with the dates of its reservation.
+
+        Returns:
+            List[RoomOccupancy]: A list of all room occupancies.
+        """
+
+    @abstractmethod
+    async def get_room_occupancies_by_reservation_ids(self, reservation_ids: List[int]) -> List[RoomOccupancy]:
+        """
+        Retrieve the rooms held by the specified reservations together with their dates.
+
+        Args:
+            reservation_ids (List[int]): The IDs of the reservations.
+
+        Returns:
+            List[RoomOccupancy]: A list of the room occupancies of the reservations.
+        """
+
+    @abstractmethod
+    async def get_occupied_room_ids(self, start_date: date, end_date: date) -> List[int]:
+        """
+        Retrieve the IDs of the rooms held by a reservation overlapping the provided dates.
+
+        Args:
+            start_date (date): The first night of the period.
+            end_date (date): The end of the period, exclusive.
+
+        Returns:
+            List[int]: The IDs of the occupied rooms.
+        """
+
     @abstractmethod
     async def get_by_id(self, room_id: int, reservation_id: int) -> List[ReservationRoom] | None:
         """
@@ -14,10 +14,17 @@ class IRoomRepository(ABC):
     """
 
     @abstractmethod
-    async def get_all_rooms(self) -> List[Room]:
+    async def get_all_rooms(self, after: int | None = None, limit: int | None = None) -> List[Room]:
         """
         Retrieve all rooms from the data storage.
 
+        Without a limit, every room is returned ordered by alias; with a limit,
+        the page following the `after` ID, ordered by ID.
+
+        Args:
+            after (int | None, optional): The ID of the last room of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of rooms. Defaults to None.
+
         Returns:
             List[Room]: A list of all rooms stored in the database.
         """
@@ -34,6 +41,30 @@ class IRoomRepository(ABC):
             Room | None: The room details if found, or None if no room with the given ID exists.
         """
 
+    @abstractmethod
+    async def get_existing_ids(self, room_ids: List[int]) -> List[int]:
+        """
+        Retrieve which of the given room IDs exist, with a single query.
+
+        Args:
+            room_ids (List[int]): The IDs of the rooms.
+
+        Returns:
+            List[int]: The IDs of the existing rooms.
+        """
+
+    @abstractmethod
+    async def get_many_hydrated(self, room_ids: List[int]) -> List[Room]:
+        """
+        Retrieve rooms together with their accessibility options, with a fixed number of queries.
+
+        Args:
+            room_ids (List[int]): The IDs of the rooms.
+
+        Returns:
+            List[Room]: The found rooms.
+        """
+
     @abstractmethod
     async def add_room(self, data: RoomIn) -> Room | None:
         """
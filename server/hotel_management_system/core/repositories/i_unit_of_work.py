@@ -0,0 +1,36 @@
+"""
+Module for managing unit of work abstractions.
+"""
+
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager, Awaitable, Callable
+
+
+class IUnitOfWork(ABC):
+    """
+    Abstract base class defining the interface for a unit of work.
+
+    Every repository write made inside `begin` joins the same database transaction,
+    so a multistep operation commits once or not at all.
+    """
+
+    @abstractmethod
+    def begin(self) -> AsyncContextManager[None]:
+        """
+        Open a unit of work, or a savepoint when one is already open.
+
+        Returns:
+            AsyncContextManager[None]: The context committing on exit and rolling back on an exception.
+        """
+
+    @abstractmethod
+    async def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """
+        Defer a side effect outside the database until the unit of work commits.
+
+        The callback runs immediately when no unit of work is open, and is dropped
+        when the unit of work or its savepoint is rolled back.
+
+        Args:
+            callback (Callable[[], Awaitable[None]]): The coroutine function to run.
+        """
@@ -0,0 +1,52 @@
+"""
+Module for managing analytics service abstractions.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List
+
+from hotel_management_system.core.domains.analytics import LengthOfStayBucket, PerformanceSummary, RoomUtilization
+
+
+class IAnalyticsService(ABC):
+    """A class representing analytics service."""
+
+    @abstractmethod
+    async def get_performance(self, start_date: date, end_date: date) -> PerformanceSummary:
+        """
+        Compute the occupancy rate, ADR and RevPAR of the nights between the provided start and end dates.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+
+        Returns:
+            PerformanceSummary: The indicators of the period.
+        """
+
+    @abstractmethod
+    async def get_length_of_stay(self, start_date: date, end_date: date) -> List[LengthOfStayBucket]:
+        """
+        Count the reserved rooms arriving between the provided start and end dates by the number of nights.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+
+        Returns:
+            List[LengthOfStayBucket]: The non-empty buckets, ordered by the number of nights.
+        """
+
+    @abstractmethod
+    async def get_room_utilization(self, start_date: date, end_date: date) -> List[RoomUtilization]:
+        """
+        Compute the share of the nights between the provided start and end dates each room was sold for.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+
+        Returns:
+            List[RoomUtilization]: The utilization of every room, ordered by room ID.
+        """
@@ -0,0 +1,84 @@
+"""
+Module for managing availability service abstractions.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Iterable, List
+
+# The invalidation bus topic announcing reservations whose rooms or dates changed.
+AVAILABILITY_TOPIC = "availability"
+
+
+class IAvailabilityService(ABC):
+    """A class representing the in-memory room availability index."""
+
+    @abstractmethod
+    async def load(self) -> None:
+        """
+        Rebuild the availability index from the data storage.
+        """
+
+    @abstractmethod
+    async def reload_reservations(self, reservation_ids: List[int] | None = None) -> None:
+        """
+        Reload the stays of the specified reservations, changed by another worker, from the data storage.
+
+        Args:
+            reservation_ids (List[int] | None, optional): The IDs of the reservations.
+                Defaults to None, rebuilding the whole index.
+        """
+
+    @abstractmethod
+    async def set_reservation(self, reservation_id: int, start_date: date, end_date: date) -> None:
+        """
+        Register a reservation's stay or move it to new dates.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+            start_date (date): The first night of the stay.
+            end_date (date): The departure date, exclusive.
+        """
+
+    @abstractmethod
+    async def remove_reservation(self, reservation_id: int) -> None:
+        """
+        Release every room held by a reservation.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+        """
+
+    @abstractmethod
+    async def add_room(self, reservation_id: int, room_id: int) -> None:
+        """
+        Mark a room as held by a reservation.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+            room_id (int): The ID of the room.
+        """
+
+    @abstractmethod
+    async def remove_room(self, reservation_id: int, room_id: int) -> None:
+        """
+        Release a room held by a reservation.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+            room_id (int): The ID of the room.
+        """
+
+    @abstractmethod
+    async def get_free_room_ids(self, room_ids: Iterable[int], start_date: date, end_date: date) -> List[int]:
+        """
+        Filter the rooms that have no stay overlapping [start_date, end_date).
+
+        Args:
+            room_ids (Iterable[int]): The IDs of the candidate rooms.
+            start_date (date): The first night of the period.
+            end_date (date): The end of the period, exclusive.
+
+        Returns:
+            List[int]: The IDs of the free rooms, in the order they were given.
+        """
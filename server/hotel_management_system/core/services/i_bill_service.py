@@ -3,19 +3,30 @@ Module for managing bill service abstractions.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Collection, List
 
-from hotel_management_system.core.domains.bill import Bill, BillIn
+from hotel_management_system.core.domains.bill import Bill, BillExpansion, BillIn
 
 
 class IBillService(ABC):
     """A class representing bill repository."""
 
     @abstractmethod
-    async def get_all(self) -> List[Bill]:
+    async def get_all(
+            self,
+            after: int | None = None,
+            limit: int | None = None,
+            expand: Collection[BillExpansion] = ("pricing_detail",),
+    ) -> List[Bill]:
         """
         Retrieve all bills from the data storage.
 
+        Args:
+            after (int | None, optional): The reservation ID of the last bills of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of reservations whose bills are returned.
+                Defaults to None, meaning all of them.
+            expand (Collection[BillExpansion], optional): The nested data to include. Defaults to all of it.
+
         Returns:
             List[Bill]: A list of all bills in the data storage.
         """
@@ -0,0 +1,76 @@
+"""
+Module for managing export service abstractions.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import AsyncIterator
+
+from hotel_management_system.core.domains.export import ExportFormat
+
+
+class IExportService(ABC):
+    """A class representing export service."""
+
+    @abstractmethod
+    def export_reservations(
+            self,
+            export_format: ExportFormat,
+            start_date: date | None = None,
+            end_date: date | None = None,
+            guest_id: int | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Encode the reservations starting in a date range, chunk by chunk, as they are read.
+
+        Args:
+            export_format (ExportFormat): The format of the export.
+            start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+            end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+            guest_id (int | None, optional): The ID of the guest to restrict the reservations to. Defaults to None.
+
+        Yields:
+            str: The next chunk of the export.
+        """
+
+    @abstractmethod
+    def export_bills(
+            self,
+            export_format: ExportFormat,
+            start_date: date | None = None,
+            end_date: date | None = None,
+            guest_id: int | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Encode the bills of the reservations starting in a date range, chunk by chunk, as they are read.
+
+        Args:
+            export_format (ExportFormat): The format of the export.
+            start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+            end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+            guest_id (int | None, optional): The ID of the guest to restrict the bills to. Defaults to None.
+
+        Yields:
+            str: The next chunk of the export.
+        """
+
+    @abstractmethod
+    def export_invoices(
+            self,
+            export_format: ExportFormat,
+            start_date: date | None = None,
+            end_date: date | None = None,
+            guest_id: int | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Encode the invoices issued in a date range, chunk by chunk, as they are read.
+
+        Args:
+            export_format (ExportFormat): The format of the export.
+            start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+            end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+            guest_id (int | None, optional): The ID of the guest to restrict the invoices to. Defaults to None.
+
+        Yields:
+            str: The next chunk of the export.
+        """
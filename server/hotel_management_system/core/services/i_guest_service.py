@@ -3,19 +3,29 @@ Module for managing guest service abstractions.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Collection, List
 
-from hotel_management_system.core.domains.guest import Guest, GuestIn
+from hotel_management_system.core.domains.guest import Guest, GuestExpansion, GuestIn, GuestSearchMode
 
 
 class IGuestService(ABC):
     """A class representing guest repository."""
 
     @abstractmethod
-    async def get_all(self) -> List[Guest]:
+    async def get_all(
+            self,
+            after: int | None = None,
+            limit: int | None = None,
+            expand: Collection[GuestExpansion] = ("accessibility_options",),
+    ) -> List[Guest]:
         """
         Retrieve all guests from the data storage.
 
+        Args:
+            after (int | None, optional): The ID of the last guest of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of guests. Defaults to None, meaning all of them.
+            expand (Collection[GuestExpansion], optional): The nested data to include. Defaults to all of it.
+
         Returns:
             List[Guest]: A list of all guests.
         """
@@ -57,15 +67,17 @@ class IGuestService(ABC):
         """
 
     @abstractmethod
-    async def get_by_needle_in_name(self, needle: str) -> List[Guest] | None:
+    async def search(self, needle: str, mode: GuestSearchMode = "similar", limit: int = 20) -> List[Guest]:
         """
-        Search for guests whose names contain a specific substring.
+        Search for guests by their name, email, phone number or city, best matches first.
 
         Args:
-            needle (str): A substring to search for within guest names.
+            needle (str): The text to search for.
+            mode (GuestSearchMode, optional): Whether to match similar words or word prefixes. Defaults to "similar".
+            limit (int, optional): The maximum number of guests. Defaults to 20.
 
         Returns:
-            List[Guest] | None: A list of guests whose names contain the substring, or None if no match is found.
+            List[Guest]: The matching guests, ordered by their similarity to the needle.
         """
 
     @abstractmethod
@@ -93,6 +105,20 @@ class IGuestService(ABC):
             Guest | None: The updated guest details, or None if the guest is not found.
         """
 
+    @abstractmethod
+    async def delete_guests(self, guest_ids: List[int]) -> List[int]:
+        """
+        Remove guests along with their accessibility options, with one statement per table.
+
+        The guests must no longer have reservations.
+
+        Args:
+            guest_ids (List[int]): The IDs of the guests to remove.
+
+        Returns:
+            List[int]: The IDs of the removed guests.
+        """
+
     @abstractmethod
     async def delete_guest(self, guest_id: int) -> bool:
         """
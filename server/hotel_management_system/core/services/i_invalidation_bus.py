@@ -0,0 +1,50 @@
+"""
+Module for managing invalidation bus abstractions.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable
+
+
+class IInvalidationBus(ABC):
+    """
+    Abstract base class defining the interface for the bus spreading change events between workers.
+
+    A change event names a topic, e.g. a cache, and optionally the affected key. Every worker
+    evicts the in-process state of the topic, so its next read goes to the data storage.
+    """
+
+    @abstractmethod
+    def subscribe(self, topic: str, handler: Callable[[Any], Awaitable[None]]) -> None:
+        """
+        Register a handler evicting the in-process state of a topic.
+
+        Args:
+            topic (str): The topic to handle.
+            handler (Callable[[Any], Awaitable[None]]): The coroutine function called with
+                the affected key, or with None when the whole state has to be evicted.
+        """
+
+    @abstractmethod
+    async def publish(self, topic: str, key: Any = None) -> None:
+        """
+        Announce a change to the other workers once the current transaction commits.
+
+        The event is dropped when the transaction is rolled back.
+
+        Args:
+            topic (str): The topic of the change.
+            key (Any, optional): The JSON-serializable affected key. Defaults to None, meaning everything.
+        """
+
+    @abstractmethod
+    async def start(self) -> None:
+        """
+        Start receiving the change events of the other workers.
+        """
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """
+        Stop receiving the change events.
+        """
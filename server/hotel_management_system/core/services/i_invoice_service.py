@@ -3,19 +3,29 @@ Module for managing invoice service abstractions.
 """
 
 from abc import ABC, abstractmethod
-from typing import Iterable, List
+from typing import Collection, Iterable, List
 
-from hotel_management_system.core.domains.invoice import Invoice, InvoiceIn
+from hotel_management_system.core.domains.invoice import Invoice, InvoiceExpansion, InvoiceIn
 
 
 class IInvoiceService(ABC):
     """A class representing invoice repository."""
 
     @abstractmethod
-    async def get_all(self) -> List[Invoice]:
+    async def get_all(
+            self,
+            after: int | None = None,
+            limit: int | None = None,
+            expand: Collection[InvoiceExpansion] = ("reservation",),
+    ) -> List[Invoice]:
         """
         Retrieve all invoices from the data storage.
 
+        Args:
+            after (int | None, optional): The ID of the last invoice of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of invoices. Defaults to None, meaning all of them.
+            expand (Collection[InvoiceExpansion], optional): The nested data to include. Defaults to all of it.
+
         Returns:
             List[Invoice]: A list of all invoices.
         """
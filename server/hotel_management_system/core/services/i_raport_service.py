@@ -0,0 +1,64 @@
+"""
+Module for managing raport service abstractions.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict
+
+from hotel_management_system.core.domains.raport import Raport, RaportGranularity
+
+
+class IRaportService(ABC):
+    """A class representing raport service."""
+
+    @abstractmethod
+    async def get_between_dates(self, start_date: date, end_date: date) -> Raport:
+        """
+        Summarize the reservations starting between the provided start and end dates.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+
+        Returns:
+            Raport: The summary of the reservations.
+        """
+
+    @abstractmethod
+    async def get_by_month(self, year: int, month_number: int) -> Raport:
+        """
+        Summarize the reservations starting during the specified month.
+
+        Args:
+            year (int): The year of the reservations.
+            month_number (int): The month number (1 for January, 12 for December).
+
+        Returns:
+            Raport: The summary of the reservations.
+        """
+
+    @abstractmethod
+    async def get_by_year(self, year: int) -> Raport:
+        """
+        Summarize the reservations starting during the specified year.
+
+        Args:
+            year (int): The year of the reservations.
+
+        Returns:
+            Raport: The summary of the reservations.
+        """
+
+    @abstractmethod
+    async def get_breakdown_by_year(self, year: int, granularity: RaportGranularity) -> Dict[date, Raport]:
+        """
+        Summarize the reservations starting during the specified year, per day, week or month.
+
+        Args:
+            year (int): The year of the reservations.
+            granularity (RaportGranularity): The length of a single period.
+
+        Returns:
+            Dict[date, Raport]: The summaries keyed by the first day of their period, including empty periods.
+        """
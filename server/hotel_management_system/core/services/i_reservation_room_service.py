@@ -3,6 +3,7 @@ Module for managing reservation_room service abstractions.
 """
 
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import Iterable, List
 
 from hotel_management_system.core.domains.reservation_room import ReservationRoom, ReservationRoomIn
@@ -20,6 +21,19 @@ class IReservationRoomService(ABC):
             List[ReservationRoom]: A list of all reservation rooms.
         """
 
+    @abstractmethod
+    async def get_occupied_room_ids(self, start_date: date, end_date: date) -> List[int]:
+        """
+        Retrieve the IDs of the rooms held by a reservation overlapping the provided dates.
+
+        Args:
+            start_date (date): The first night of the period.
+            end_date (date): The end of the period, exclusive.
+
+        Returns:
+            List[int]: The IDs of the occupied rooms.
+        """
+
     @abstractmethod
     async def get_by_id(self, room_id: int, reservation_id: int) -> List[ReservationRoom] | None:
         """
@@ -4,9 +4,9 @@ Module for managing reservation service abstractions.
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Iterable, List
+from typing import Collection, Iterable, List
 
-from hotel_management_system.core.domains.reservation import Reservation, ReservationIn
+from hotel_management_system.core.domains.reservation import Reservation, ReservationExpansion, ReservationIn
 from hotel_management_system.core.domains.room import Room
 
 
@@ -14,10 +14,22 @@ class IReservationService(ABC):
     """A class representing reservation repository."""
 
     @abstractmethod
-    async def get_all(self) -> List[Reservation]:
+    async def get_all(
+            self,
+            after: int | None = None,
+            limit: int | None = None,
+            expand: Collection[ReservationExpansion] = ("guest", "rooms", "bills"),
+    ) -> List[Reservation]:
         """
         Retrieve all reservations from the data storage.
 
+        Only the requested nested data is loaded, with a fixed number of queries.
+
+        Args:
+            after (int | None, optional): The ID of the last reservation of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of reservations. Defaults to None, meaning all of them.
+            expand (Collection[ReservationExpansion], optional): The nested data to include. Defaults to all of it.
+
         Returns:
             List[Reservation]: A list of all reservations.
         """
@@ -34,6 +46,18 @@ class IReservationService(ABC):
             Reservation | None: The details of the reservation if found, or None if not found.
         """
 
+    @abstractmethod
+    async def get_by_ids(self, reservation_ids: Iterable[int]) -> List[Reservation | None]:
+        """
+        Retrieve the reservations of several unique IDs.
+
+        Args:
+            reservation_ids (Iterable[int]): The IDs of the reservations.
+
+        Returns:
+            List[Reservation | None]: The reservations in the order of the IDs, with None for the missing ones.
+        """
+
     @abstractmethod
     async def get_by_guest_id(self, guest_id: int) -> List[Reservation] | None:
         """
@@ -49,11 +73,11 @@ class IReservationService(ABC):
     @abstractmethod
     async def get_free_rooms(self, start_date: date, end_date: date) -> List[Room]:
         """
-        Retrieve rooms that are not reserved within the provided start and end dates.
+        Retrieve rooms that have no stay overlapping the provided start and end dates.
 
         Args:
             start_date (date): The start date of the range.
-            end_date (date): The end date of the range.
+            end_date (date): The end date of the range, exclusive.
 
         Returns:
             List[Room]: A list of free rooms within the date range.
@@ -66,7 +90,7 @@ class IReservationService(ABC):
 
         Args:
             start_date (date): The start date of the range.
-            end_date (date): The end date of the range.
+            end_date (date): The end date of the range, inclusive.
 
         Returns:
             List[Reservation]: A list of reservations made within the date range.
@@ -94,7 +118,33 @@ class IReservationService(ABC):
             year (int): The year of the reservations.
 
         Returns:
-            ist[Reservation]: A list of reservations made in the specified year.
+            List[Reservation]: A list of reservations made in the specified year.
+        """
+
+    @abstractmethod
+    async def get_active_between(self, start_date: date, end_date: date) -> List[Reservation]:
+        """
+        Retrieve reservations whose stay overlaps the provided period.
+
+        Args:
+            start_date (date): The first day of the period.
+            end_date (date): The end of the period, exclusive.
+
+        Returns:
+            List[Reservation]: A list of reservations active during the period.
+        """
+
+    @abstractmethod
+    async def get_active_by_month(self, year: int, month_number: int) -> List[Reservation]:
+        """
+        Retrieve reservations whose stay overlaps the specified month.
+
+        Args:
+            year (int): The year of the reservations.
+            month_number (int): The month number (1 for January, 12 for December).
+
+        Returns:
+            List[Reservation]: A list of reservations active during the specified month.
         """
 
     @abstractmethod
@@ -109,6 +159,25 @@ class IReservationService(ABC):
             Reservation | None: The newly added reservation, or None if the operation fails.
         """
 
+    @abstractmethod
+    async def add_reservation_with_rooms(
+            self,
+            data: ReservationIn,
+            room_ids: List[int],
+            pricing_detail_id: int,
+    ) -> Reservation | None:
+        """
+        Add a new reservation together with its rooms and one bill per room per night.
+
+        Args:
+            data (ReservationIn): The details of the new reservation.
+            room_ids (List[int]): The IDs of the rooms to reserve.
+            pricing_detail_id (int): The ID of the pricing detail billed for every night.
+
+        Returns:
+            Reservation | None: The newly added reservation, or None if one of the rooms is already reserved.
+        """
+
     @abstractmethod
     async def update_reservation(self, reservation_id: int, data: ReservationIn) -> Reservation | None:
         """
@@ -122,10 +191,34 @@ class IReservationService(ABC):
             Reservation | None: The updated reservation details, or None if the reservation is not found.
         """
 
+    @abstractmethod
+    async def delete_reservations(self, reservation_ids: List[int]) -> List[int]:
+        """
+        Remove reservations along with their invoices, bills and rooms, with one statement per table.
+
+        Args:
+            reservation_ids (List[int]): The IDs of the reservations to remove.
+
+        Returns:
+            List[int]: The IDs of the removed reservations.
+        """
+
+    @abstractmethod
+    async def delete_by_guest_ids(self, guest_ids: List[int]) -> List[int]:
+        """
+        Remove all reservations made by the specified guests, along with their invoices, bills and rooms.
+
+        Args:
+            guest_ids (List[int]): The IDs of the guests.
+
+        Returns:
+            List[int]: The IDs of the removed reservations.
+        """
+
     @abstractmethod
     async def delete_reservation(self, reservation_id: int) -> bool:
         """
-        Remove a reservation from the data storage.
+        Remove a reservation from the data storage, along with its invoices, bills and rooms.
 
         Args:
             reservation_id (int): The ID of the reservation to remove.
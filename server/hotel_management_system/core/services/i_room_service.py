@@ -4,19 +4,29 @@ Module for managing room service abstractions.
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Iterable, List
+from typing import Collection, Iterable, List
 
-from hotel_management_system.core.domains.room import Room, RoomIn
+from hotel_management_system.core.domains.room import Room, RoomExpansion, RoomIn
 
 
 class IRoomService(ABC):
     """A class representing room repository."""
 
     @abstractmethod
-    async def get_all(self) -> List[Room]:
+    async def get_all(
+            self,
+            after: int | None = None,
+            limit: int | None = None,
+            expand: Collection[RoomExpansion] = ("accessibility_options",),
+    ) -> List[Room]:
         """
         Retrieve all rooms from the data storage.
 
+        Args:
+            after (int | None, optional): The ID of the last room of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of rooms. Defaults to None, meaning all of them.
+            expand (Collection[RoomExpansion], optional): The nested data to include. Defaults to all of it.
+
         Returns:
             List[Room]: A list of all rooms stored in the database.
         """
@@ -33,6 +43,18 @@ class IRoomService(ABC):
             Room | None: The room details if found, or None if no room with the given ID exists.
         """
 
+    @abstractmethod
+    async def get_existing_ids(self, room_ids: List[int]) -> List[int]:
+        """
+        Retrieve which of the given room IDs exist, with a single query.
+
+        Args:
+            room_ids (List[int]): The IDs of the rooms.
+
+        Returns:
+            List[int]: The IDs of the existing rooms.
+        """
+
     @abstractmethod
     async def add_room(self, data: RoomIn) -> Room | None:
         """
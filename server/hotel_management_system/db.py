@@ -1,18 +1,16 @@
 """A module providing database access."""
 
-import asyncio
+from typing import Iterable
 
-import databases
 import sqlalchemy
-from sqlalchemy.exc import OperationalError, DatabaseError
+from sqlalchemy.dialects.postgresql import ARRAY, DATERANGE, ExcludeConstraint
 from sqlalchemy.ext.asyncio import create_async_engine
-from asyncpg.exceptions import (    # type: ignore
-    CannotConnectNowError,
-    ConnectionDoesNotExistError,
-)
 
 from hotel_management_system.config import config
+from hotel_management_system.pool import Database
 
+# The tables mirror the schema built by the migrations in `hotel_management_system.migrations`.
+# A change here needs a new migration version as well.
 metadata = sqlalchemy.MetaData()
 
 guests_table = sqlalchemy.Table(
@@ -27,8 +25,28 @@ guests_table = sqlalchemy.Table(
     sqlalchemy.Column("zip_code", sqlalchemy.String),
     sqlalchemy.Column("phone_number", sqlalchemy.String),
     sqlalchemy.Column("email", sqlalchemy.String),
+    sqlalchemy.Index("ix_guests_first_name", "first_name"),
+    sqlalchemy.Index("ix_guests_last_name_first_name", "last_name", "first_name"),
+)
+
+# The lowercased searchable fields of a guest, separated by spaces. Only immutable operators
+# are used, so the GIN trigram index serving the guest search can be built on it.
+_space = sqlalchemy.literal_column("' '", sqlalchemy.String)
+guest_search_text = sqlalchemy.func.lower(
+    sqlalchemy.func.coalesce(guests_table.c.first_name, sqlalchemy.literal_column("''", sqlalchemy.String))
+    + _space + sqlalchemy.func.coalesce(guests_table.c.last_name, sqlalchemy.literal_column("''", sqlalchemy.String))
+    + _space + sqlalchemy.func.coalesce(guests_table.c.email, sqlalchemy.literal_column("''", sqlalchemy.String))
+    + _space + sqlalchemy.func.coalesce(guests_table.c.phone_number, sqlalchemy.literal_column("''", sqlalchemy.String))
+    + _space + sqlalchemy.func.coalesce(guests_table.c.city, sqlalchemy.literal_column("''", sqlalchemy.String))
 )
 
+guests_table.append_constraint(sqlalchemy.Index(
+    "ix_guests_search_text",
+    guest_search_text.label("search_text"),
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+))
+
 rooms_table = sqlalchemy.Table(
     "rooms",
     metadata,
@@ -40,45 +58,67 @@ accessibility_options_table = sqlalchemy.Table(
     "accessibility_options",
     metadata,
     sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
-    sqlalchemy.Column("name", sqlalchemy.String),
+    sqlalchemy.Column("name", sqlalchemy.String, index=True),
 )
 
 rooms_accessibility_options_table = sqlalchemy.Table(
     "rooms_accessibility_options_table",
     metadata,
-    sqlalchemy.Column("room_id", sqlalchemy.ForeignKey("rooms.id"), nullable=False),
-    sqlalchemy.Column("accessibility_option_id", sqlalchemy.ForeignKey("accessibility_options.id"), nullable=False),
+    sqlalchemy.Column("room_id", sqlalchemy.ForeignKey("rooms.id"), primary_key=True),
+    sqlalchemy.Column("accessibility_option_id", sqlalchemy.ForeignKey("accessibility_options.id"), primary_key=True,
+                      index=True),
 )
 
 guests_accessibility_options_table = sqlalchemy.Table(
     "guests_accessibility_options_table",
     metadata,
-    sqlalchemy.Column("guest_id", sqlalchemy.ForeignKey("guests.id"), nullable=False),
-    sqlalchemy.Column("accessibility_option_id", sqlalchemy.ForeignKey("accessibility_options.id"), nullable=False),
+    sqlalchemy.Column("guest_id", sqlalchemy.ForeignKey("guests.id"), primary_key=True),
+    sqlalchemy.Column("accessibility_option_id", sqlalchemy.ForeignKey("accessibility_options.id"), primary_key=True,
+                      index=True),
 )
 
 reservations_table = sqlalchemy.Table(
     "reservations",
     metadata,
     sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
-    sqlalchemy.Column("guest_id", sqlalchemy.ForeignKey("guests.id"), nullable=False),
+    sqlalchemy.Column("guest_id", sqlalchemy.ForeignKey("guests.id"), nullable=False, index=True),
     sqlalchemy.Column("start_date", sqlalchemy.Date),
     sqlalchemy.Column("end_date", sqlalchemy.Date),
-    sqlalchemy.Column("number_of_guests", sqlalchemy.Integer)
+    sqlalchemy.Column("number_of_guests", sqlalchemy.Integer),
+    sqlalchemy.Index("ix_reservations_start_date_end_date", "start_date", "end_date"),
 )
 
+# The stay of a reservation as a range, matched by the GiST index serving overlap queries.
+reservation_stay = sqlalchemy.func.daterange(reservations_table.c.start_date, reservations_table.c.end_date)
+
+sqlalchemy.Index("ix_reservations_stay", reservation_stay, postgresql_using="gist")
+
 reservation_rooms_table = sqlalchemy.Table(
     "reservation_rooms",
     metadata,
-    sqlalchemy.Column("reservation_id", sqlalchemy.ForeignKey("reservations.id"), nullable=False),
-    sqlalchemy.Column("room_id", sqlalchemy.ForeignKey("rooms.id"), nullable=False),
+    sqlalchemy.Column("reservation_id", sqlalchemy.ForeignKey("reservations.id"), primary_key=True),
+    sqlalchemy.Column("room_id", sqlalchemy.ForeignKey("rooms.id"), primary_key=True, index=True),
+)
+
+room_occupancy_table = sqlalchemy.Table(
+    "room_occupancy",
+    metadata,
+    sqlalchemy.Column("reservation_id", sqlalchemy.ForeignKey("reservations.id"), primary_key=True),
+    sqlalchemy.Column("room_id", sqlalchemy.ForeignKey("rooms.id"), primary_key=True),
+    sqlalchemy.Column("stay", DATERANGE, nullable=False),
+    ExcludeConstraint(
+        ("room_id", "="),
+        ("stay", "&&"),
+        name="room_occupancy_no_overlap",
+        using="gist",
+    ),
 )
 
 pricing_details_table = sqlalchemy.Table(
     "pricing_details",
     metadata,
     sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
-    sqlalchemy.Column("name", sqlalchemy.String),
+    sqlalchemy.Column("name", sqlalchemy.String, index=True),
     sqlalchemy.Column("price", sqlalchemy.Float),
 )
 
@@ -86,8 +126,26 @@ bills_table = sqlalchemy.Table(
     "bills",
     metadata,
     sqlalchemy.Column("room_id", sqlalchemy.ForeignKey("rooms.id"), nullable=False),
-    sqlalchemy.Column("pricing_detail_id", sqlalchemy.ForeignKey("pricing_details.id"), nullable=False),
-    sqlalchemy.Column("reservation_id", sqlalchemy.ForeignKey("reservations.id"), nullable=False),
+    sqlalchemy.Column("pricing_detail_id", sqlalchemy.ForeignKey("pricing_details.id"), nullable=False, index=True),
+    sqlalchemy.Column("reservation_id", sqlalchemy.ForeignKey("reservations.id"), nullable=False, index=True),
+    sqlalchemy.Index("ix_bills_room_id_pricing_detail_id", "room_id", "pricing_detail_id"),
+)
+
+daily_stats_table = sqlalchemy.Table(
+    "daily_stats",
+    metadata,
+    sqlalchemy.Column("date", sqlalchemy.Date, primary_key=True),
+    sqlalchemy.Column("reserved_rooms_count", sqlalchemy.Integer, nullable=False, server_default="0"),
+    sqlalchemy.Column("total_guests_count", sqlalchemy.Integer, nullable=False, server_default="0"),
+    sqlalchemy.Column("total_guests_with_accessibilities_count", sqlalchemy.Integer, nullable=False, server_default="0"),
+)
+
+daily_revenue_table = sqlalchemy.Table(
+    "daily_revenue",
+    metadata,
+    sqlalchemy.Column("date", sqlalchemy.Date, primary_key=True),
+    sqlalchemy.Column("pricing_detail_id", sqlalchemy.ForeignKey("pricing_details.id"), primary_key=True),
+    sqlalchemy.Column("total_income", sqlalchemy.Float, nullable=False, server_default="0"),
 )
 
 invoices_table = sqlalchemy.Table(
@@ -99,45 +157,84 @@ invoices_table = sqlalchemy.Table(
     sqlalchemy.Column("last_name", sqlalchemy.String),
     sqlalchemy.Column("address", sqlalchemy.String),
     sqlalchemy.Column("nip", sqlalchemy.String),
-    sqlalchemy.Column("reservation_id", sqlalchemy.ForeignKey("reservations.id"), nullable=False),
+    sqlalchemy.Column("reservation_id", sqlalchemy.ForeignKey("reservations.id"), nullable=False, index=True),
 )
 
-db_uri = (
-    f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
+db_dsn = (
+    f"postgresql://{config.DB_USER}:{config.DB_PASSWORD}"
     f"@{config.DB_HOST}/{config.DB_NAME}"
 )
 
+db_uri = db_dsn.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+replica_uri = (
+    f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
+    f"@{config.DB_REPLICA_HOST}/{config.DB_NAME}"
+) if config.DB_REPLICA_HOST else None
+
+# The engine runs the migrations only, so its statements are not cut short by the statement timeout.
 engine = create_async_engine(
     db_uri,
-    echo=True,
+    echo=config.DB_ECHO,
     future=True,
     pool_pre_ping=True,
+    connect_args={"statement_cache_size": config.DB_STATEMENT_CACHE_SIZE},
 )
 
-database = databases.Database(
+database = Database(
     db_uri,
-    force_rollback=True,
+    replica_url=replica_uri,
+    read_your_writes_window=config.DB_READ_YOUR_WRITES_WINDOW,
+    min_size=config.DB_POOL_MIN_SIZE,
+    max_size=config.DB_POOL_MAX_SIZE,
+    statement_cache_size=config.DB_STATEMENT_CACHE_SIZE,
+    max_inactive_connection_lifetime=config.DB_CONNECTION_MAX_IDLE_TIME,
+    max_queries=config.DB_CONNECTION_MAX_QUERIES,
+    server_settings={"statement_timeout": str(int(config.DB_STATEMENT_TIMEOUT * 1000))},
 )
 
 
-async def init_db(retries: int = 5, delay: int = 5) -> None:
-    """Function initializing the DB.
+def in_array(column: sqlalchemy.Column, values: Iterable[int]) -> sqlalchemy.ColumnElement:
+    """Function building a `column = ANY(:values)` predicate.
+
+    Unlike `column.in_(values)`, the values are sent as a single array parameter,
+    so the statement text stays the same for any number of values.
+
+    Args:
+        column (sqlalchemy.Column): The integer column to filter on.
+        values (Iterable[int]): The accepted values.
+
+    Returns:
+        sqlalchemy.ColumnElement: The filtering predicate.
+    """
+    return column == sqlalchemy.any_(sqlalchemy.literal(list(values), ARRAY(sqlalchemy.Integer)))
+
+
+def keyset_page(
+        query: sqlalchemy.Select,
+        key: sqlalchemy.Column,
+        after: int | None,
+        limit: int | None,
+) -> sqlalchemy.Select:
+    """Function restricting a query to the page of rows following a key.
+
+    The page is read in key order through the index of the key, so its cost
+    does not depend on how many pages precede it. Without a limit the query
+    is returned unchanged.
 
     Args:
-        retries (int, optional): Number of retries of connect to DB.
-            Defaults to 5.
-        delay (int, optional): Delay of connect do DB. Defaults to 2.
+        query (sqlalchemy.Select): The query listing the rows.
+        key (sqlalchemy.Column): The unique integer column the rows are paged by.
+        after (int | None): The key of the last row of the previous page, or None for the first page.
+        limit (int | None): The maximum number of rows, or None for every row.
+
+    Returns:
+        sqlalchemy.Select: The query selecting the page.
     """
-    for attempt in range(retries):
-        try:
-            async with engine.begin() as conn:
-                await conn.run_sync(metadata.create_all)
-            return
-        except (
-                OperationalError,
-                DatabaseError,
-                CannotConnectNowError,
-                ConnectionDoesNotExistError,
-        ) as e:
-            print(f"Attempt {attempt + 1} failed: {e}")
-            await asyncio.sleep(delay)
+    if limit is None:
+        return query
+
+    if after is not None:
+        query = query.where(key > after)
+
+    return query.order_by(None).order_by(key).limit(limit)
@@ -83,8 +83,9 @@ class AccessibilityOptionRepository(IAccessibilityOptionRepository):
             accessibility_options_table.select()
             .where(accessibility_options_table.c.name == accessibility_option_name)
         )
+        accessibility_option = await database.fetch_one(query)
 
-        return await database.fetch_one(query)
+        return AccessibilityOption.from_record(accessibility_option) if accessibility_option else None
 
     async def update_accessibility_option(
             self,
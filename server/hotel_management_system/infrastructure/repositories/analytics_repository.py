@@ -0,0 +1,97 @@
+"""
+Module containing analytics repository implementation.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy import Float, cast, func, literal, select
+
+from hotel_management_system.core.domains.analytics import EPOCH, RoomStays
+from hotel_management_system.core.repositories.i_analytics_repository import IAnalyticsRepository
+from hotel_management_system.db import (
+    bills_table,
+    pricing_details_table,
+    reservation_rooms_table,
+    reservations_table,
+    reservation_stay,
+    rooms_table,
+    database,
+)
+
+
+class AnalyticsRepository(IAnalyticsRepository):
+    """
+    A class representing analytics DB repository.
+
+    The rows are returned as NumPy columns, so the figures can be computed over
+    the whole period at once instead of one reservation at a time.
+    """
+
+    async def get_room_stays(self, start_date: date, end_date: date) -> RoomStays:
+        """
+        Retrieve the reserved rooms whose stay overlaps the provided period, with their share of the revenue,
+        along with the IDs of all the rooms.
+
+        The bills are summed per reserved room, and the stays are joined to all the rooms,
+        so a single fetch returns one row per reserved room however many nights were
+        billed, plus an empty row for every room without a stay in the period.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+
+        Returns:
+            RoomStays: The columns of the reserved rooms, and the room IDs.
+        """
+
+        overlaps = reservation_stay.op("&&")(func.daterange(start_date, end_date + timedelta(days=1)))
+        room_revenue = (
+            select(
+                bills_table.c.reservation_id,
+                bills_table.c.room_id,
+                func.sum(pricing_details_table.c.price).label("revenue"),
+            )
+            .select_from(bills_table.join(pricing_details_table).join(reservations_table))
+            .where(overlaps)
+            .group_by(bills_table.c.reservation_id, bills_table.c.room_id)
+            .subquery()
+        )
+        stays = (
+            select(
+                reservation_rooms_table.c.room_id,
+                (reservations_table.c.start_date - literal(EPOCH)).label("start_day"),
+                (reservations_table.c.end_date - literal(EPOCH)).label("end_day"),
+                cast(func.coalesce(room_revenue.c.revenue, 0), Float).label("revenue"),
+            )
+            .select_from(
+                reservation_rooms_table
+                .join(reservations_table)
+                .outerjoin(
+                    room_revenue,
+                    (room_revenue.c.reservation_id == reservation_rooms_table.c.reservation_id)
+                    & (room_revenue.c.room_id == reservation_rooms_table.c.room_id),
+                )
+            )
+            .where(overlaps)
+            .subquery()
+        )
+        query = (
+            select(rooms_table.c.id, stays.c.start_day, stays.c.end_day, stays.c.revenue)
+            .select_from(rooms_table.outerjoin(stays, stays.c.room_id == rooms_table.c.id))
+            .order_by(rooms_table.c.id)
+        )
+        records = await database.fetch_all(query)
+
+        # The empty rows of the rooms without a stay read as NaN, which marks them apart from the stays.
+        columns = np.array([tuple(record.values()) for record in records], dtype=np.float64).reshape(-1, 4).T
+        has_stay = ~np.isnan(columns[1])
+        room_ids = columns[0].astype(np.int64)
+
+        return RoomStays(
+            room_id=room_ids[has_stay],
+            start_day=columns[1][has_stay].astype(np.int64),
+            end_day=columns[2][has_stay].astype(np.int64),
+            revenue=columns[3][has_stay],
+            room_ids=np.unique(room_ids),
+        )
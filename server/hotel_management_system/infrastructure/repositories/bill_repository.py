@@ -2,16 +2,35 @@
 Module containing bill repository implementation.
 """
 
-from typing import Any, Iterable, List
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Iterable, List
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, and_
 
 from hotel_management_system.core.repositories.i_bill_repository import IBillRepository
 from hotel_management_system.core.domains.bill import Bill, BillIn
+from hotel_management_system.core.domains.pricing_detail import PricingDetail
 from hotel_management_system.db import (
     bills_table,
+    pricing_details_table,
+    reservations_table,
     database,
+    keyset_page,
+)
+from hotel_management_system.pool import CompiledQuery
+
+BILLS_BY_ROOM_ID = CompiledQuery(
+    select(bills_table)
+    .where(bills_table.c.room_id == bindparam("room_id"))
+)
+BILLS_BY_PRICING_DETAIL_ID = CompiledQuery(
+    select(bills_table)
+    .where(bills_table.c.pricing_detail_id == bindparam("pricing_detail_id"))
+)
+BILLS_BY_RESERVATION_ID = CompiledQuery(
+    select(bills_table)
+    .where(bills_table.c.reservation_id == bindparam("reservation_id"))
 )
 
 
@@ -20,10 +39,18 @@ class BillRepository(IBillRepository):
     A class representing bill DB repository.
     """
 
-    async def get_all_bills(self) -> Iterable[Any]:
+    async def get_all_bills(self, after: int | None = None, limit: int | None = None) -> Iterable[Any]:
         """
         Retrieve all bills from the data storage.
 
+        Bills have no ID of their own, so they are paged by reservation: with a limit,
+        the bills of at most `limit` reservations following the `after` reservation ID
+        are returned, ordered by reservation ID.
+
+        Args:
+            after (int | None, optional): The reservation ID of the last bills of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of reservations. Defaults to None.
+
         Returns:
             List[Bill]: A list of all bills in the data storage.
         """
@@ -31,10 +58,66 @@ class BillRepository(IBillRepository):
         query = (
             select(bills_table)
         )
+
+        if limit is not None:
+            reservation_ids = keyset_page(
+                select(bills_table.c.reservation_id).distinct(),
+                bills_table.c.reservation_id,
+                after,
+                limit,
+            )
+            query = (
+                query
+                .where(bills_table.c.reservation_id.in_(reservation_ids.scalar_subquery()))
+                .order_by(bills_table.c.reservation_id)
+            )
+
         bills = await database.fetch_all(query)
 
         return [Bill.from_record(bill) for bill in bills]
 
+    async def iterate_bills(
+            self,
+            start_date: date | None = None,
+            end_date: date | None = None,
+            guest_id: int | None = None,
+    ) -> AsyncIterator[Bill]:
+        """
+        Stream the bills, with their pricing details, of the reservations starting in a date range,
+        ordered by reservation ID.
+
+        The rows are read through a server-side cursor, so memory stays constant however many match.
+
+        Args:
+            start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+            end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+            guest_id (int | None, optional): The ID of the guest to restrict the bills to. Defaults to None.
+
+        Yields:
+            Bill: The matching bills.
+        """
+
+        query = (
+            select(bills_table, pricing_details_table)
+            .select_from(bills_table.join(pricing_details_table).join(reservations_table))
+            .order_by(bills_table.c.reservation_id)
+        )
+
+        if start_date is not None:
+            query = query.where(reservations_table.c.start_date >= start_date)
+
+        if end_date is not None:
+            query = query.where(reservations_table.c.start_date < end_date + timedelta(days=1))
+
+        if guest_id is not None:
+            query = query.where(reservations_table.c.guest_id == guest_id)
+
+        async for record in database.iterate(query):
+            bill = Bill.from_record(record)
+            bill.pricing_detail = PricingDetail.from_record(record)
+
+            yield bill
+
     async def get_by_id(self, room_id: int, pricing_detail_id: int) -> Any | None:
         """
         Retrieve a bill by the specified room and pricing detail IDs.
@@ -51,7 +134,7 @@ class BillRepository(IBillRepository):
 
         return Bill.from_record(bill) if bill else None
 
-    async def get_by_room_id(self, room_id: int) -> Any | None:
+    async def get_by_room_id(self, room_id: int) -> List[Bill] | None:
         """
         Retrieve all bills associated with the specified room ID.
 
@@ -62,14 +145,9 @@ class BillRepository(IBillRepository):
             List[Bill] | None: A list of bills for the specified room, or None if not found.
         """
 
-        query = (
-            bills_table.select()
-            .where(bills_table.c.room_id == room_id)
-        )
+        bills = await database.fetch_all(BILLS_BY_ROOM_ID, {"room_id": room_id})
 
-        bill = await database.fetch_one(query)
-
-        return Bill.from_record(bill) if bill else None
+        return [Bill.from_record(bill) for bill in bills]
 
     async def get_by_pricing_detail_id(self, pricing_detail_id: int) -> Any | None:
         """
@@ -82,12 +160,7 @@ class BillRepository(IBillRepository):
             List[Bill] | None: A list of bills for the specified pricing detail, or None if not found.
         """
 
-        query = (
-            select(bills_table).
-            where(bills_table.c.pricing_detail_id == pricing_detail_id)
-        )
-
-        bills = await database.fetch_all(query)
+        bills = await database.fetch_all(BILLS_BY_PRICING_DETAIL_ID, {"pricing_detail_id": pricing_detail_id})
 
         return [Bill.from_record(bill) for bill in bills]
 
@@ -102,12 +175,7 @@ class BillRepository(IBillRepository):
             List[Bill] | None: A list of bills for the specified reservation, or None if not found.
         """
 
-        query = (
-            select(bills_table).
-            where(bills_table.c.reservation_id == reservation_id)
-        )
-
-        bills = await database.fetch_all(query)
+        bills = await database.fetch_all(BILLS_BY_RESERVATION_ID, {"reservation_id": reservation_id})
 
         return [Bill.from_record(bill) for bill in bills]
 
@@ -122,10 +190,14 @@ class BillRepository(IBillRepository):
             Bill | None: The newly added bill, or None if the operation fails.
         """
 
-        query = bills_table.insert().values(**data.model_dump())
-        await database.execute(query)
+        query = (
+            bills_table.insert()
+            .values(**data.model_dump())
+            .returning(bills_table)
+        )
+        new_bill = await database.fetch_one(query)
 
-        return await self.get_by_id(data.room_id, data.pricing_detail_id)
+        return Bill.from_record(new_bill) if new_bill else None
 
     async def update_bill(
             self,
@@ -148,8 +220,8 @@ class BillRepository(IBillRepository):
         if self._get_by_id(room_id, pricing_detail_id):
             query = (
                 bills_table.update()
-                .where(bills_table.c.room_id == room_id and
-                       bills_table.c.pricing_detail_id == pricing_detail_id)
+                .where(and_(bills_table.c.room_id == room_id,
+                            bills_table.c.pricing_detail_id == pricing_detail_id))
                 .values(**data.model_dump())
             )
             await database.execute(query)
@@ -204,8 +276,8 @@ class BillRepository(IBillRepository):
 
         query = (
             bills_table.select()
-            .where(bills_table.c.room_id == room_id and
-                   bills_table.c.pricing_detail_id == pricing_detail_id)
+            .where(and_(bills_table.c.room_id == room_id,
+                        bills_table.c.pricing_detail_id == pricing_detail_id))
         )
 
         return await database.fetch_one(query)
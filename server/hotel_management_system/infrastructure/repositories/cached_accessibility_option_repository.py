@@ -0,0 +1,147 @@
+"""
+Module containing the cached accessibility_option repository implementation.
+"""
+
+from typing import List
+
+from hotel_management_system.cache import TTLCache
+from hotel_management_system.core.domains.accessibility_option import AccessibilityOptionIn, AccessibilityOption
+from hotel_management_system.core.repositories.i_accessibility_option_repository import \
+    IAccessibilityOptionRepository
+from hotel_management_system.core.services.i_invalidation_bus import IInvalidationBus
+
+
+class CachedAccessibilityOptionRepository(IAccessibilityOptionRepository):
+    """
+    A class representing the read-through cache in front of a accessibility_option repository.
+
+    Reads are served from the cache, and every write evicts the whole cache, as there are few
+    accessibility options and they rarely change.
+    """
+
+    _repository: IAccessibilityOptionRepository
+    _cache: TTLCache
+    _invalidation_bus: IInvalidationBus
+
+    def __init__(
+            self,
+            repository: IAccessibilityOptionRepository,
+            cache: TTLCache,
+            invalidation_bus: IInvalidationBus,
+    ) -> None:
+        """
+        The initializer of the `cached accessibility_option repository`.
+
+        Args:
+            repository (IAccessibilityOptionRepository): The reference to the cached repository.
+            cache (TTLCache): The reference to the cache.
+            invalidation_bus (IInvalidationBus): The reference to the bus evicting the cache in the other workers.
+        """
+
+        self._repository = repository
+        self._cache = cache
+        self._invalidation_bus = invalidation_bus
+
+    async def get_all_accessibility_options(self) -> List[AccessibilityOption]:
+        """
+        Retrieve all accessibility options from the data storage.
+
+        Returns:
+            List[AccessibilityOption]: A collection of all accessibility options.
+        """
+
+        return await self._cache.get_or_load(
+            "all",
+            lambda: self._repository.get_all_accessibility_options(),
+        )
+
+    async def add_accessibility_option(self, data: AccessibilityOptionIn) -> AccessibilityOption | None:
+        """
+        Add a new accessibility option to the data storage.
+
+        Args:
+            data (AccessibilityOptionIn): The data for the new accessibility option.
+
+        Returns:
+            AccessibilityOption | None: The newly added accessibility option, or None if the operation fails.
+        """
+
+        result = await self._repository.add_accessibility_option(data)
+        await self._invalidate()
+
+        return result
+
+    async def get_by_id(self, accessibility_option_id: int) -> AccessibilityOption | None:
+        """
+        Retrieve an accessibility option by its ID.
+
+        Args:
+            accessibility_option_id (int): The ID of the accessibility option.
+
+        Returns:
+            AccessibilityOption | None: The accessibility option details, or None if not found.
+        """
+
+        return await self._cache.get_or_load(
+            ("id", accessibility_option_id),
+            lambda: self._repository.get_by_id(accessibility_option_id),
+        )
+
+    async def get_by_name(self, accessibility_option_name: str) -> AccessibilityOption | None:
+        """
+        Retrieve an accessibility option by its name.
+
+        Args:
+            accessibility_option_name (str): The name of the accessibility option.
+
+        Returns:
+            AccessibilityOption | None: The accessibility option details, or None if not found.
+        """
+
+        return await self._cache.get_or_load(
+            ("name", accessibility_option_name),
+            lambda: self._repository.get_by_name(accessibility_option_name),
+        )
+
+    async def update_accessibility_option(
+            self,
+            accessibility_option_id: int,
+            data: AccessibilityOptionIn,
+    ) -> AccessibilityOption | None:
+        """
+        Update an existing accessibility option in the data storage.
+
+        Args:
+            accessibility_option_id (int): The ID of the accessibility option to update.
+            data (AccessibilityOptionIn): The updated data for the accessibility option.
+
+        Returns:
+            AccessibilityOption | None: The updated accessibility option, or None if not found.
+        """
+
+        result = await self._repository.update_accessibility_option(accessibility_option_id, data)
+        await self._invalidate()
+
+        return result
+
+    async def delete_accessibility_option(self, accessibility_option_id: int) -> bool:
+        """
+        Remove an accessibility option from the data storage.
+
+        Args:
+            accessibility_option_id (int): The ID of the accessibility option to delete.
+
+        Returns:
+            bool: True if the operation is successful, False otherwise.
+        """
+
+        result = await self._repository.delete_accessibility_option(accessibility_option_id)
+        await self._invalidate()
+
+        return result
+
+    async def _invalidate(self) -> None:
+        """A private method evicting the cache in this worker and, once the write commits, in the others."""
+
+        self._cache.invalidate()
+        await self._invalidation_bus.publish(self._cache.name)
@@ -0,0 +1,142 @@
+"""
+Module containing the cached pricing_detail repository implementation.
+"""
+
+from typing import List
+
+from hotel_management_system.cache import TTLCache
+from hotel_management_system.core.domains.pricing_detail import PricingDetailIn, PricingDetail
+from hotel_management_system.core.repositories.i_pricing_detail_repository import IPricingDetailRepository
+from hotel_management_system.core.services.i_invalidation_bus import IInvalidationBus
+
+
+class CachedPricingDetailRepository(IPricingDetailRepository):
+    """
+    A class representing the read-through cache in front of a pricing_detail repository.
+
+    Reads are served from the cache, and every write evicts the whole cache, as there are few
+    pricing details and they rarely change.
+    """
+
+    _repository: IPricingDetailRepository
+    _cache: TTLCache
+    _invalidation_bus: IInvalidationBus
+
+    def __init__(
+            self,
+            repository: IPricingDetailRepository,
+            cache: TTLCache,
+            invalidation_bus: IInvalidationBus,
+    ) -> None:
+        """
+        The initializer of the `cached pricing_detail repository`.
+
+        Args:
+            repository (IPricingDetailRepository): The reference to the cached repository.
+            cache (TTLCache): The reference to the cache.
+            invalidation_bus (IInvalidationBus): The reference to the bus evicting the cache in the other workers.
+        """
+
+        self._repository = repository
+        self._cache = cache
+        self._invalidation_bus = invalidation_bus
+
+    async def get_all_pricing_details(self) -> List[PricingDetail]:
+        """
+        Retrieve all pricing details from the data storage.
+
+        Returns:
+            List[PricingDetail]: A list of all pricing details.
+        """
+
+        return await self._cache.get_or_load(
+            "all",
+            lambda: self._repository.get_all_pricing_details(),
+        )
+
+    async def get_by_id(self, pricing_detail_id: int) -> PricingDetail | None:
+        """
+        Retrieve a pricing detail by its unique ID.
+
+        Args:
+            pricing_detail_id (int): The ID of the pricing detail.
+
+        Returns:
+            PricingDetail | None: The details of the pricing detail if found, or None if not found.
+        """
+
+        return await self._cache.get_or_load(
+            ("id", pricing_detail_id),
+            lambda: self._repository.get_by_id(pricing_detail_id),
+        )
+
+    async def get_by_name(self, pricing_detail_name: str) -> PricingDetail | None:
+        """
+        Retrieve a pricing detail by its name.
+
+        Args:
+            pricing_detail_name (str): The name of the pricing detail.
+
+        Returns:
+            PricingDetail | None: The pricing detail details if found, or None if not found.
+        """
+
+        return await self._cache.get_or_load(
+            ("name", pricing_detail_name),
+            lambda: self._repository.get_by_name(pricing_detail_name),
+        )
+
+    async def add_pricing_detail(self, data: PricingDetailIn) -> PricingDetail | None:
+        """
+        Add a new pricing detail to the data storage.
+
+        Args:
+            data (PricingDetailIn): The details of the new pricing detail.
+
+        Returns:
+            PricingDetail | None: The newly added pricing detail, or None if the operation fails.
+        """
+
+        result = await self._repository.add_pricing_detail(data)
+        await self._invalidate()
+
+        return result
+
+    async def update_pricing_detail(self, pricing_detail_id: int, data: PricingDetailIn) -> PricingDetail | None:
+        """
+        Update an existing pricing detail's data in the data storage.
+
+        Args:
+            pricing_detail_id (int): The ID of the pricing detail to update.
+            data (PricingDetailIn): The updated details for the pricing detail.
+
+        Returns:
+            PricingDetail | None: The updated pricing detail details, or None if the pricing detail is not found.
+        """
+
+        result = await self._repository.update_pricing_detail(pricing_detail_id, data)
+        await self._invalidate()
+
+        return result
+
+    async def delete_pricing_detail(self, pricing_detail_id: int) -> bool:
+        """
+        Remove a pricing detail from the data storage.
+
+        Args:
+            pricing_detail_id (int): The ID of the pricing detail to remove.
+
+        Returns:
+            bool: True if the operation is successful, False otherwise.
+        """
+
+        result = await self._repository.delete_pricing_detail(pricing_detail_id)
+        await self._invalidate()
+
+        return result
+
+    async def _invalidate(self) -> None:
+        """A private method evicting the cache in this worker and, once the write commits, in the others."""
+
+        self._cache.invalidate()
+        await self._invalidation_bus.publish(self._cache.name)
@@ -0,0 +1,152 @@
+"""
+Module containing the cached room_accessibility_option repository implementation.
+"""
+
+from typing import List
+
+from hotel_management_system.cache import TTLCache
+from hotel_management_system.core.domains.room_accessibility_option import RoomAccessibilityOption, \
+    RoomAccessibilityOptionIn
+from hotel_management_system.core.repositories.i_room_accessibility_option_repository import \
+    IRoomAccessibilityOptionRepository
+from hotel_management_system.core.services.i_invalidation_bus import IInvalidationBus
+
+
+class CachedRoomAccessibilityOptionRepository(IRoomAccessibilityOptionRepository):
+    """
+    A class representing the read-through cache in front of a room_accessibility_option repository.
+
+    Reads are served from the cache, and every write evicts the whole cache, as there are few
+    room accessibility options and they rarely change.
+    """
+
+    _repository: IRoomAccessibilityOptionRepository
+    _cache: TTLCache
+    _invalidation_bus: IInvalidationBus
+
+    def __init__(
+            self,
+            repository: IRoomAccessibilityOptionRepository,
+            cache: TTLCache,
+            invalidation_bus: IInvalidationBus,
+    ) -> None:
+        """
+        The initializer of the `cached room_accessibility_option repository`.
+
+        Args:
+            repository (IRoomAccessibilityOptionRepository): The reference to the cached repository.
+            cache (TTLCache): The reference to the cache.
+            invalidation_bus (IInvalidationBus): The reference to the bus evicting the cache in the other workers.
+        """
+
+        self._repository = repository
+        self._cache = cache
+        self._invalidation_bus = invalidation_bus
+
+    async def get_all_room_accessibility_options(self) -> List[RoomAccessibilityOption]:
+        """
+        Retrieve all room accessibility options from the data storage.
+
+        Returns:
+            List[RoomAccessibilityOption]: A list of all room accessibility options.
+        """
+
+        return await self._cache.get_or_load(
+            "all",
+            lambda: self._repository.get_all_room_accessibility_options(),
+        )
+
+    async def get_by_id(self, room_id: int, accessibility_option_id: int) -> RoomAccessibilityOption | None:
+        """
+        Retrieve a room accessibility option by its unique room ID and accessibility option ID.
+
+        Args:
+            room_id (int): The ID of the room.
+            accessibility_option_id (int): The ID of the accessibility option.
+
+        Returns:
+            RoomAccessibilityOption | None: The room accessibility option details if found, or None if not found.
+        """
+
+        return await self._cache.get_or_load(
+            ("id", room_id, accessibility_option_id),
+            lambda: self._repository.get_by_id(room_id, accessibility_option_id),
+        )
+
+    async def get_by_room_id(self, room_id: int) -> List[RoomAccessibilityOption]:
+        """
+        Retrieve room accessibility options for a specific room ID.
+
+        Args:
+            room_id (int): The ID of the room.
+
+        Returns:
+            RoomAccessibilityOption | None: The room accessibility option details if found
+        """
+
+        return await self._cache.get_or_load(
+            ("room_id", room_id),
+            lambda: self._repository.get_by_room_id(room_id),
+        )
+
+    async def add_room_accessibility_option(self, data: RoomAccessibilityOptionIn) -> RoomAccessibilityOption | None:
+        """
+        Add a new room accessibility option to the data storage.
+
+        Args:
+            data (RoomAccessibilityOptionIn): The details of the new room accessibility option.
+
+        Returns:
+            RoomAccessibilityOption | None: The newly added room accessibility option, or None if the operation fails.
+        """
+
+        result = await self._repository.add_room_accessibility_option(data)
+        await self._invalidate()
+
+        return result
+
+    async def update_room_accessibility_option(
+            self,
+            room_id: int,
+            accessibility_option_id: int,
+            data: RoomAccessibilityOptionIn,
+    ) -> RoomAccessibilityOption | None:
+        """
+        Update the details of an existing room accessibility option in the data storage.
+
+        Args:
+            room_id (int): The ID of the room.
+            accessibility_option_id (int): The ID of the accessibility option.
+            data (RoomAccessibilityOptionIn): The updated details for the room accessibility option.
+
+        Returns:
+            RoomAccessibilityOption | None: The updated room accessibility option details, or None if not found.
+        """
+
+        result = await self._repository.update_room_accessibility_option(room_id, accessibility_option_id, data)
+        await self._invalidate()
+
+        return result
+
+    async def delete_room_accessibility_option(self, room_id: int, accessibility_option_id: int) -> bool:
+        """
+        Remove a room accessibility option from the data storage.
+
+        Args:
+            room_id (int): The ID of the room.
+            accessibility_option_id (int): The ID of the accessibility option.
+
+        Returns:
+            bool: True if the operation is successful, False otherwise.
+        """
+
+        result = await self._repository.delete_room_accessibility_option(room_id, accessibility_option_id)
+        await self._invalidate()
+
+        return result
+
+    async def _invalidate(self) -> None:
+        """A private method evicting the cache in this worker and, once the write commits, in the others."""
+
+        self._cache.invalidate()
+        await self._invalidation_bus.publish(self._cache.name)
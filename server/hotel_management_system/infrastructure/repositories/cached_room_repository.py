@@ -0,0 +1,163 @@
+"""
+Module containing the cached room repository implementation.
+"""
+
+from typing import List
+
+from hotel_management_system.cache import TTLCache
+from hotel_management_system.core.domains.room import RoomIn, Room
+from hotel_management_system.core.repositories.i_room_repository import IRoomRepository
+from hotel_management_system.core.services.i_invalidation_bus import IInvalidationBus
+
+
+class CachedRoomRepository(IRoomRepository):
+    """
+    A class representing the read-through cache in front of a room repository.
+
+    Reads are served from the cache, and every write evicts the whole cache, as there are few
+    rooms and they rarely change.
+    """
+
+    _repository: IRoomRepository
+    _cache: TTLCache
+    _invalidation_bus: IInvalidationBus
+
+    def __init__(
+            self,
+            repository: IRoomRepository,
+            cache: TTLCache,
+            invalidation_bus: IInvalidationBus,
+    ) -> None:
+        """
+        The initializer of the `cached room repository`.
+
+        Args:
+            repository (IRoomRepository): The reference to the cached repository.
+            cache (TTLCache): The reference to the cache.
+            invalidation_bus (IInvalidationBus): The reference to the bus evicting the cache in the other workers.
+        """
+
+        self._repository = repository
+        self._cache = cache
+        self._invalidation_bus = invalidation_bus
+
+    async def get_all_rooms(self, after: int | None = None, limit: int | None = None) -> List[Room]:
+        """
+        Retrieve all rooms from the data storage.
+
+        Without a limit, every room is returned ordered by alias; with a limit,
+        the page following the `after` ID, ordered by ID.
+
+        Args:
+            after (int | None, optional): The ID of the last room of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of rooms. Defaults to None.
+
+        Returns:
+            List[Room]: A list of all rooms stored in the database.
+        """
+
+        return await self._cache.get_or_load(
+            "all" if limit is None else ("page", after, limit),
+            lambda: self._repository.get_all_rooms(after, limit),
+        )
+
+    async def get_by_id(self, room_id: int) -> Room | None:
+        """
+        Retrieve a room by its unique ID.
+
+        Args:
+            room_id (int): The ID of the room.
+
+        Returns:
+            Room | None: The room details if found, or None if no room with the given ID exists.
+        """
+
+        return await self._cache.get_or_load(
+            ("id", room_id),
+            lambda: self._repository.get_by_id(room_id),
+        )
+
+    async def get_existing_ids(self, room_ids: List[int]) -> List[int]:
+        """
+        Retrieve which of the given room IDs exist, with a single query.
+
+        Args:
+            room_ids (List[int]): The IDs of the rooms.
+
+        Returns:
+            List[int]: The IDs of the existing rooms.
+        """
+
+        return await self._repository.get_existing_ids(room_ids)
+
+    async def get_many_hydrated(self, room_ids: List[int]) -> List[Room]:
+        """
+        Retrieve rooms together with their accessibility options, with a fixed number of queries.
+
+        Args:
+            room_ids (List[int]): The IDs of the rooms.
+
+        Returns:
+            List[Room]: The found rooms.
+        """
+
+        return await self._repository.get_many_hydrated(room_ids)
+
+    async def add_room(self, data: RoomIn) -> Room | None:
+        """
+        Add a new room to the data storage.
+
+        Args:
+            data (RoomIn): The details of the new room.
+
+        Returns:
+            Room | None: The newly added room if successful, or None if the operation fails.
+        """
+
+        result = await self._repository.add_room(data)
+        await self._invalidate()
+
+        return result
+
+    async def update_room(
+            self,
+            room_id: int,
+            data: RoomIn,
+    ) -> Room | None:
+        """
+        Update the details of an existing room in the data storage.
+
+        Args:
+            room_id (int): The ID of the room to update.
+            data (RoomIn): The updated room details.
+
+        Returns:
+            Room | None: The updated room details if successful, or None if no room with the given ID exists.
+        """
+
+        result = await self._repository.update_room(room_id, data)
+        await self._invalidate()
+
+        return result
+
+    async def delete_room(self, room_id: int) -> bool:
+        """
+        Remove a room from the data storage.
+
+        Args:
+            room_id (int): The ID of the room to remove.
+
+        Returns:
+            bool: True if the operation was successful, False otherwise.
+        """
+
+        result = await self._repository.delete_room(room_id)
+        await self._invalidate()
+
+        return result
+
+    async def _invalidate(self) -> None:
+        """A private method evicting the cache in this worker and, once the write commits, in the others."""
+
+        self._cache.invalidate()
+        await self._invalidation_bus.publish(self._cache.name)
@@ -0,0 +1,292 @@
+"""
+Module containing daily_stats repository implementation.
+"""
+
+from typing import List
+
+from sqlalchemy import ColumnElement, Select, exists, func, select, true
+from sqlalchemy.dialects.postgresql import Insert, insert
+
+from hotel_management_system.core.domains.bill import BillIn
+from hotel_management_system.core.repositories.i_daily_stats_repository import IDailyStatsRepository
+from hotel_management_system.db import (
+    bills_table,
+    daily_revenue_table,
+    daily_stats_table,
+    guests_accessibility_options_table,
+    pricing_details_table,
+    reservations_table,
+    database,
+    in_array,
+)
+
+
+class DailyStatsRepository(IDailyStatsRepository):
+    """
+    A class representing daily_stats DB repository.
+    """
+
+    async def add_reservation(self, reservation_id: int) -> None:
+        """
+        Add the contribution of a reservation and its bills to the daily stats.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+        """
+
+        async with database.transaction():
+            await self._apply_reservations(reservations_table.c.id == reservation_id, 1)
+            await self._apply_bills(reservations_table.c.id == reservation_id, 1)
+
+    async def remove_reservation(self, reservation_id: int) -> None:
+        """
+        Remove the contribution of a reservation and its bills from the daily stats.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+        """
+
+        async with database.transaction():
+            await self._apply_reservations(reservations_table.c.id == reservation_id, -1)
+            await self._apply_bills(reservations_table.c.id == reservation_id, -1)
+
+    async def add_bill(self, data: BillIn) -> None:
+        """
+        Add the contribution of a single bill to the daily stats.
+
+        Args:
+            data (BillIn): The details of the bill.
+        """
+
+        query = (
+            select(
+                reservations_table.c.start_date,
+                pricing_details_table.c.id,
+                pricing_details_table.c.price,
+            )
+            .where(reservations_table.c.id == data.reservation_id)
+            .where(pricing_details_table.c.id == data.pricing_detail_id)
+        )
+
+        await database.execute(self._upsert_revenue(query))
+
+    async def add_bills(self, reservation_id: int) -> None:
+        """
+        Add the contribution of all bills of a reservation to the daily stats.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+        """
+
+        await self._apply_bills(reservations_table.c.id == reservation_id, 1)
+
+    async def remove_bills(self, reservation_id: int) -> None:
+        """
+        Remove the contribution of all bills of a reservation from the daily stats.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+        """
+
+        await self._apply_bills(reservations_table.c.id == reservation_id, -1)
+
+    async def remove_reservations(self, reservation_ids: List[int]) -> None:
+        """
+        Remove the contribution of several reservations and their bills from the daily stats.
+
+        Args:
+            reservation_ids (List[int]): The IDs of the reservations.
+        """
+
+        async with database.transaction():
+            await self._apply_reservations(in_array(reservations_table.c.id, reservation_ids), -1)
+            await self._apply_bills(in_array(reservations_table.c.id, reservation_ids), -1)
+
+    async def add_pricing_detail_bills(self, pricing_detail_id: int) -> None:
+        """
+        Add the contribution of all bills of a pricing detail to the daily stats.
+
+        Args:
+            pricing_detail_id (int): The ID of the pricing detail.
+        """
+
+        await self._apply_bills(bills_table.c.pricing_detail_id == pricing_detail_id, 1)
+
+    async def remove_pricing_detail_bills(self, pricing_detail_id: int) -> None:
+        """
+        Remove the contribution of all bills of a pricing detail from the daily stats.
+
+        Args:
+            pricing_detail_id (int): The ID of the pricing detail.
+        """
+
+        await self._apply_bills(bills_table.c.pricing_detail_id == pricing_detail_id, -1)
+
+    async def remove_pricing_detail(self, pricing_detail_id: int) -> None:
+        """
+        Remove the daily revenue rows of a pricing detail that is being deleted.
+
+        A pricing detail with bills cannot be deleted, so the rows only hold zeroed income.
+
+        Args:
+            pricing_detail_id (int): The ID of the pricing detail.
+        """
+
+        await database.execute(
+            daily_revenue_table.delete().where(daily_revenue_table.c.pricing_detail_id == pricing_detail_id)
+        )
+
+    async def add_guest_accessibilities(self, guest_ids: List[int]) -> None:
+        """
+        Add the accessibility counters of the reservations of several guests to the daily stats.
+
+        Args:
+            guest_ids (List[int]): The IDs of the guests.
+        """
+
+        await self._apply_accessibilities(in_array(reservations_table.c.guest_id, guest_ids), 1)
+
+    async def remove_guest_accessibilities(self, guest_ids: List[int]) -> None:
+        """
+        Remove the accessibility counters of the reservations of several guests from the daily stats.
+
+        Args:
+            guest_ids (List[int]): The IDs of the guests.
+        """
+
+        await self._apply_accessibilities(in_array(reservations_table.c.guest_id, guest_ids), -1)
+
+    async def rebuild(self) -> None:
+        """
+        Recompute the daily stats from all reservations and bills.
+        """
+
+        async with database.transaction():
+            await database.execute(daily_stats_table.delete())
+            await database.execute(daily_revenue_table.delete())
+            await self._apply_reservations(true(), 1)
+            await self._apply_bills(true(), 1)
+
+    async def _apply_reservations(self, reservations: ColumnElement, sign: int) -> None:
+        """A private method adding or subtracting the counters of the selected reservations.
+
+        Args:
+            reservations (ColumnElement): The predicate selecting the reservations.
+            sign (int): 1 to add the contribution, -1 to subtract it.
+        """
+
+        query = (
+            select(
+                reservations_table.c.start_date,
+                sign * func.count(),
+                sign * func.coalesce(func.sum(reservations_table.c.number_of_guests), 0),
+                sign * func.count().filter(self._has_accessibilities()),
+            )
+            .where(reservations)
+            .group_by(reservations_table.c.start_date)
+        )
+
+        statement = insert(daily_stats_table).from_select(
+            [
+                "date",
+                "reserved_rooms_count",
+                "total_guests_count",
+                "total_guests_with_accessibilities_count",
+            ],
+            query,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[daily_stats_table.c.date],
+            set_={
+                column: daily_stats_table.c[column] + statement.excluded[column]
+                for column in (
+                    "reserved_rooms_count",
+                    "total_guests_count",
+                    "total_guests_with_accessibilities_count",
+                )
+            },
+        )
+
+        await database.execute(statement)
+
+    async def _apply_accessibilities(self, reservations: ColumnElement, sign: int) -> None:
+        """A private method adding or subtracting only the accessibility counter of the selected reservations.
+
+        Args:
+            reservations (ColumnElement): The predicate selecting the reservations.
+            sign (int): 1 to add the contribution, -1 to subtract it.
+        """
+
+        query = (
+            select(
+                reservations_table.c.start_date,
+                sign * func.count().filter(self._has_accessibilities()),
+            )
+            .where(reservations)
+            .group_by(reservations_table.c.start_date)
+        )
+
+        statement = insert(daily_stats_table).from_select(
+            ["date", "total_guests_with_accessibilities_count"],
+            query,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[daily_stats_table.c.date],
+            set_={
+                "total_guests_with_accessibilities_count":
+                    daily_stats_table.c.total_guests_with_accessibilities_count
+                    + statement.excluded.total_guests_with_accessibilities_count,
+            },
+        )
+
+        await database.execute(statement)
+
+    async def _apply_bills(self, bills: ColumnElement, sign: int) -> None:
+        """A private method adding or subtracting the income of the selected bills.
+
+        Args:
+            bills (ColumnElement): The predicate selecting the bills, e.g. by their reservations.
+            sign (int): 1 to add the contribution, -1 to subtract it.
+        """
+
+        query = (
+            select(
+                reservations_table.c.start_date,
+                bills_table.c.pricing_detail_id,
+                sign * func.sum(pricing_details_table.c.price),
+            )
+            .select_from(bills_table.join(reservations_table).join(pricing_details_table))
+            .where(bills)
+            .group_by(reservations_table.c.start_date, bills_table.c.pricing_detail_id)
+        )
+
+        await database.execute(self._upsert_revenue(query))
+
+    def _has_accessibilities(self) -> ColumnElement:
+        """A private method building the predicate telling whether the guest of a reservation has accessibility options.
+
+        Returns:
+            ColumnElement: The predicate.
+        """
+
+        return exists().where(guests_accessibility_options_table.c.guest_id == reservations_table.c.guest_id)
+
+    def _upsert_revenue(self, query: Select) -> Insert:
+        """A private method building the daily_revenue upsert adding the selected income.
+
+        Args:
+            query (Select): The query selecting (date, pricing_detail_id, total_income) rows.
+
+        Returns:
+            Insert: The upsert statement.
+        """
+
+        statement = insert(daily_revenue_table).from_select(
+            ["date", "pricing_detail_id", "total_income"],
+            query,
+        )
+
+        return statement.on_conflict_do_update(
+            index_elements=[daily_revenue_table.c.date, daily_revenue_table.c.pricing_detail_id],
+            set_={"total_income": daily_revenue_table.c.total_income + statement.excluded.total_income},
+        )
@@ -5,7 +5,7 @@ Module containing guest_accessibility_option repository implementation.
 from typing import List
 
 from asyncpg import Record
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, and_
 
 from hotel_management_system.core.repositories.i_guest_accessibility_option_repository import IGuestAccessibilityOptionRepository
 from hotel_management_system.core.domains.guest_accessibility_option import GuestAccessibilityOption, GuestAccessibilityOptionIn
@@ -13,6 +13,16 @@ from hotel_management_system.db import (
     guests_accessibility_options_table,
     database,
 )
+from hotel_management_system.pool import CompiledQuery
+
+GUEST_ACCESSIBILITY_OPTIONS_BY_GUEST_ID = CompiledQuery(
+    select(guests_accessibility_options_table)
+    .where(guests_accessibility_options_table.c.guest_id == bindparam("guest_id"))
+)
+GUEST_ACCESSIBILITY_OPTIONS_BY_ACCESSIBILITY_OPTION_ID = CompiledQuery(
+    select(guests_accessibility_options_table)
+    .where(guests_accessibility_options_table.c.accessibility_option_id == bindparam("accessibility_option_id"))
+)
 
 
 class GuestAccessibilityOptionRepository(IGuestAccessibilityOptionRepository):
@@ -62,11 +72,9 @@ class GuestAccessibilityOptionRepository(IGuestAccessibilityOptionRepository):
             List[GuestAccessibilityOption]: A collection of guest accessibility options if found
         """
 
-        query = (
-            select(guests_accessibility_options_table).
-            where(guests_accessibility_options_table.c.guest_id == guest_id)
+        guest_accessibility_options = await database.fetch_all(
+            GUEST_ACCESSIBILITY_OPTIONS_BY_GUEST_ID, {"guest_id": guest_id}
         )
-        guest_accessibility_options = await database.fetch_all(query)
 
         return [GuestAccessibilityOption.from_record(guest_accessibility_option) for guest_accessibility_option in guest_accessibility_options]
 
@@ -81,13 +89,10 @@ class GuestAccessibilityOptionRepository(IGuestAccessibilityOptionRepository):
             List[GuestAccessibilityOption]: A collection of guest accessibility options if found
         """
 
-        query = (
-            select(guests_accessibility_options_table).
-            where(guests_accessibility_options_table.c.accessibility_option_id == accessibility_option_id)
+        guest_accessibility_options = await database.fetch_all(
+            GUEST_ACCESSIBILITY_OPTIONS_BY_ACCESSIBILITY_OPTION_ID, {"accessibility_option_id": accessibility_option_id}
         )
 
-        guest_accessibility_options = await database.fetch_all(query)
-
         return [GuestAccessibilityOption.from_record(guest_accessibility_option) for guest_accessibility_option in guest_accessibility_options]
 
     async def add_guest_accessibility_option(self, data: GuestAccessibilityOptionIn) -> GuestAccessibilityOption | None:
@@ -127,8 +132,8 @@ class GuestAccessibilityOptionRepository(IGuestAccessibilityOptionRepository):
         if self._get_by_id(guest_id, accessibility_option_id):
             query = (
                 guests_accessibility_options_table.update()
-                .where(guests_accessibility_options_table.c.guest_id == guest_id and
-                       guests_accessibility_options_table.c.accessibility_option_id == accessibility_option_id)
+                .where(and_(guests_accessibility_options_table.c.guest_id == guest_id,
+                            guests_accessibility_options_table.c.accessibility_option_id == accessibility_option_id))
                 .values(**data.model_dump())
             )
             await database.execute(query)
@@ -154,8 +159,8 @@ class GuestAccessibilityOptionRepository(IGuestAccessibilityOptionRepository):
         if self._get_by_id(guest_id, accessibility_option_id):
             query = guests_accessibility_options_table \
                 .delete() \
-                .where(guests_accessibility_options_table.c.guest_id == guest_id and
-                       guests_accessibility_options_table.c.accessibility_option_id == accessibility_option_id)
+                .where(and_(guests_accessibility_options_table.c.guest_id == guest_id,
+                            guests_accessibility_options_table.c.accessibility_option_id == accessibility_option_id))
             await database.execute(query)
 
             return True
@@ -175,8 +180,8 @@ class GuestAccessibilityOptionRepository(IGuestAccessibilityOptionRepository):
 
         query = (
             guests_accessibility_options_table.select()
-            .where(guests_accessibility_options_table.c.guest_id == guest_id and
-                   guests_accessibility_options_table.c.accessibility_option_id == accessibility_option_id)
+            .where(and_(guests_accessibility_options_table.c.guest_id == guest_id,
+                        guests_accessibility_options_table.c.accessibility_option_id == accessibility_option_id))
         )
 
         return await database.fetch_one(query)
@@ -5,13 +5,25 @@ Module containing guest repository implementation.
 from typing import List
 
 from asyncpg import Record
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, literal, select
 
 from hotel_management_system.core.repositories.i_guest_repository import IGuestRepository
-from hotel_management_system.core.domains.guest import Guest, GuestIn
+from hotel_management_system.core.domains.accessibility_option import AccessibilityOption
+from hotel_management_system.core.domains.guest import Guest, GuestIn, GuestSearchMode
 from hotel_management_system.db import (
+    accessibility_options_table,
+    guests_accessibility_options_table,
     guests_table,
+    guest_search_text,
     database,
+    in_array,
+    keyset_page,
+)
+from hotel_management_system.pool import CompiledQuery
+
+GUEST_BY_ID = CompiledQuery(
+    guests_table.select()
+    .where(guests_table.c.id == bindparam("guest_id"))
 )
 
 
@@ -20,10 +32,17 @@ class GuestRepository(IGuestRepository):
     A class representing guest DB repository.
     """
 
-    async def get_all_guests(self) -> List[Guest]:
+    async def get_all_guests(self, after: int | None = None, limit: int | None = None) -> List[Guest]:
         """
         Retrieve all guests from the data storage.
 
+        Without a limit, every guest is returned ordered by first name; with a limit,
+        the page following the `after` ID, ordered by ID.
+
+        Args:
+            after (int | None, optional): The ID of the last guest of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of guests. Defaults to None.
+
         Returns:
             List[Guest]: A list of all guests.
         """
@@ -32,7 +51,7 @@ class GuestRepository(IGuestRepository):
             select(guests_table)
             .order_by(guests_table.c.first_name.asc())
         )
-        guests = await database.fetch_all(query)
+        guests = await database.fetch_all(keyset_page(query, guests_table.c.id, after, limit))
 
         return [Guest.from_record(guest) for guest in guests]
 
@@ -51,6 +70,37 @@ class GuestRepository(IGuestRepository):
 
         return Guest.from_record(guest) if guest else None
 
+    async def get_many_hydrated(self, guest_ids: List[int]) -> List[Guest]:
+        """
+        Retrieve guests together with their accessibility options, with a fixed number of queries.
+
+        Args:
+            guest_ids (List[int]): The IDs of the guests.
+
+        Returns:
+            List[Guest]: The found guests.
+        """
+
+        query = (
+            select(guests_table)
+            .where(in_array(guests_table.c.id, guest_ids))
+        )
+        guests = {record["id"]: Guest.from_record(record) for record in await database.fetch_all(query)}
+
+        query = (
+            select(
+                guests_accessibility_options_table.c.guest_id,
+                accessibility_options_table.c.id,
+                accessibility_options_table.c.name,
+            )
+            .select_from(guests_accessibility_options_table.join(accessibility_options_table))
+            .where(in_array(guests_accessibility_options_table.c.guest_id, list(guests)))
+        )
+        for record in await database.fetch_all(query):
+            guests[record["guest_id"]].accessibility_options.append(AccessibilityOption.from_record(record))
+
+        return list(guests.values())
+
     async def get_by_first_name(self, first_name: str) -> List[Guest] | None:
         """
         Retrieve guests by their first name.
@@ -92,22 +142,37 @@ class GuestRepository(IGuestRepository):
 
         return [Guest.from_record(guest) for guest in guests]
 
-    async def get_by_needle_in_name(self, needle: str) -> List[Guest] | None:
+    async def search(self, needle: str, mode: GuestSearchMode = "similar", limit: int = 20) -> List[Guest]:
         """
-        Search for guests whose names contain a specific substring.
+        Search for guests by their name, email, phone number or city, best matches first.
+
+        Both modes are served by the trigram index on the search text, so only the
+        candidate rows are read and ranked, however many guests there are.
 
         Args:
-            needle (str): A substring to search for within guest names.
+            needle (str): The text to search for.
+            mode (GuestSearchMode, optional): Whether to match similar words or word prefixes. Defaults to "similar".
+            limit (int, optional): The maximum number of guests. Defaults to 20.
 
         Returns:
-            List[Guest] | None: A list of guests whose names contain the substring, or None if no match is found.
+            List[Guest]: The matching guests, ordered by their similarity to the needle.
         """
 
-        needle = needle.lower()
+        needle = needle.strip().lower()
+
+        if mode == "prefix":
+            matches = (
+                guest_search_text.startswith(needle, autoescape=True)
+                | guest_search_text.contains(f" {needle}", autoescape=True)
+            )
+        else:
+            matches = literal(needle).op("<%")(guest_search_text)
 
         query = (
-            guests_table.select()
-            .where(guests_table.c.first_name.ilike(f'%{needle}%') | guests_table.c.last_name.ilike(f'%{needle}%'))
+            select(guests_table)
+            .where(matches)
+            .order_by(func.word_similarity(needle, guest_search_text).desc(), guests_table.c.id)
+            .limit(limit)
         )
 
         guests = await database.fetch_all(query)
@@ -158,6 +223,36 @@ class GuestRepository(IGuestRepository):
 
         return None
 
+    async def delete_guests(self, guest_ids: List[int]) -> List[int]:
+        """
+        Remove guests along with their accessibility options, with one statement per table.
+
+        The guests must no longer have reservations.
+
+        Args:
+            guest_ids (List[int]): The IDs of the guests to remove.
+
+        Returns:
+            List[int]: The IDs of the removed guests.
+        """
+
+        if not guest_ids:
+            return []
+
+        async with database.transaction():
+            query = guests_accessibility_options_table \
+                .delete() \
+                .where(in_array(guests_accessibility_options_table.c.guest_id, guest_ids))
+            await database.execute(query)
+
+            query = guests_table \
+                .delete() \
+                .where(in_array(guests_table.c.id, guest_ids)) \
+                .returning(guests_table.c.id)
+            deleted_guests = await database.fetch_all(query)
+
+        return [record["id"] for record in deleted_guests]
+
     async def delete_guest(self, guest_id: int) -> bool:
         """
         Remove a guest from the data storage.
@@ -190,9 +285,4 @@ class GuestRepository(IGuestRepository):
             Guest | None: guest record if exists.
         """
 
-        query = (
-            guests_table.select()
-            .where(guests_table.c.id == guest_id)
-        )
-
-        return await database.fetch_one(query)
+        return await database.fetch_one(GUEST_BY_ID, {"guest_id": guest_id})
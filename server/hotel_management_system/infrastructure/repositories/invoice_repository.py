@@ -2,16 +2,21 @@
 Module containing invoice repository implementation.
 """
 
-from typing import List
+from datetime import date
+from typing import AsyncIterator, List
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, func, select
 
 from hotel_management_system.core.repositories.i_invoice_repository import IInvoiceRepository
 from hotel_management_system.core.domains.invoice import Invoice, InvoiceIn
 from hotel_management_system.db import (
+    bills_table,
     invoices_table,
+    pricing_details_table,
+    reservations_table,
     database,
+    keyset_page,
 )
 
 
@@ -20,22 +25,71 @@ class InvoiceRepository(IInvoiceRepository):
     A class representing invoice DB repository.
     """
 
-    async def get_all_invoices(self) -> List[Invoice]:
+    async def get_all_invoices(self, after: int | None = None, limit: int | None = None) -> List[Invoice]:
         """
-        Retrieve all invoices from the data storage.
+        Retrieve all invoices from the data storage, together with their total sums.
+
+        Without a limit, every invoice is returned ordered by first name; with a limit,
+        the page following the `after` ID, ordered by ID.
+
+        Args:
+            after (int | None, optional): The ID of the last invoice of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of invoices. Defaults to None.
 
         Returns:
             List[Invoice]: A list of all invoices.
         """
 
         query = (
-            select(invoices_table)
+            select(invoices_table, self._total_sum().label("total_sum"))
             .order_by(invoices_table.c.first_name.asc())
         )
-        invoices = await database.fetch_all(query)
+        invoices = await database.fetch_all(keyset_page(query, invoices_table.c.id, after, limit))
 
         return [Invoice.from_record(invoice) for invoice in invoices]
 
+    async def iterate_invoices(
+            self,
+            start_date: date | None = None,
+            end_date: date | None = None,
+            guest_id: int | None = None,
+    ) -> AsyncIterator[Invoice]:
+        """
+        Stream the invoices issued in a date range, together with their total sums, ordered by ID.
+
+        The rows are read through a server-side cursor, so memory stays constant however many match.
+
+        Args:
+            start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+            end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+            guest_id (int | None, optional): The ID of the guest to restrict the invoices to. Defaults to None.
+
+        Yields:
+            Invoice: The matching invoices.
+        """
+
+        query = (
+            select(invoices_table, self._total_sum().label("total_sum"))
+            .order_by(invoices_table.c.id)
+        )
+
+        if start_date is not None:
+            query = query.where(invoices_table.c.date_of_issue >= start_date)
+
+        if end_date is not None:
+            query = query.where(invoices_table.c.date_of_issue <= end_date)
+
+        if guest_id is not None:
+            query = query.where(
+                invoices_table.c.reservation_id.in_(
+                    select(reservations_table.c.id)
+                    .where(reservations_table.c.guest_id == guest_id)
+                )
+            )
+
+        async for invoice in database.iterate(query):
+            yield Invoice.from_record(invoice)
+
     async def get_by_id(self, invoice_id: int) -> Invoice | None:
         """
         Retrieve an invoice by its unique ID.
@@ -132,3 +186,17 @@ class InvoiceRepository(IInvoiceRepository):
         )
 
         return await database.fetch_one(query)
+
+    def _total_sum(self) -> ColumnElement:
+        """A private method building the scalar subquery summing the bills of the reservation of an invoice.
+
+        Returns:
+            ColumnElement: The total sum subquery.
+        """
+
+        return (
+            select(func.coalesce(func.sum(pricing_details_table.c.price), 0.0))
+            .select_from(bills_table.join(pricing_details_table))
+            .where(bills_table.c.reservation_id == invoices_table.c.reservation_id)
+            .scalar_subquery()
+        )
@@ -5,7 +5,7 @@ Module containing pricing_detail repository implementation.
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
 from hotel_management_system.core.repositories.i_pricing_detail_repository import IPricingDetailRepository
 from hotel_management_system.core.domains.pricing_detail import PricingDetail, PricingDetailIn
@@ -13,6 +13,12 @@ from hotel_management_system.db import (
     pricing_details_table,
     database,
 )
+from hotel_management_system.pool import CompiledQuery
+
+PRICING_DETAIL_BY_ID = CompiledQuery(
+    pricing_details_table.select()
+    .where(pricing_details_table.c.id == bindparam("pricing_detail_id"))
+)
 
 
 class PricingDetailRepository(IPricingDetailRepository):
@@ -66,8 +72,9 @@ class PricingDetailRepository(IPricingDetailRepository):
             pricing_details_table.select()
             .where(pricing_details_table.c.name == pricing_detail_name)
         )
+        pricing_detail = await database.fetch_one(query)
 
-        return await database.fetch_one(query)
+        return PricingDetail.from_record(pricing_detail) if pricing_detail else None
 
     async def add_pricing_detail(self, data: PricingDetailIn) -> Any | None:
         """
@@ -147,9 +154,4 @@ class PricingDetailRepository(IPricingDetailRepository):
             Any | None: pricing_detail record if exists.
         """
 
-        query = (
-            pricing_details_table.select()
-            .where(pricing_details_table.c.id == pricing_detail_id)
-        )
-
-        return await database.fetch_one(query)
+        return await database.fetch_one(PRICING_DETAIL_BY_ID, {"pricing_detail_id": pricing_detail_id})
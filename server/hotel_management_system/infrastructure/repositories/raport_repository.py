@@ -0,0 +1,200 @@
+"""
+Module containing raport repository implementation.
+"""
+
+from datetime import date, timedelta
+from typing import Dict
+
+from sqlalchemy import ColumnElement, Date, TIMESTAMP, and_, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import INTERVAL
+
+from hotel_management_system.core.repositories.i_raport_repository import IRaportRepository
+from hotel_management_system.core.domains.raport import Raport, RaportGranularity
+from hotel_management_system.db import (
+    daily_revenue_table,
+    daily_stats_table,
+    rooms_table,
+    database,
+)
+
+
+class RaportRepository(IRaportRepository):
+    """
+    A class representing raport DB repository.
+
+    The figures are read from the daily_stats and daily_revenue rollups, so the cost
+    of a raport depends on the number of days in the period, not on the reservations.
+    """
+
+    async def get_between_dates(self, start_date: date, end_date: date) -> Raport:
+        """
+        Summarize the reservations starting between the provided start and end dates.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+
+        Returns:
+            Raport: The summary of the reservations.
+        """
+
+        return await self._summarize(start_date, end_date + timedelta(days=1))
+
+    async def get_by_month(self, year: int, month_number: int) -> Raport:
+        """
+        Summarize the reservations starting during the specified month.
+
+        Args:
+            year (int): The year of the reservations.
+            month_number (int): The month number (1 for January, 12 for December).
+
+        Returns:
+            Raport: The summary of the reservations.
+        """
+
+        month_start = date(year, month_number, 1)
+        month_end = date(year + month_number // 12, month_number % 12 + 1, 1)
+
+        return await self._summarize(month_start, month_end)
+
+    async def get_breakdown(
+            self,
+            start_date: date,
+            end_date: date,
+            granularity: RaportGranularity,
+    ) -> Dict[date, Raport]:
+        """
+        Summarize the reservations starting between the provided dates, per day, week or month.
+
+        All periods are computed by one grouped query. The periods are generated by the
+        database, so periods without reservations are reported too.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+            granularity (RaportGranularity): The length of a single period.
+
+        Returns:
+            Dict[date, Raport]: The summaries keyed by the first day of their period, including empty periods.
+        """
+
+        buckets = (
+            select(
+                cast(
+                    func.generate_series(
+                        func.date_trunc(granularity, cast(start_date, TIMESTAMP)),
+                        cast(end_date, TIMESTAMP),
+                        cast(literal(f"1 {granularity}"), INTERVAL),
+                    ),
+                    Date,
+                ).label("bucket")
+            )
+            .cte("buckets")
+        )
+        bucket_stats = (
+            select(
+                self._bucket(daily_stats_table.c.date, granularity).label("bucket"),
+                func.sum(daily_stats_table.c.reserved_rooms_count).label("reserved_rooms_count"),
+                func.sum(daily_stats_table.c.total_guests_count).label("total_guests_count"),
+                func.sum(daily_stats_table.c.total_guests_with_accessibilities_count)
+                .label("total_guests_with_accessibilities_count"),
+            )
+            .where(daily_stats_table.c.date.between(start_date, end_date))
+            .group_by("bucket")
+            .cte("bucket_stats")
+        )
+        bucket_incomes = (
+            select(
+                self._bucket(daily_revenue_table.c.date, granularity).label("bucket"),
+                func.sum(daily_revenue_table.c.total_income).label("total_income"),
+            )
+            .where(daily_revenue_table.c.date.between(start_date, end_date))
+            .group_by("bucket")
+            .cte("bucket_incomes")
+        )
+
+        reserved_rooms_count = func.coalesce(bucket_stats.c.reserved_rooms_count, 0)
+
+        query = (
+            select(
+                buckets.c.bucket,
+                reserved_rooms_count.label("reserved_rooms_count"),
+                (self._count_rooms() - reserved_rooms_count).label("free_rooms_count"),
+                func.coalesce(bucket_incomes.c.total_income, 0.0).label("total_income"),
+                func.coalesce(bucket_stats.c.total_guests_count, 0).label("total_guests_count"),
+                func.coalesce(bucket_stats.c.total_guests_with_accessibilities_count, 0)
+                .label("total_guests_with_accessibilities_count"),
+            )
+            .select_from(
+                buckets
+                .outerjoin(bucket_stats, bucket_stats.c.bucket == buckets.c.bucket)
+                .outerjoin(bucket_incomes, bucket_incomes.c.bucket == buckets.c.bucket)
+            )
+            .order_by(buckets.c.bucket)
+        )
+
+        return {record["bucket"]: Raport.from_record(record) for record in await database.fetch_all(query)}
+
+    async def _summarize(self, start_date: date, end_date: date) -> Raport:
+        """A private method computing the raport figures of a period with a single aggregate query.
+
+        Args:
+            start_date (date): The first day of the period.
+            end_date (date): The end of the period, exclusive.
+
+        Returns:
+            Raport: The summary of the period.
+        """
+
+        total_income = (
+            select(func.coalesce(func.sum(daily_revenue_table.c.total_income), 0.0))
+            .where(and_(
+                daily_revenue_table.c.date >= start_date,
+                daily_revenue_table.c.date < end_date,
+            ))
+            .scalar_subquery()
+        )
+        reserved_rooms_count = func.coalesce(func.sum(daily_stats_table.c.reserved_rooms_count), 0)
+
+        query = (
+            select(
+                reserved_rooms_count.label("reserved_rooms_count"),
+                (self._count_rooms() - reserved_rooms_count).label("free_rooms_count"),
+                total_income.label("total_income"),
+                func.coalesce(func.sum(daily_stats_table.c.total_guests_count), 0).label("total_guests_count"),
+                func.coalesce(func.sum(daily_stats_table.c.total_guests_with_accessibilities_count), 0)
+                .label("total_guests_with_accessibilities_count"),
+            )
+            .where(and_(
+                daily_stats_table.c.date >= start_date,
+                daily_stats_table.c.date < end_date,
+            ))
+        )
+
+        return Raport.from_record(await database.fetch_one(query))
+
+    def _bucket(self, column: ColumnElement, granularity: RaportGranularity) -> ColumnElement:
+        """A private method building the expression truncating a date to the start of its period.
+
+        Args:
+            column (ColumnElement): The date column.
+            granularity (RaportGranularity): The length of a single period.
+
+        Returns:
+            ColumnElement: The first day of the period.
+        """
+
+        return cast(func.date_trunc(granularity, cast(column, TIMESTAMP)), Date)
+
+    def _count_rooms(self) -> ColumnElement:
+        """A private method building the scalar subquery counting all rooms.
+
+        Returns:
+            ColumnElement: The room count subquery.
+        """
+
+        return (
+            select(func.count())
+            .select_from(rooms_table)
+            .scalar_subquery()
+        )
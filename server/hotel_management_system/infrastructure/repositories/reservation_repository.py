@@ -2,17 +2,47 @@
 Module containing reservation repository implementation.
 """
 
-from datetime import date
-from typing import List
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import AsyncIterator, Collection, Dict, List
 
 from asyncpg import Record
-from sqlalchemy import select, extract
+from asyncpg.exceptions import ExclusionViolationError, UniqueViolationError  # type: ignore
+from sqlalchemy import Integer, and_, bindparam, func, literal, select, true
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql.dml import Insert
 
+from hotel_management_system.concurrency import gather_bounded
 from hotel_management_system.core.repositories.i_reservation_repository import IReservationRepository
-from hotel_management_system.core.domains.reservation import Reservation, ReservationIn
+from hotel_management_system.core.domains.accessibility_option import AccessibilityOption
+from hotel_management_system.core.domains.bill import Bill
+from hotel_management_system.core.domains.guest import Guest
+from hotel_management_system.core.domains.pricing_detail import PricingDetail
+from hotel_management_system.core.domains.reservation import Reservation, ReservationExpansion, ReservationIn
+from hotel_management_system.core.domains.room import Room
 from hotel_management_system.db import (
+    accessibility_options_table,
+    bills_table,
+    guests_accessibility_options_table,
+    guests_table,
+    invoices_table,
+    pricing_details_table,
+    reservation_rooms_table,
     reservations_table,
+    room_occupancy_table,
+    rooms_accessibility_options_table,
+    rooms_table,
     database,
+    in_array,
+    keyset_page,
+    reservation_stay,
+)
+from hotel_management_system.pool import CompiledQuery
+
+RESERVATIONS_BY_GUEST_ID = CompiledQuery(
+    select(reservations_table)
+    .where(reservations_table.c.guest_id == bindparam("guest_id"))
+    .order_by(reservations_table.c.start_date.asc())
 )
 
 
@@ -21,10 +51,17 @@ class ReservationRepository(IReservationRepository):
     A class representing reservation DB repository.
     """
 
-    async def get_all_reservations(self) -> List[Reservation]:
+    async def get_all_reservations(self, after: int | None = None, limit: int | None = None) -> List[Reservation]:
         """
         Retrieve all reservations from the data storage.
 
+        Without a limit, every reservation is returned ordered by start date; with a limit,
+        the page following the `after` ID, ordered by ID.
+
+        Args:
+            after (int | None, optional): The ID of the last reservation of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of reservations. Defaults to None.
+
         Returns:
             List[Reservation]: A list of all reservations.
         """
@@ -34,10 +71,47 @@ class ReservationRepository(IReservationRepository):
             .order_by(reservations_table.c.start_date.asc())
         )
 
-        reservations = await database.fetch_all(query)
+        reservations = await database.fetch_all(keyset_page(query, reservations_table.c.id, after, limit))
 
         return [Reservation.from_record(reservation) for reservation in reservations]
 
+    async def iterate_reservations(
+            self,
+            start_date: date | None = None,
+            end_date: date | None = None,
+            guest_id: int | None = None,
+    ) -> AsyncIterator[Reservation]:
+        """
+        Stream the reservations starting in a date range, ordered by start date.
+
+        The rows are read through a server-side cursor, so memory stays constant however many match.
+
+        Args:
+            start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+            end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+            guest_id (int | None, optional): The ID of the guest to restrict the reservations to. Defaults to None.
+
+        Yields:
+            Reservation: The matching reservations.
+        """
+
+        query = (
+            select(reservations_table)
+            .order_by(reservations_table.c.start_date.asc())
+        )
+
+        if start_date is not None:
+            query = query.where(reservations_table.c.start_date >= start_date)
+
+        if end_date is not None:
+            query = query.where(reservations_table.c.start_date < end_date + timedelta(days=1))
+
+        if guest_id is not None:
+            query = query.where(reservations_table.c.guest_id == guest_id)
+
+        async for reservation in database.iterate(query):
+            yield Reservation.from_record(reservation)
+
     async def get_by_id(self, reservation_id: int) -> Reservation | None:
         """
         Retrieve a reservation by its unique ID.
@@ -53,6 +127,85 @@ class ReservationRepository(IReservationRepository):
 
         return Reservation.from_record(reservation) if reservation else None
 
+    async def get_by_guest_id(self, guest_id: int) -> List[Reservation]:
+        """
+        Retrieve reservations made by the specified guest.
+
+        Args:
+            guest_id (int): The ID of the guest.
+
+        Returns:
+            List[Reservation]: A list of reservations made by the guest.
+        """
+
+        reservations = await database.fetch_all(RESERVATIONS_BY_GUEST_ID, {"guest_id": guest_id})
+
+        return [Reservation.from_record(reservation) for reservation in reservations]
+
+    async def get_many_hydrated(
+            self,
+            reservation_ids: List[int],
+            expand: Collection[ReservationExpansion] = ("guest", "rooms", "bills"),
+    ) -> List[Reservation]:
+        """
+        Retrieve reservations together with their guests, rooms, bills and accessibility options.
+
+        The related data for the whole batch is loaded with a fixed number of set-based
+        queries, regardless of how many reservations are requested, run concurrently.
+
+        Args:
+            reservation_ids (List[int]): The IDs of the reservations.
+            expand (Collection[ReservationExpansion], optional): The related data to load. Defaults to all of it.
+
+        Returns:
+            List[Reservation]: The hydrated reservations, in the order of the given IDs.
+        """
+
+        if not reservation_ids:
+            return []
+
+        query = (
+            select(reservations_table)
+            .where(in_array(reservations_table.c.id, reservation_ids))
+        )
+        reservations = {
+            record["id"]: Reservation.from_record(record)
+            for record in await database.fetch_all(query)
+        }
+
+        lookups = {}
+
+        if "guest" in expand:
+            lookups["guest"] = self._get_guests(list({reservation.guest_id for reservation in reservations.values()}))
+
+        if "rooms" in expand:
+            lookups["rooms"] = self._get_reserved_rooms(list(reservations))
+
+        if "bills" in expand:
+            lookups["bills"] = self._get_bills(list(reservations))
+
+        related = dict(zip(lookups, await gather_bounded(*lookups.values())))
+
+        if "guest" in related:
+            for reservation in reservations.values():
+                reservation.guest = related["guest"].get(reservation.guest_id)
+
+        if "rooms" in related:
+            for reservation in reservations.values():
+                reservation.reserved_rooms = related["rooms"][reservation.id]
+
+        if "bills" in related:
+            for reservation in reservations.values():
+                reservation.bills = related["bills"][reservation.id]
+
+        hydrated_reservations = [
+            reservations[reservation_id]
+            for reservation_id in reservation_ids
+            if reservation_id in reservations
+        ]
+
+        return hydrated_reservations
+
     async def get_by_month(self, year: int, month_number: int) -> List[Reservation]:
         """
         Retrieve reservations made during the specified month.
@@ -65,15 +218,23 @@ class ReservationRepository(IReservationRepository):
             List[Reservation]: A list of reservations made in the specified month.
         """
 
-        query = (
-            select(reservations_table)
-            .filter(extract('year', reservations_table.c.start_date) == year)
-            .filter(extract('month', reservations_table.c.start_date) == month_number)
-        )
+        month_start = date(year, month_number, 1)
+        month_end = date(year + month_number // 12, month_number % 12 + 1, 1)
 
-        reservations = await database.fetch_all(query)
+        return await self._get_starting_between(month_start, month_end)
 
-        return [Reservation.from_record(reservation) for reservation in reservations]
+    async def get_by_year(self, year: int) -> List[Reservation]:
+        """
+        Retrieve reservations made during the specified year.
+
+        Args:
+            year (int): The year of the reservations.
+
+        Returns:
+            List[Reservation]: A list of reservations made in the specified year.
+        """
+
+        return await self._get_starting_between(date(year, 1, 1), date(year + 1, 1, 1))
 
     async def get_between_dates(self, start_date: date, end_date: date) -> List[Reservation]:
         """
@@ -81,21 +242,53 @@ class ReservationRepository(IReservationRepository):
 
         Args:
             start_date (date): The start date of the range.
-            end_date (date): The end date of the range.
+            end_date (date): The end date of the range, inclusive.
 
         Returns:
             List[Reservation]: A list of reservations made within the date range.
         """
 
+        return await self._get_starting_between(start_date, end_date + timedelta(days=1))
+
+    async def get_active_between(self, start_date: date, end_date: date) -> List[Reservation]:
+        """
+        Retrieve reservations whose stay overlaps the provided period.
+
+        Args:
+            start_date (date): The first day of the period.
+            end_date (date): The end of the period, exclusive.
+
+        Returns:
+            List[Reservation]: A list of reservations active during the period.
+        """
+
         query = (
             select(reservations_table)
-            .filter(reservations_table.c.start_date.between(start_date, end_date))
+            .where(reservation_stay.op("&&")(func.daterange(start_date, end_date)))
+            .order_by(reservations_table.c.start_date.asc())
         )
 
         reservations = await database.fetch_all(query)
 
         return [Reservation.from_record(reservation) for reservation in reservations]
 
+    async def get_active_by_month(self, year: int, month_number: int) -> List[Reservation]:
+        """
+        Retrieve reservations whose stay overlaps the specified month.
+
+        Args:
+            year (int): The year of the reservations.
+            month_number (int): The month number (1 for January, 12 for December).
+
+        Returns:
+            List[Reservation]: A list of reservations active during the specified month.
+        """
+
+        month_start = date(year, month_number, 1)
+        month_end = date(year + month_number // 12, month_number % 12 + 1, 1)
+
+        return await self.get_active_between(month_start, month_end)
+
     async def add_reservation(self, data: ReservationIn) -> Reservation | None:
         """
         Add a new reservation to the data storage.
@@ -110,7 +303,52 @@ class ReservationRepository(IReservationRepository):
         query = reservations_table.insert().values(**data.model_dump())
         new_reservation_id = await database.execute(query)
 
-        return await self._get_by_id(new_reservation_id)
+        return await self.get_by_id(new_reservation_id)
+
+    async def add_reservation_with_rooms(
+            self,
+            data: ReservationIn,
+            room_ids: List[int],
+            pricing_detail_id: int,
+    ) -> Reservation | None:
+        """
+        Add a new reservation together with its rooms and one bill per room per night.
+
+        All rows are written by multi-row inserts in a single transaction, so the number
+        of round trips does not depend on the number of rooms and nights.
+
+        Args:
+            data (ReservationIn): The details of the new reservation.
+            room_ids (List[int]): The IDs of the rooms to reserve.
+            pricing_detail_id (int): The ID of the pricing detail billed for every night.
+
+        Returns:
+            Reservation | None: The newly added reservation, or None if one of the rooms is already reserved.
+        """
+
+        try:
+            async with database.transaction():
+                query = reservations_table.insert().values(**data.model_dump())
+                new_reservation_id = await database.execute(query)
+
+                reservation_rooms = [
+                    {"reservation_id": new_reservation_id, "room_id": room_id}
+                    for room_id in room_ids
+                ]
+                if reservation_rooms:
+                    await database.execute(reservation_rooms_table.insert().values(reservation_rooms))
+
+                    query = room_occupancy_table.insert().values([
+                        {**reservation_room, "stay": func.daterange(data.start_date, data.end_date)}
+                        for reservation_room in reservation_rooms
+                    ])
+                    await database.execute(query)
+
+                    await database.execute(self._bill_nights(new_reservation_id, data, room_ids, pricing_detail_id))
+        except (ExclusionViolationError, UniqueViolationError):
+            return None
+
+        return await self.get_by_id(new_reservation_id)
 
     async def update_reservation(
             self,
@@ -129,37 +367,87 @@ class ReservationRepository(IReservationRepository):
         """
 
         if self._get_by_id(reservation_id):
-            query = (
-                reservations_table.update()
-                .where(reservations_table.c.id == reservation_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
+            try:
+                async with database.transaction():
+                    query = (
+                        reservations_table.update()
+                        .where(reservations_table.c.id == reservation_id)
+                        .values(**data.model_dump())
+                    )
+                    await database.execute(query)
+
+                    query = (
+                        room_occupancy_table.update()
+                        .where(room_occupancy_table.c.reservation_id == reservation_id)
+                        .values(stay=func.daterange(data.start_date, data.end_date))
+                    )
+                    await database.execute(query)
+            except ExclusionViolationError:
+                return None
 
             return await self.get_by_id(reservation_id)
 
         return None
 
-    async def delete_reservation(self, reservation_id: int) -> bool:
+    async def get_ids_by_guest_ids(self, guest_ids: List[int]) -> List[int]:
         """
-        Remove a reservation from the data storage.
+        Retrieve the IDs of the reservations made by the specified guests.
 
         Args:
-            reservation_id (int): The ID of the reservation to remove.
+            guest_ids (List[int]): The IDs of the guests.
 
         Returns:
-            bool: True if the operation is successful, False otherwise.
+            List[int]: The IDs of the guests' reservations.
         """
 
-        if self._get_by_id(reservation_id):
+        query = (
+            select(reservations_table.c.id)
+            .where(in_array(reservations_table.c.guest_id, guest_ids))
+        )
+
+        return [record["id"] for record in await database.fetch_all(query)]
+
+    async def delete_reservations(self, reservation_ids: List[int]) -> List[int]:
+        """
+        Remove reservations along with their invoices, bills and rooms, with one statement per table.
+
+        Args:
+            reservation_ids (List[int]): The IDs of the reservations to remove.
+
+        Returns:
+            List[int]: The IDs of the removed reservations.
+        """
+
+        if not reservation_ids:
+            return []
+
+        async with database.transaction():
+            for table in (invoices_table, bills_table, room_occupancy_table, reservation_rooms_table):
+                query = table \
+                    .delete() \
+                    .where(in_array(table.c.reservation_id, reservation_ids))
+                await database.execute(query)
+
             query = reservations_table \
                 .delete() \
-                .where(reservations_table.c.id == reservation_id)
-            await database.execute(query)
+                .where(in_array(reservations_table.c.id, reservation_ids)) \
+                .returning(reservations_table.c.id)
+            deleted_reservations = await database.fetch_all(query)
+
+        return [record["id"] for record in deleted_reservations]
+
+    async def delete_reservation(self, reservation_id: int) -> bool:
+        """
+        Remove a reservation from the data storage, along with its invoices, bills and rooms.
+
+        Args:
+            reservation_id (int): The ID of the reservation to remove.
 
-            return True
+        Returns:
+            bool: True if the operation is successful, False otherwise.
+        """
 
-        return False
+        return bool(await self.delete_reservations([reservation_id]))
 
     async def _get_by_id(self, reservation_id: int) -> Record | None:
         """A private method getting reservation from the DB based on its ID.
@@ -177,3 +465,167 @@ class ReservationRepository(IReservationRepository):
         )
 
         return await database.fetch_one(query)
+
+    async def _get_starting_between(self, start_date: date, end_date: date) -> List[Reservation]:
+        """A private method getting reservations starting in a half-open period.
+
+        The bare column comparison lets the start_date index serve the query, so its
+        cost follows the number of matching reservations, not the size of the table.
+
+        Args:
+            start_date (date): The first day of the period.
+            end_date (date): The end of the period, exclusive.
+
+        Returns:
+            List[Reservation]: The reservations starting in the period.
+        """
+
+        query = (
+            select(reservations_table)
+            .where(and_(
+                reservations_table.c.start_date >= start_date,
+                reservations_table.c.start_date < end_date,
+            ))
+            .order_by(reservations_table.c.start_date.asc())
+        )
+
+        reservations = await database.fetch_all(query)
+
+        return [Reservation.from_record(reservation) for reservation in reservations]
+
+    def _bill_nights(
+            self,
+            reservation_id: int,
+            data: ReservationIn,
+            room_ids: List[int],
+            pricing_detail_id: int,
+    ) -> Insert:
+        """A private method building the insert of one bill per room per night.
+
+        The rows are generated by the database from the room IDs and the number of
+        nights, so the statement has the same few parameters for any booking size.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+            data (ReservationIn): The details of the reservation.
+            room_ids (List[int]): The IDs of the reserved rooms.
+            pricing_detail_id (int): The ID of the pricing detail billed for every night.
+
+        Returns:
+            Insert: The insert statement.
+        """
+
+        rooms = func.unnest(literal(room_ids, ARRAY(Integer))).table_valued("room_id")
+        nights = func.generate_series(1, data.get_duration()).table_valued("night")
+
+        return bills_table.insert().from_select(
+            ["room_id", "pricing_detail_id", "reservation_id"],
+            select(rooms.c.room_id, literal(pricing_detail_id), literal(reservation_id))
+            .select_from(rooms.join(nights, true())),
+        )
+
+    async def _get_guests(self, guest_ids: List[int]) -> Dict[int, Guest]:
+        """A private method getting guests along with their accessibility options.
+
+        Args:
+            guest_ids (List[int]): The IDs of the guests.
+
+        Returns:
+            Dict[int, Guest]: The guests keyed by their IDs.
+        """
+
+        query = (
+            select(guests_table)
+            .where(in_array(guests_table.c.id, guest_ids))
+        )
+        guests = {record["id"]: Guest.from_record(record) for record in await database.fetch_all(query)}
+
+        query = (
+            select(
+                guests_accessibility_options_table.c.guest_id,
+                accessibility_options_table.c.id,
+                accessibility_options_table.c.name,
+            )
+            .select_from(guests_accessibility_options_table.join(accessibility_options_table))
+            .where(in_array(guests_accessibility_options_table.c.guest_id, guest_ids))
+        )
+        for record in await database.fetch_all(query):
+            guests[record["guest_id"]].accessibility_options.append(AccessibilityOption.from_record(record))
+
+        return guests
+
+    async def _get_reserved_rooms(self, reservation_ids: List[int]) -> Dict[int, List[Room]]:
+        """A private method getting reserved rooms along with their accessibility options.
+
+        Args:
+            reservation_ids (List[int]): The IDs of the reservations.
+
+        Returns:
+            Dict[int, List[Room]]: The reserved rooms grouped by reservation ID.
+        """
+
+        query = (
+            select(
+                reservation_rooms_table.c.reservation_id,
+                rooms_table.c.id,
+                rooms_table.c.alias,
+            )
+            .select_from(reservation_rooms_table.join(rooms_table))
+            .where(in_array(reservation_rooms_table.c.reservation_id, reservation_ids))
+        )
+        reservation_rooms = await database.fetch_all(query)
+
+        rooms = {record["id"]: Room.from_record(record) for record in reservation_rooms}
+
+        query = (
+            select(
+                rooms_accessibility_options_table.c.room_id,
+                accessibility_options_table.c.id,
+                accessibility_options_table.c.name,
+            )
+            .select_from(rooms_accessibility_options_table.join(accessibility_options_table))
+            .where(in_array(rooms_accessibility_options_table.c.room_id, list(rooms)))
+        )
+        for record in await database.fetch_all(query):
+            rooms[record["room_id"]].accessibility_options.append(AccessibilityOption.from_record(record))
+
+        rooms_by_reservation = defaultdict(list)
+        for record in reservation_rooms:
+            rooms_by_reservation[record["reservation_id"]].append(rooms[record["id"]])
+
+        return rooms_by_reservation
+
+    async def _get_bills(self, reservation_ids: List[int]) -> Dict[int, List[Bill]]:
+        """A private method getting bills along with their pricing details.
+
+        Args:
+            reservation_ids (List[int]): The IDs of the reservations.
+
+        Returns:
+            Dict[int, List[Bill]]: The bills grouped by reservation ID.
+        """
+
+        query = (
+            select(
+                bills_table,
+                pricing_details_table.c.name,
+                pricing_details_table.c.price,
+            )
+            .select_from(bills_table.join(pricing_details_table))
+            .where(in_array(bills_table.c.reservation_id, reservation_ids))
+        )
+
+        pricing_details: Dict[int, PricingDetail] = {}
+        bills_by_reservation = defaultdict(list)
+        for record in await database.fetch_all(query):
+            bill = Bill.from_record(record)
+            if bill.pricing_detail_id not in pricing_details:
+                pricing_details[bill.pricing_detail_id] = PricingDetail(
+                    id=record["pricing_detail_id"],
+                    name=record["name"],
+                    price=record["price"],
+                )
+            bill.pricing_detail = pricing_details[bill.pricing_detail_id]
+            bills_by_reservation[bill.reservation_id].append(bill)
+
+        return bills_by_reservation
@@ -2,16 +2,33 @@
 Module containing reservation_room repository implementation.
 """
 
+from datetime import date
 from typing import List
 
 from asyncpg import Record
-from sqlalchemy import select
+from asyncpg.exceptions import ExclusionViolationError, UniqueViolationError  # type: ignore
+from sqlalchemy import Select, and_, bindparam, func, literal, select
+from sqlalchemy.sql.dml import Delete, Insert
 
 from hotel_management_system.core.repositories.i_reservation_room_repository import IReservationRoomRepository
 from hotel_management_system.core.domains.reservation_room import ReservationRoom, ReservationRoomIn
+from hotel_management_system.core.domains.room_occupancy import RoomOccupancy
 from hotel_management_system.db import (
     reservation_rooms_table,
+    reservations_table,
+    room_occupancy_table,
     database,
+    in_array,
+)
+from hotel_management_system.pool import CompiledQuery
+
+RESERVATION_ROOMS_BY_ROOM_ID = CompiledQuery(
+    select(reservation_rooms_table)
+    .where(reservation_rooms_table.c.room_id == bindparam("room_id"))
+)
+RESERVATION_ROOMS_BY_RESERVATION_ID = CompiledQuery(
+    select(reservation_rooms_table)
+    .where(reservation_rooms_table.c.reservation_id == bindparam("reservation_id"))
 )
 
 
@@ -35,6 +52,58 @@ class ReservationRoomRepository(IReservationRoomRepository):
 
         return [ReservationRoom.from_record(reservation_room) for reservation_room in reservation_rooms]
 
+    async def get_all_room_occupancies(self) -> List[RoomOccupancy]:
+        """
+        Retrieve every reserved room together with the dates of its reservation.
+
+        Returns:
+            List[RoomOccupancy]: A list of all room occupancies.
+        """
+
+        room_occupancies = await database.fetch_all(self._select_room_occupancies())
+
+        return [RoomOccupancy.from_record(room_occupancy) for room_occupancy in room_occupancies]
+
+    async def get_room_occupancies_by_reservation_ids(self, reservation_ids: List[int]) -> List[RoomOccupancy]:
+        """
+        Retrieve the rooms held by the specified reservations together with their dates.
+
+        Args:
+            reservation_ids (List[int]): The IDs of the reservations.
+
+        Returns:
+            List[RoomOccupancy]: A list of the room occupancies of the reservations.
+        """
+
+        query = (
+            self._select_room_occupancies()
+            .where(in_array(room_occupancy_table.c.reservation_id, reservation_ids))
+        )
+        room_occupancies = await database.fetch_all(query)
+
+        return [RoomOccupancy.from_record(room_occupancy) for room_occupancy in room_occupancies]
+
+    async def get_occupied_room_ids(self, start_date: date, end_date: date) -> List[int]:
+        """
+        Retrieve the IDs of the rooms held by a reservation overlapping the provided dates.
+
+        Args:
+            start_date (date): The first night of the period.
+            end_date (date): The end of the period, exclusive.
+
+        Returns:
+            List[int]: The IDs of the occupied rooms.
+        """
+
+        query = (
+            select(room_occupancy_table.c.room_id)
+            .where(room_occupancy_table.c.stay.overlaps(func.daterange(start_date, end_date)))
+            .distinct()
+        )
+        occupied_rooms = await database.fetch_all(query)
+
+        return [occupied_room["room_id"] for occupied_room in occupied_rooms]
+
     async def get_by_id(self, room_id: int, reservation_id: int) -> ReservationRoom | None:
         """
         Retrieve a reservation room by its unique room ID and reservation ID.
@@ -62,12 +131,7 @@ class ReservationRoomRepository(IReservationRoomRepository):
             List[ReservationRoom] | None: The reservation rooms for the specified room, or None if no rooms are found.
         """
 
-        query = (
-            select(reservation_rooms_table)
-            .where(reservation_rooms_table.c.room_id == room_id)
-        )
-
-        reservation_rooms = await database.fetch_all(query)
+        reservation_rooms = await database.fetch_all(RESERVATION_ROOMS_BY_ROOM_ID, {"room_id": room_id})
 
         return [ReservationRoom.from_record(reservation_room) for reservation_room in reservation_rooms]
 
@@ -82,11 +146,9 @@ class ReservationRoomRepository(IReservationRoomRepository):
             ReservationRoom | None: The reservation room details if found
         """
 
-        query = (
-            select(reservation_rooms_table).
-            where(reservation_rooms_table.c.reservation_id == reservation_id)
+        reservation_rooms = await database.fetch_all(
+            RESERVATION_ROOMS_BY_RESERVATION_ID, {"reservation_id": reservation_id}
         )
-        reservation_rooms = await database.fetch_all(query)
 
         return [ReservationRoom.from_record(reservation_room) for reservation_room in reservation_rooms]
 
@@ -101,8 +163,13 @@ class ReservationRoomRepository(IReservationRoomRepository):
             ReservationRoom | None: The newly added reservation room, or None if the operation fails.
         """
 
-        query = reservation_rooms_table.insert().values(**data.model_dump())
-        await database.execute(query)
+        try:
+            async with database.transaction():
+                query = reservation_rooms_table.insert().values(**data.model_dump())
+                await database.execute(query)
+                await database.execute(self._occupy(data))
+        except (ExclusionViolationError, UniqueViolationError):
+            return None
 
         return await self.get_by_id(data.room_id, data.reservation_id)
 
@@ -125,13 +192,19 @@ class ReservationRoomRepository(IReservationRoomRepository):
         """
 
         if self._get_by_id(room_id, reservation_id):
-            query = (
-                reservation_rooms_table.update()
-                .where(reservation_rooms_table.c.room_id == room_id and
-                       reservation_rooms_table.c.reservation_id == reservation_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
+            try:
+                async with database.transaction():
+                    query = (
+                        reservation_rooms_table.update()
+                        .where(and_(reservation_rooms_table.c.room_id == room_id,
+                                    reservation_rooms_table.c.reservation_id == reservation_id))
+                        .values(**data.model_dump())
+                    )
+                    await database.execute(query)
+                    await database.execute(self._release(room_id, reservation_id))
+                    await database.execute(self._occupy(data))
+            except (ExclusionViolationError, UniqueViolationError):
+                return None
 
             reservation_room = await self._get_by_id(room_id, reservation_id)
 
@@ -153,11 +226,13 @@ class ReservationRoomRepository(IReservationRoomRepository):
 
 
         if self._get_by_id(room_id, reservation_id):
-            query = reservation_rooms_table \
-                .delete() \
-                .where(reservation_rooms_table.c.room_id == room_id and
-                       reservation_rooms_table.c.reservation_id == reservation_id)
-            await database.execute(query)
+            async with database.transaction():
+                query = reservation_rooms_table \
+                    .delete() \
+                    .where(and_(reservation_rooms_table.c.room_id == room_id,
+                                reservation_rooms_table.c.reservation_id == reservation_id))
+                await database.execute(query)
+                await database.execute(self._release(room_id, reservation_id))
 
             return True
 
@@ -176,8 +251,61 @@ class ReservationRoomRepository(IReservationRoomRepository):
 
         query = (
             reservation_rooms_table.select()
-            .where(reservation_rooms_table.c.room_id == room_id and
-                   reservation_rooms_table.c.reservation_id == reservation_id)
+            .where(and_(reservation_rooms_table.c.room_id == room_id,
+                        reservation_rooms_table.c.reservation_id == reservation_id))
         )
 
         return await database.fetch_one(query)
+
+    def _occupy(self, data: ReservationRoomIn) -> Insert:
+        """A private method building the room_occupancy insert for a reservation room.
+
+        The stay is copied from the reservation inside the statement, so the
+        exclusion constraint checks it against the other stays of the room.
+
+        Args:
+            data (ReservationRoomIn): The details of the reservation room.
+
+        Returns:
+            Insert: The insert statement.
+        """
+
+        return room_occupancy_table.insert().from_select(
+            ["reservation_id", "room_id", "stay"],
+            select(
+                reservations_table.c.id,
+                literal(data.room_id),
+                func.daterange(reservations_table.c.start_date, reservations_table.c.end_date),
+            )
+            .where(reservations_table.c.id == data.reservation_id),
+        )
+
+    def _release(self, room_id: int, reservation_id: int) -> Delete:
+        """A private method building the room_occupancy delete for a reservation room.
+
+        Args:
+            room_id (int): The ID of the room.
+            reservation_id (int): The ID of the reservation.
+
+        Returns:
+            Delete: The delete statement.
+        """
+
+        return room_occupancy_table.delete().where(and_(
+            room_occupancy_table.c.room_id == room_id,
+            room_occupancy_table.c.reservation_id == reservation_id,
+        ))
+
+    def _select_room_occupancies(self) -> Select:
+        """A private method building the query reading the room occupancies with their dates.
+
+        Returns:
+            Select: The query selecting every room occupancy.
+        """
+
+        return select(
+            room_occupancy_table.c.reservation_id,
+            room_occupancy_table.c.room_id,
+            func.lower(room_occupancy_table.c.stay).label("start_date"),
+            func.upper(room_occupancy_table.c.stay).label("end_date"),
+        )
@@ -5,7 +5,7 @@ Module containing room_accessiblity_option repository implementation.
 from typing import List
 
 from asyncpg import Record
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, and_
 
 from hotel_management_system.core.repositories.i_room_accessibility_option_repository import \
     IRoomAccessibilityOptionRepository
@@ -15,6 +15,12 @@ from hotel_management_system.db import (
     rooms_accessibility_options_table,
     database,
 )
+from hotel_management_system.pool import CompiledQuery
+
+ROOM_ACCESSIBILITY_OPTIONS_BY_ROOM_ID = CompiledQuery(
+    rooms_accessibility_options_table.select()
+    .where(rooms_accessibility_options_table.c.room_id == bindparam("room_id"))
+)
 
 
 class RoomAccessibilityOptionRepository(IRoomAccessibilityOptionRepository):
@@ -65,13 +71,10 @@ class RoomAccessibilityOptionRepository(IRoomAccessibilityOptionRepository):
             RoomAccessibilityOption | None: The room accessibility option details if found
         """
 
-        query = (
-            rooms_accessibility_options_table.select()
-            .where(rooms_accessibility_options_table.c.room_id == room_id)
+        rooms_accessibility_options = await database.fetch_all(
+            ROOM_ACCESSIBILITY_OPTIONS_BY_ROOM_ID, {"room_id": room_id}
         )
 
-        rooms_accessibility_options = await database.fetch_all(query)
-
         return [RoomAccessibilityOption.from_record(rooms_accessibility_option) for rooms_accessibility_option in
                 rooms_accessibility_options]
 
@@ -112,8 +115,8 @@ class RoomAccessibilityOptionRepository(IRoomAccessibilityOptionRepository):
         if self._get_by_id(room_id, accessibility_option_id):
             query = (
                 rooms_accessibility_options_table.update()
-                .where(rooms_accessibility_options_table.c.room_id == room_id and
-                       rooms_accessibility_options_table.c.accessibility_option_id == accessibility_option_id)
+                .where(and_(rooms_accessibility_options_table.c.room_id == room_id,
+                            rooms_accessibility_options_table.c.accessibility_option_id == accessibility_option_id))
                 .values(**data.model_dump())
             )
             await database.execute(query)
@@ -139,8 +142,8 @@ class RoomAccessibilityOptionRepository(IRoomAccessibilityOptionRepository):
         if self._get_by_id(room_id, accessibility_option_id):
             query = rooms_accessibility_options_table \
                 .delete() \
-                .where(rooms_accessibility_options_table.c.room_id == room_id and
-                       rooms_accessibility_options_table.c.accessibility_option_id == accessibility_option_id)
+                .where(and_(rooms_accessibility_options_table.c.room_id == room_id,
+                            rooms_accessibility_options_table.c.accessibility_option_id == accessibility_option_id))
             await database.execute(query)
 
             return True
@@ -160,8 +163,8 @@ class RoomAccessibilityOptionRepository(IRoomAccessibilityOptionRepository):
 
         query = (
             rooms_accessibility_options_table.select()
-            .where(rooms_accessibility_options_table.c.room_id == room_id and
-                   rooms_accessibility_options_table.c.accessibility_option_id == accessibility_option_id)
+            .where(and_(rooms_accessibility_options_table.c.room_id == room_id,
+                        rooms_accessibility_options_table.c.accessibility_option_id == accessibility_option_id))
         )
 
         return await database.fetch_one(query)
@@ -5,13 +5,25 @@ Module containing room repository implementation.
 from typing import List
 
 from asyncpg import Record
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
 from hotel_management_system.core.repositories.i_room_repository import IRoomRepository
+from hotel_management_system.core.domains.accessibility_option import AccessibilityOption
 from hotel_management_system.core.domains.room import Room, RoomIn
 from hotel_management_system.db import (
+    accessibility_options_table,
+    rooms_accessibility_options_table,
     rooms_table,
     database,
+    in_array,
+    keyset_page,
+)
+from hotel_management_system.pool import CompiledQuery
+
+ROOM_BY_ID = CompiledQuery(
+    rooms_table.select()
+    .where(rooms_table.c.id == bindparam("room_id"))
+    .order_by(rooms_table.c.alias.asc())
 )
 
 
@@ -20,10 +32,17 @@ class RoomRepository(IRoomRepository):
     A class representing room DB repository.
     """
 
-    async def get_all_rooms(self) -> List[Room]:
+    async def get_all_rooms(self, after: int | None = None, limit: int | None = None) -> List[Room]:
         """
         Retrieve all rooms from the data storage.
 
+        Without a limit, every room is returned ordered by alias; with a limit,
+        the page following the `after` ID, ordered by ID.
+
+        Args:
+            after (int | None, optional): The ID of the last room of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of rooms. Defaults to None.
+
         Returns:
             List[Room]: A list of all rooms stored in the database.
         """
@@ -33,7 +52,7 @@ class RoomRepository(IRoomRepository):
             .order_by(rooms_table.c.alias.asc())
         )
 
-        rooms = await database.fetch_all(query)
+        rooms = await database.fetch_all(keyset_page(query, rooms_table.c.id, after, limit))
 
         return [Room.from_record(room) for room in rooms]
 
@@ -52,6 +71,55 @@ class RoomRepository(IRoomRepository):
 
         return Room.from_record(room) if room else None
 
+    async def get_existing_ids(self, room_ids: List[int]) -> List[int]:
+        """
+        Retrieve which of the given room IDs exist, with a single query.
+
+        Args:
+            room_ids (List[int]): The IDs of the rooms.
+
+        Returns:
+            List[int]: The IDs of the existing rooms.
+        """
+
+        query = (
+            select(rooms_table.c.id)
+            .where(in_array(rooms_table.c.id, room_ids))
+        )
+
+        return [record["id"] for record in await database.fetch_all(query)]
+
+    async def get_many_hydrated(self, room_ids: List[int]) -> List[Room]:
+        """
+        Retrieve rooms together with their accessibility options, with a fixed number of queries.
+
+        Args:
+            room_ids (List[int]): The IDs of the rooms.
+
+        Returns:
+            List[Room]: The found rooms.
+        """
+
+        query = (
+            select(rooms_table)
+            .where(in_array(rooms_table.c.id, room_ids))
+        )
+        rooms = {record["id"]: Room.from_record(record) for record in await database.fetch_all(query)}
+
+        query = (
+            select(
+                rooms_accessibility_options_table.c.room_id,
+                accessibility_options_table.c.id,
+                accessibility_options_table.c.name,
+            )
+            .select_from(rooms_accessibility_options_table.join(accessibility_options_table))
+            .where(in_array(rooms_accessibility_options_table.c.room_id, list(rooms)))
+        )
+        for record in await database.fetch_all(query):
+            rooms[record["room_id"]].accessibility_options.append(AccessibilityOption.from_record(record))
+
+        return list(rooms.values())
+
     async def add_room(self, data: RoomIn) -> Room | None:
         """
         Add a new room to the data storage.
@@ -128,10 +196,4 @@ class RoomRepository(IRoomRepository):
             Any | None: room record if exists.
         """
 
-        query = (
-            rooms_table.select()
-            .where(rooms_table.c.id == room_id)
-            .order_by(rooms_table.c.alias.asc())
-        )
-
-        return await database.fetch_one(query)
+        return await database.fetch_one(ROOM_BY_ID, {"room_id": room_id})
@@ -0,0 +1,69 @@
+"""
+Module containing unit of work implementation.
+"""
+
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, List
+
+from hotel_management_system.concurrency import serial_scope
+from hotel_management_system.core.repositories.i_unit_of_work import IUnitOfWork
+from hotel_management_system.db import database
+
+Callback = Callable[[], Awaitable[None]]
+
+_pending_callbacks: ContextVar[List[Callback] | None] = ContextVar("pending_callbacks", default=None)
+
+
+class UnitOfWork(IUnitOfWork):
+    """
+    A class implementing the unit of work over the `databases` transactions.
+
+    The transactions of `databases` are bound to the connection of the current task
+    and nest as savepoints, so the repositories join an open unit of work through
+    their own `database.transaction()` blocks without being passed a connection.
+    The lookups fanned out inside a unit of work are awaited one at a time, so they
+    stay on that connection as well.
+    """
+
+    @asynccontextmanager
+    async def begin(self) -> AsyncIterator[None]:
+        """
+        Open a unit of work, or a savepoint when one is already open.
+
+        Yields:
+            None: Control to the operation running inside the unit of work.
+        """
+
+        outer_callbacks = _pending_callbacks.get()
+        callbacks: List[Callback] = []
+        token = _pending_callbacks.set(callbacks)
+
+        try:
+            with serial_scope():
+                async with database.transaction():
+                    yield
+        finally:
+            _pending_callbacks.reset(token)
+
+        if outer_callbacks is not None:
+            outer_callbacks.extend(callbacks)
+            return
+
+        for callback in callbacks:
+            await callback()
+
+    async def on_commit(self, callback: Callback) -> None:
+        """
+        Defer a side effect outside the database until the unit of work commits.
+
+        Args:
+            callback (Callable[[], Awaitable[None]]): The coroutine function to run.
+        """
+
+        callbacks = _pending_callbacks.get()
+
+        if callbacks is None:
+            await callback()
+        else:
+            callbacks.append(callback)
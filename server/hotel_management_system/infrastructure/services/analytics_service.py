@@ -0,0 +1,147 @@
+"""
+Module containing analytics service implementation.
+"""
+
+from datetime import date
+from typing import List, Tuple
+
+import numpy as np
+
+from hotel_management_system.core.domains.analytics import (
+    EPOCH,
+    LengthOfStayBucket,
+    PerformanceSummary,
+    RoomStays,
+    RoomUtilization,
+)
+from hotel_management_system.core.repositories.i_analytics_repository import IAnalyticsRepository
+from hotel_management_system.core.services.i_analytics_service import IAnalyticsService
+
+
+class AnalyticsService(IAnalyticsService):
+    """
+    A class implementing the analytics service.
+
+    Every figure is computed with array operations over all the reserved rooms of the
+    period at once. The revenue of a reserved room is spread evenly over its nights, so
+    the part of a stay falling outside the period is not counted.
+    """
+
+    _repository: IAnalyticsRepository
+
+    def __init__(self, repository: IAnalyticsRepository) -> None:
+        """
+        The initializer of the `analytics service`.
+
+        Args:
+            repository (IAnalyticsRepository): The reference to the repository.
+        """
+
+        self._repository = repository
+
+    async def get_performance(self, start_date: date, end_date: date) -> PerformanceSummary:
+        """
+        Compute the occupancy rate, ADR and RevPAR of the nights between the provided start and end dates.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+
+        Returns:
+            PerformanceSummary: The indicators of the period.
+        """
+
+        stays = await self._repository.get_room_stays(start_date, end_date)
+        nights_sold = self._nights_sold(stays, start_date, end_date)
+
+        nights = np.maximum(stays.end_day - stays.start_day, 1)
+        revenue = float(np.dot(stays.revenue / nights, nights_sold))
+        room_nights_sold = int(nights_sold.sum())
+        room_nights_available = stays.room_ids.size * ((end_date - start_date).days + 1)
+
+        return PerformanceSummary(
+            room_nights_available=room_nights_available,
+            room_nights_sold=room_nights_sold,
+            revenue=revenue,
+            occupancy_rate=room_nights_sold / room_nights_available if room_nights_available else 0.0,
+            average_daily_rate=revenue / room_nights_sold if room_nights_sold else 0.0,
+            revenue_per_available_room=revenue / room_nights_available if room_nights_available else 0.0,
+        )
+
+    async def get_length_of_stay(self, start_date: date, end_date: date) -> List[LengthOfStayBucket]:
+        """
+        Count the reserved rooms arriving between the provided start and end dates by the number of nights.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+
+        Returns:
+            List[LengthOfStayBucket]: The non-empty buckets, ordered by the number of nights.
+        """
+
+        stays = await self._repository.get_room_stays(start_date, end_date)
+        first_day, last_day = self._day_numbers(start_date, end_date)
+
+        arriving = (stays.start_day >= first_day) & (stays.start_day <= last_day)
+        counts = np.bincount(stays.end_day[arriving] - stays.start_day[arriving])
+
+        return [
+            LengthOfStayBucket(nights=int(nights), reserved_rooms_count=int(counts[nights]))
+            for nights in np.flatnonzero(counts)
+        ]
+
+    async def get_room_utilization(self, start_date: date, end_date: date) -> List[RoomUtilization]:
+        """
+        Compute the share of the nights between the provided start and end dates each room was sold for.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+
+        Returns:
+            List[RoomUtilization]: The utilization of every room, ordered by room ID.
+        """
+
+        stays = await self._repository.get_room_stays(start_date, end_date)
+        room_ids = stays.room_ids
+        nights_sold = self._nights_sold(stays, start_date, end_date)
+
+        room_indexes = np.searchsorted(room_ids, stays.room_id)
+        nights_sold_per_room = np.bincount(room_indexes, weights=nights_sold, minlength=room_ids.size)
+        utilization = nights_sold_per_room / ((end_date - start_date).days + 1)
+
+        return [
+            RoomUtilization(room_id=int(room_id), nights_sold=int(room_nights), utilization=float(room_utilization))
+            for room_id, room_nights, room_utilization in zip(room_ids, nights_sold_per_room, utilization)
+        ]
+
+    def _nights_sold(self, stays: RoomStays, start_date: date, end_date: date) -> np.ndarray:
+        """A private method counting the nights of each reserved room falling between the provided dates.
+
+        Args:
+            stays (RoomStays): The reserved rooms.
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+
+        Returns:
+            np.ndarray: The number of nights in the period, one element per reserved room.
+        """
+
+        first_day, last_day = self._day_numbers(start_date, end_date)
+
+        return np.clip(np.minimum(stays.end_day, last_day + 1) - np.maximum(stays.start_day, first_day), 0, None)
+
+    @staticmethod
+    def _day_numbers(start_date: date, end_date: date) -> Tuple[int, int]:
+        """A private method converting a date range into the day numbers of the stay columns.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+
+        Returns:
+            Tuple[int, int]: The numbers of the first and the last day of the range.
+        """
+
+        return (start_date - EPOCH).days, (end_date - EPOCH).days
@@ -0,0 +1,272 @@
+"""
+Module containing availability service implementation.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Set, Tuple
+
+from hotel_management_system.core.repositories.i_reservation_room_repository import IReservationRoomRepository
+from hotel_management_system.core.services.i_availability_service import IAvailabilityService
+from hotel_management_system.pool import read_from_primary
+
+
+class _RoomCalendar:
+    """
+    The stays of a single room, sorted by start date.
+
+    Alongside the stays it keeps the running maximum of their end dates, so an overlap
+    check is a single binary search: a stay overlapping [start, end) exists iff some stay
+    starting before `end` finishes after `start`.
+
+    Adding or removing a stay updates the running maximum from its position only until
+    it matches the previous one, which is right away for the stays of a room that do not
+    overlap, so the cost is that of the list insertion or deletion.
+    """
+
+    __slots__ = ("_stays", "_starts", "_max_ends")
+
+    def __init__(self, stays: Iterable[Tuple[date, date, int]] = ()) -> None:
+        self._stays: List[Tuple[date, date, int]] = sorted(stays)
+        self._starts: List[date] = [stay[0] for stay in self._stays]
+        self._max_ends: List[date] = []
+
+        for _, end_date, _ in self._stays:
+            self._max_ends.append(max(end_date, self._max_ends[-1]) if self._max_ends else end_date)
+
+    def __bool__(self) -> bool:
+        return bool(self._stays)
+
+    def add(self, start_date: date, end_date: date, reservation_id: int) -> None:
+        stay = (start_date, end_date, reservation_id)
+        index = bisect_left(self._stays, stay)
+
+        self._stays.insert(index, stay)
+        self._starts.insert(index, start_date)
+        self._max_ends.insert(index, max(end_date, self._max_ends[index - 1]) if index else end_date)
+
+        for later in range(index + 1, len(self._max_ends)):
+            if self._max_ends[later] >= end_date:
+                break
+
+            self._max_ends[later] = end_date
+
+    def remove(self, start_date: date, end_date: date, reservation_id: int) -> None:
+        index = bisect_left(self._stays, (start_date, end_date, reservation_id))
+
+        if index == len(self._stays) or self._stays[index] != (start_date, end_date, reservation_id):
+            return
+
+        del self._stays[index], self._starts[index], self._max_ends[index]
+
+        for later in range(index, len(self._max_ends)):
+            max_end = max(self._stays[later][1], self._max_ends[later - 1]) if later else self._stays[later][1]
+
+            if self._max_ends[later] == max_end:
+                break
+
+            self._max_ends[later] = max_end
+
+    def is_free(self, start_date: date, end_date: date) -> bool:
+        index = bisect_left(self._starts, end_date) - 1
+
+        return index < 0 or self._max_ends[index] <= start_date
+
+
+class AvailabilityService(IAvailabilityService):
+    """
+    A class implementing the in-memory room availability index.
+
+    The index is built once by `load` and kept current by the reservation and
+    reservation_room services, and by `reload_reservations` for the changes other
+    workers announce on the invalidation bus. It answers availability pre-checks without
+    touching the database; the room_occupancy exclusion constraint remains the authority.
+    """
+
+    _repository: IReservationRoomRepository
+    _stays: Dict[int, Tuple[date, date]]
+    _reservation_rooms: Dict[int, Set[int]]
+    _calendars: Dict[int, _RoomCalendar]
+
+    def __init__(self, repository: IReservationRoomRepository) -> None:
+        """
+        The initializer of the `availability service`.
+
+        Args:
+            repository (IReservationRoomRepository): The reference to the reservation_room repository.
+        """
+
+        self._repository = repository
+        self._stays = {}
+        self._reservation_rooms = defaultdict(set)
+        self._calendars = {}
+
+    async def load(self) -> None:
+        """
+        Rebuild the availability index from the primary of the data storage.
+        """
+
+        stays = {}
+        reservation_rooms = defaultdict(set)
+        room_stays = defaultdict(list)
+
+        with read_from_primary():
+            room_occupancies = await self._repository.get_all_room_occupancies()
+
+        for room_occupancy in room_occupancies:
+            stays[room_occupancy.reservation_id] = (room_occupancy.start_date, room_occupancy.end_date)
+            reservation_rooms[room_occupancy.reservation_id].add(room_occupancy.room_id)
+            room_stays[room_occupancy.room_id].append(
+                (room_occupancy.start_date, room_occupancy.end_date, room_occupancy.reservation_id)
+            )
+
+        self._stays = stays
+        self._reservation_rooms = reservation_rooms
+        self._calendars = {room_id: _RoomCalendar(room_stay) for room_id, room_stay in room_stays.items()}
+
+    async def reload_reservations(self, reservation_ids: List[int] | None = None) -> None:
+        """
+        Reload the stays of the specified reservations, changed by another worker, from the primary.
+
+        The change is announced on commit, possibly before a replica has applied it.
+
+        Args:
+            reservation_ids (List[int] | None, optional): The IDs of the reservations.
+                Defaults to None, rebuilding the whole index.
+        """
+
+        if reservation_ids is None:
+            await self.load()
+            return
+
+        with read_from_primary():
+            room_occupancies = await self._repository.get_room_occupancies_by_reservation_ids(reservation_ids)
+
+        for reservation_id in reservation_ids:
+            await self.remove_reservation(reservation_id)
+
+        for room_occupancy in room_occupancies:
+            await self.set_reservation(
+                room_occupancy.reservation_id,
+                room_occupancy.start_date,
+                room_occupancy.end_date,
+            )
+            await self.add_room(room_occupancy.reservation_id, room_occupancy.room_id)
+
+    async def set_reservation(self, reservation_id: int, start_date: date, end_date: date) -> None:
+        """
+        Register a reservation's stay or move it to new dates.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+            start_date (date): The first night of the stay.
+            end_date (date): The departure date, exclusive.
+        """
+
+        if self._stays.get(reservation_id) == (start_date, end_date):
+            return
+
+        for room_id in self._reservation_rooms.get(reservation_id, ()):
+            self._unindex(reservation_id, room_id)
+
+        self._stays[reservation_id] = (start_date, end_date)
+
+        for room_id in self._reservation_rooms.get(reservation_id, ()):
+            self._index(reservation_id, room_id)
+
+    async def remove_reservation(self, reservation_id: int) -> None:
+        """
+        Release every room held by a reservation.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+        """
+
+        for room_id in self._reservation_rooms.pop(reservation_id, ()):
+            self._unindex(reservation_id, room_id)
+
+        self._stays.pop(reservation_id, None)
+
+    async def add_room(self, reservation_id: int, room_id: int) -> None:
+        """
+        Mark a room as held by a reservation.
+
+        A reservation without rooms when the index was loaded has no stay yet,
+        so its dates are fetched from the primary with its first room.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+            room_id (int): The ID of the room.
+        """
+
+        if reservation_id not in self._stays:
+            with read_from_primary():
+                room_occupancies = await self._repository.get_room_occupancies_by_reservation_ids([reservation_id])
+
+            for room_occupancy in room_occupancies:
+                self._stays.setdefault(reservation_id, (room_occupancy.start_date, room_occupancy.end_date))
+
+        if room_id in self._reservation_rooms[reservation_id]:
+            return
+
+        self._reservation_rooms[reservation_id].add(room_id)
+        self._index(reservation_id, room_id)
+
+    async def remove_room(self, reservation_id: int, room_id: int) -> None:
+        """
+        Release a room held by a reservation.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+            room_id (int): The ID of the room.
+        """
+
+        if room_id not in self._reservation_rooms.get(reservation_id, ()):
+            return
+
+        self._reservation_rooms[reservation_id].discard(room_id)
+        self._unindex(reservation_id, room_id)
+
+    async def get_free_room_ids(self, room_ids: Iterable[int], start_date: date, end_date: date) -> List[int]:
+        """
+        Filter the rooms that have no stay overlapping [start_date, end_date).
+
+        Args:
+            room_ids (Iterable[int]): The IDs of the candidate rooms.
+            start_date (date): The first night of the period.
+            end_date (date): The end of the period, exclusive.
+
+        Returns:
+            List[int]: The IDs of the free rooms, in the order they were given.
+        """
+
+        return [
+            room_id for room_id in room_ids
+            if room_id not in self._calendars or self._calendars[room_id].is_free(start_date, end_date)
+        ]
+
+    def _index(self, reservation_id: int, room_id: int) -> None:
+        """A private method adding a reservation's stay to a room calendar.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+            room_id (int): The ID of the room.
+        """
+
+        if stay := self._stays.get(reservation_id):
+            self._calendars.setdefault(room_id, _RoomCalendar()).add(stay[0], stay[1], reservation_id)
+
+    def _unindex(self, reservation_id: int, room_id: int) -> None:
+        """A private method removing a reservation's stay from a room calendar.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+            room_id (int): The ID of the room.
+        """
+
+        if (calendar := self._calendars.get(room_id)) and (stay := self._stays.get(reservation_id)):
+            calendar.remove(stay[0], stay[1], reservation_id)
+
+            if not calendar:
+                del self._calendars[room_id]
@@ -2,12 +2,17 @@
 Module containing bill service implementation.
 """
 
-from typing import List
+from typing import Collection, List
 
-from hotel_management_system.core.domains.bill import Bill, BillIn
+from hotel_management_system.concurrency import gather_bounded
+from hotel_management_system.core.domains.bill import Bill, BillExpansion, BillIn
+from hotel_management_system.core.domains.reservation import Reservation
 from hotel_management_system.core.repositories.i_bill_repository import IBillRepository
+from hotel_management_system.core.repositories.i_daily_stats_repository import IDailyStatsRepository
 from hotel_management_system.core.repositories.i_pricing_detail_repository import IPricingDetailRepository
+from hotel_management_system.core.repositories.i_unit_of_work import IUnitOfWork
 from hotel_management_system.core.services.i_bill_service import IBillService
+from hotel_management_system.loader import DataLoader
 
 
 class BillService(IBillService):
@@ -17,10 +22,16 @@ class BillService(IBillService):
 
     _bill_repository: IBillRepository
     _pricing_detail_repository: IPricingDetailRepository
+    _daily_stats_repository: IDailyStatsRepository
+    _unit_of_work: IUnitOfWork
+    _reservation_loader: DataLoader[Reservation]
 
     def __init__(self,
                  bill_repository: IBillRepository,
                  pricing_detail_repository: IPricingDetailRepository,
+                 daily_stats_repository: IDailyStatsRepository,
+                 unit_of_work: IUnitOfWork,
+                 reservation_loader: DataLoader[Reservation],
                  ) -> None:
         """
         The initializer of the `bill service`.
@@ -28,22 +39,42 @@ class BillService(IBillService):
         Args:
             bill_repository (IBillRepository): The reference to the bill repository
             pricing_detail_repository (IPricingDetailRepository): The reference to the pricing_detail repository
+            daily_stats_repository (IDailyStatsRepository): The reference to the daily_stats repository
+            unit_of_work (IUnitOfWork): The reference to the unit of work
+            reservation_loader (DataLoader[Reservation]): The reference to the reservation loader
         """
 
         self._bill_repository = bill_repository
         self._pricing_detail_repository = pricing_detail_repository
+        self._daily_stats_repository = daily_stats_repository
+        self._unit_of_work = unit_of_work
+        self._reservation_loader = reservation_loader
 
-    async def get_all(self) -> List[Bill]:
+    async def get_all(
+            self,
+            after: int | None = None,
+            limit: int | None = None,
+            expand: Collection[BillExpansion] = ("pricing_detail",),
+    ) -> List[Bill]:
         """
         Retrieve all bills from the data storage.
 
+        Args:
+            after (int | None, optional): The reservation ID of the last bills of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of reservations whose bills are returned.
+                Defaults to None, meaning all of them.
+            expand (Collection[BillExpansion], optional): The nested data to include. Defaults to all of it.
+
         Returns:
             List[Bill]: A list of all bills in the data storage.
         """
 
-        all_bills = await self._bill_repository.get_all_bills()
+        all_bills = await self._bill_repository.get_all_bills(after, limit)
+
+        if "pricing_detail" not in expand:
+            return all_bills
 
-        return [await self.parse_bill(bill) for bill in all_bills]
+        return await gather_bounded(*(self.parse_bill(bill) for bill in all_bills))
 
     async def get_by_id(self, room_id: int, pricing_detail_id: int) -> Bill | None:
         """
@@ -74,7 +105,7 @@ class BillService(IBillService):
 
         all_bills = await self._bill_repository.get_by_room_id(room_id)
 
-        return [await self.parse_bill(bill) for bill in all_bills]
+        return await gather_bounded(*(self.parse_bill(bill) for bill in all_bills))
 
     async def get_by_pricing_detail_id(self, pricing_detail_id: int) -> List[Bill] | None:
         """
@@ -89,7 +120,7 @@ class BillService(IBillService):
 
         all_bills = await self._bill_repository.get_by_pricing_detail_id(pricing_detail_id)
 
-        return [await self.parse_bill(bill) for bill in all_bills]
+        return await gather_bounded(*(self.parse_bill(bill) for bill in all_bills))
 
     async def get_by_reservation_id(self, reservation_id: int) -> List[Bill] | None:
         """
@@ -104,7 +135,7 @@ class BillService(IBillService):
 
         all_bills = await self._bill_repository.get_by_reservation_id(reservation_id)
 
-        return [await self.parse_bill(bill) for bill in all_bills]
+        return await gather_bounded(*(self.parse_bill(bill) for bill in all_bills))
 
     async def add_bill(self, data: BillIn) -> Bill | None:
         """
@@ -117,9 +148,14 @@ class BillService(IBillService):
             Bill | None: The newly added bill, or None if the operation fails.
         """
 
-        return await self.parse_bill(
-            await self._bill_repository.add_bill(data)
-        )
+        async with self._unit_of_work.begin():
+            new_bill = await self._bill_repository.add_bill(data)
+
+            if new_bill:
+                await self._daily_stats_repository.add_bill(data)
+                self._reservation_loader.clear(data.reservation_id)
+
+        return await self.parse_bill(new_bill)
 
     async def update_bill(
             self,
@@ -139,13 +175,27 @@ class BillService(IBillService):
             Bill | None: The updated bill details, or None if not found.
         """
 
-        return await self.parse_bill(
-            await self._bill_repository.update_bill(
+        old_bill = await self._bill_repository.get_by_id(room_id, pricing_detail_id)
+        affected_reservation_ids = {data.reservation_id}
+
+        if old_bill:
+            affected_reservation_ids.add(old_bill.reservation_id)
+
+        async with self._unit_of_work.begin():
+            for reservation_id in affected_reservation_ids:
+                await self._daily_stats_repository.remove_bills(reservation_id)
+
+            updated_bill = await self._bill_repository.update_bill(
                 room_id=room_id,
                 pricing_detail_id=pricing_detail_id,
                 data=data,
             )
-        )
+
+            for reservation_id in affected_reservation_ids:
+                await self._daily_stats_repository.add_bills(reservation_id)
+                self._reservation_loader.clear(reservation_id)
+
+        return await self.parse_bill(updated_bill)
 
     async def delete_bill_by_reservation_id(self, reservation_id: int) -> bool:
         """
@@ -158,7 +208,11 @@ class BillService(IBillService):
             bool: True if the operation is successful, False otherwise.
         """
 
-        return await self._bill_repository.delete_bill_by_reservation_id(reservation_id)
+        async with self._unit_of_work.begin():
+            await self._daily_stats_repository.remove_bills(reservation_id)
+            self._reservation_loader.clear(reservation_id)
+
+            return await self._bill_repository.delete_bill_by_reservation_id(reservation_id)
 
     async def parse_bill(self, bill: Bill) -> Bill:
         if bill:
@@ -0,0 +1,239 @@
+"""
+Module containing export service implementation.
+"""
+
+import csv
+import io
+import json
+from datetime import date
+from typing import Any, AsyncIterator, Dict, Tuple
+
+from hotel_management_system.core.domains.export import ExportFormat
+from hotel_management_system.core.repositories.i_bill_repository import IBillRepository
+from hotel_management_system.core.repositories.i_invoice_repository import IInvoiceRepository
+from hotel_management_system.core.repositories.i_reservation_repository import IReservationRepository
+from hotel_management_system.core.services.i_export_service import IExportService
+
+RESERVATION_COLUMNS = ("id", "guest_id", "start_date", "end_date", "number_of_guests")
+BILL_COLUMNS = ("reservation_id", "room_id", "pricing_detail_id", "pricing_detail_name", "price")
+INVOICE_COLUMNS = ("id", "date_of_issue", "first_name", "last_name", "address", "nip", "reservation_id", "total_sum")
+
+
+class ExportService(IExportService):
+    """
+    A class implementing the export service.
+
+    Rows are encoded as the repositories stream them and flushed every `chunk_size` rows,
+    so an export holds a single chunk in memory however large it is.
+    """
+
+    _reservation_repository: IReservationRepository
+    _bill_repository: IBillRepository
+    _invoice_repository: IInvoiceRepository
+    _chunk_size: int
+
+    def __init__(self,
+                 reservation_repository: IReservationRepository,
+                 bill_repository: IBillRepository,
+                 invoice_repository: IInvoiceRepository,
+                 chunk_size: int,
+                 ) -> None:
+        """
+        The initializer of the `export service`.
+
+        Args:
+            reservation_repository (IReservationRepository): The reference to the reservation repository
+            bill_repository (IBillRepository): The reference to the bill repository
+            invoice_repository (IInvoiceRepository): The reference to the invoice repository
+            chunk_size (int): The number of rows encoded into a single chunk
+        """
+
+        self._reservation_repository = reservation_repository
+        self._bill_repository = bill_repository
+        self._invoice_repository = invoice_repository
+        self._chunk_size = chunk_size
+
+    def export_reservations(
+            self,
+            export_format: ExportFormat,
+            start_date: date | None = None,
+            end_date: date | None = None,
+            guest_id: int | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Encode the reservations starting in a date range, chunk by chunk, as they are read.
+
+        Args:
+            export_format (ExportFormat): The format of the export.
+            start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+            end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+            guest_id (int | None, optional): The ID of the guest to restrict the reservations to. Defaults to None.
+
+        Yields:
+            str: The next chunk of the export.
+        """
+
+        return self._encode(
+            self._reservation_rows(start_date, end_date, guest_id),
+            RESERVATION_COLUMNS,
+            export_format,
+        )
+
+    def export_bills(
+            self,
+            export_format: ExportFormat,
+            start_date: date | None = None,
+            end_date: date | None = None,
+            guest_id: int | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Encode the bills of the reservations starting in a date range, chunk by chunk, as they are read.
+
+        Args:
+            export_format (ExportFormat): The format of the export.
+            start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+            end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+            guest_id (int | None, optional): The ID of the guest to restrict the bills to. Defaults to None.
+
+        Yields:
+            str: The next chunk of the export.
+        """
+
+        return self._encode(
+            self._bill_rows(start_date, end_date, guest_id),
+            BILL_COLUMNS,
+            export_format,
+        )
+
+    def export_invoices(
+            self,
+            export_format: ExportFormat,
+            start_date: date | None = None,
+            end_date: date | None = None,
+            guest_id: int | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Encode the invoices issued in a date range, chunk by chunk, as they are read.
+
+        Args:
+            export_format (ExportFormat): The format of the export.
+            start_date (date | None, optional): The first day of the range. Defaults to None, meaning unbounded.
+            end_date (date | None, optional): The last day of the range, inclusive. Defaults to None, meaning unbounded.
+            guest_id (int | None, optional): The ID of the guest to restrict the invoices to. Defaults to None.
+
+        Yields:
+            str: The next chunk of the export.
+        """
+
+        return self._encode(
+            self._invoice_rows(start_date, end_date, guest_id),
+            INVOICE_COLUMNS,
+            export_format,
+        )
+
+    async def _reservation_rows(
+            self,
+            start_date: date | None,
+            end_date: date | None,
+            guest_id: int | None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """A private method flattening the streamed reservations into export rows.
+
+        Args:
+            start_date (date | None): The first day of the range.
+            end_date (date | None): The last day of the range, inclusive.
+            guest_id (int | None): The ID of the guest to restrict the reservations to.
+
+        Yields:
+            Dict[str, Any]: The JSON-compatible row of a reservation.
+        """
+
+        async for reservation in self._reservation_repository.iterate_reservations(start_date, end_date, guest_id):
+            yield reservation.model_dump(mode="json", include=set(RESERVATION_COLUMNS))
+
+    async def _bill_rows(
+            self,
+            start_date: date | None,
+            end_date: date | None,
+            guest_id: int | None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """A private method flattening the streamed bills into export rows.
+
+        Args:
+            start_date (date | None): The first day of the range.
+            end_date (date | None): The last day of the range, inclusive.
+            guest_id (int | None): The ID of the guest to restrict the bills to.
+
+        Yields:
+            Dict[str, Any]: The JSON-compatible row of a bill.
+        """
+
+        async for bill in self._bill_repository.iterate_bills(start_date, end_date, guest_id):
+            yield {
+                "reservation_id": bill.reservation_id,
+                "room_id": bill.room_id,
+                "pricing_detail_id": bill.pricing_detail_id,
+                "pricing_detail_name": bill.pricing_detail.name,
+                "price": bill.pricing_detail.price,
+            }
+
+    async def _invoice_rows(
+            self,
+            start_date: date | None,
+            end_date: date | None,
+            guest_id: int | None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """A private method flattening the streamed invoices into export rows.
+
+        Args:
+            start_date (date | None): The first day of the range.
+            end_date (date | None): The last day of the range, inclusive.
+            guest_id (int | None): The ID of the guest to restrict the invoices to.
+
+        Yields:
+            Dict[str, Any]: The JSON-compatible row of an invoice.
+        """
+
+        async for invoice in self._invoice_repository.iterate_invoices(start_date, end_date, guest_id):
+            yield invoice.model_dump(mode="json", include=set(INVOICE_COLUMNS))
+
+    async def _encode(
+            self,
+            rows: AsyncIterator[Dict[str, Any]],
+            columns: Tuple[str, ...],
+            export_format: ExportFormat,
+    ) -> AsyncIterator[str]:
+        """A private method encoding rows as NDJSON lines or CSV records, in chunks of `chunk_size` rows.
+
+        Args:
+            rows (AsyncIterator[Dict[str, Any]]): The rows to encode.
+            columns (Tuple[str, ...]): The columns of the rows, in the order of the CSV header.
+            export_format (ExportFormat): The format of the export.
+
+        Yields:
+            str: The next chunk of the export.
+        """
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns)
+        count = 0
+
+        if export_format == "csv":
+            writer.writeheader()
+
+        async for row in rows:
+            if export_format == "csv":
+                writer.writerow(row)
+            else:
+                buffer.write(json.dumps(row))
+                buffer.write("\n")
+
+            count += 1
+
+            if count % self._chunk_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue()
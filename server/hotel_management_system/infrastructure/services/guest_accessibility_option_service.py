@@ -4,27 +4,48 @@ Module containing guest_accessibility_option service implementation.
 
 from typing import List
 
+from hotel_management_system.core.domains.guest import Guest
 from hotel_management_system.core.domains.guest_accessibility_option import GuestAccessibilityOption, GuestAccessibilityOptionIn
+from hotel_management_system.core.repositories.i_daily_stats_repository import IDailyStatsRepository
 from hotel_management_system.core.repositories.i_guest_accessibility_option_repository import IGuestAccessibilityOptionRepository
+from hotel_management_system.core.repositories.i_unit_of_work import IUnitOfWork
 from hotel_management_system.core.services.i_guest_accessibility_option_service import IGuestAccessibilityOptionService
+from hotel_management_system.loader import DataLoader
 
 
 class GuestAccessibilityOptionService(IGuestAccessibilityOptionService):
     """
     A class implementing the guest_accessiblity_option service.
+
+    Every write moves the reservations of the affected guests in the accessibility counter
+    of the daily stats, as a guest counts there once they have any accessibility option.
     """
 
     _repository: IGuestAccessibilityOptionRepository
+    _daily_stats_repository: IDailyStatsRepository
+    _unit_of_work: IUnitOfWork
+    _guest_loader: DataLoader[Guest]
 
-    def __init__(self, repository: IGuestAccessibilityOptionRepository) -> None:
+    def __init__(self,
+                 repository: IGuestAccessibilityOptionRepository,
+                 daily_stats_repository: IDailyStatsRepository,
+                 unit_of_work: IUnitOfWork,
+                 guest_loader: DataLoader[Guest],
+                 ) -> None:
         """
         The initializer of the `guest_accessibility_option service`.
 
         Args:
             repository (IGuestAccessibilityOptionRepository): The reference to the repository.
+            daily_stats_repository (IDailyStatsRepository): The reference to the daily_stats repository
+            unit_of_work (IUnitOfWork): The reference to the unit of work
+            guest_loader (DataLoader[Guest]): The reference to the guest loader.
         """
 
         self._repository = repository
+        self._daily_stats_repository = daily_stats_repository
+        self._unit_of_work = unit_of_work
+        self._guest_loader = guest_loader
 
     async def get_all(self) -> List[GuestAccessibilityOption]:
         """
@@ -87,7 +108,14 @@ class GuestAccessibilityOptionService(IGuestAccessibilityOptionService):
             GuestAccessibilityOption | None: The newly added guest accessibility option, or None if the operation fails.
         """
 
-        return await self._repository.add_guest_accessibility_option(data)
+        async with self._unit_of_work.begin():
+            await self._daily_stats_repository.remove_guest_accessibilities([data.guest_id])
+            new_guest_accessibility_option = await self._repository.add_guest_accessibility_option(data)
+            await self._daily_stats_repository.add_guest_accessibilities([data.guest_id])
+
+        self._guest_loader.clear(data.guest_id)
+
+        return new_guest_accessibility_option
 
     async def update_guest_accessibility_option(
             self,
@@ -107,11 +135,21 @@ class GuestAccessibilityOptionService(IGuestAccessibilityOptionService):
             GuestAccessibilityOption | None: The updated guest accessibility option, or None if not found.
         """
 
-        return await self._repository.update_guest_accessibility_option(
-            guest_id=guest_id,
-            accessibility_option_id=accessibility_option_id,
-            data=data,
-        )
+        guest_ids = list({guest_id, data.guest_id})
+
+        async with self._unit_of_work.begin():
+            await self._daily_stats_repository.remove_guest_accessibilities(guest_ids)
+            updated_guest_accessibility_option = await self._repository.update_guest_accessibility_option(
+                guest_id=guest_id,
+                accessibility_option_id=accessibility_option_id,
+                data=data,
+            )
+            await self._daily_stats_repository.add_guest_accessibilities(guest_ids)
+
+        self._guest_loader.clear(guest_id)
+        self._guest_loader.clear(data.guest_id)
+
+        return updated_guest_accessibility_option
 
     async def delete_guest_accessibility_option(self, guest_id: int, accessibility_option_id: int) -> bool:
         """
@@ -125,5 +163,11 @@ class GuestAccessibilityOptionService(IGuestAccessibilityOptionService):
             bool: True if the operation is successful, False otherwise.
         """
 
+        async with self._unit_of_work.begin():
+            await self._daily_stats_repository.remove_guest_accessibilities([guest_id])
+            deleted = await self._repository.delete_guest_accessibility_option(guest_id, accessibility_option_id)
+            await self._daily_stats_repository.add_guest_accessibilities([guest_id])
+
+        self._guest_loader.clear(guest_id)
 
-        return await self._repository.delete_guest_accessibility_option(guest_id, accessibility_option_id)
+        return deleted
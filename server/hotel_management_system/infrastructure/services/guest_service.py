@@ -2,13 +2,15 @@
 Module containing guest service implementation.
 """
 
-from typing import Iterable, List
+from typing import Collection, Iterable, List
 
-from hotel_management_system.core.domains.guest import Guest, GuestIn
+from hotel_management_system.concurrency import gather_bounded
+from hotel_management_system.core.domains.guest import Guest, GuestExpansion, GuestIn, GuestSearchMode
 from hotel_management_system.core.repositories.i_guest_repository import IGuestRepository
 from hotel_management_system.core.services.i_accessibility_option_service import IAccessibilityOptionService
 from hotel_management_system.core.services.i_guest_accessibility_option_service import IGuestAccessibilityOptionService
 from hotel_management_system.core.services.i_guest_service import IGuestService
+from hotel_management_system.loader import DataLoader
 
 
 class GuestService(IGuestService):
@@ -19,11 +21,13 @@ class GuestService(IGuestService):
     _guest_repository: IGuestRepository
     _accessibility_option_repository: IAccessibilityOptionService
     _guest_accessibility_option_repository: IGuestAccessibilityOptionService
+    _guest_loader: DataLoader[Guest]
 
     def __init__(self,
                  guest_repository: IGuestRepository,
                  accessibility_option_repository: IAccessibilityOptionService,
                  guest_accessibility_option_repository: IGuestAccessibilityOptionService,
+                 guest_loader: DataLoader[Guest],
                  ) -> None:
         """
         The initializer of the `guest service`.
@@ -34,28 +38,49 @@ class GuestService(IGuestService):
                                                                                 accessibility_option repository
             guest_accessibility_option_repository (IGuestAccessibilityOptionService): The reference to the
                                                                                 guest_accessibility_option repository
+            guest_loader (DataLoader[Guest]): The reference to the guest loader
         """
 
         self._guest_repository = guest_repository
         self._accessibility_option_repository = accessibility_option_repository
         self._guest_accessibility_option_repository = guest_accessibility_option_repository
+        self._guest_loader = guest_loader
 
-    async def get_all(self) -> List[Guest]:
+    async def get_all(
+            self,
+            after: int | None = None,
+            limit: int | None = None,
+            expand: Collection[GuestExpansion] = ("accessibility_options",),
+    ) -> List[Guest]:
         """
         Retrieve all guests from the data storage.
 
+        The expanded guests are loaded in a single batch rather than one by one.
+
+        Args:
+            after (int | None, optional): The ID of the last guest of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of guests. Defaults to None, meaning all of them.
+            expand (Collection[GuestExpansion], optional): The nested data to include. Defaults to all of it.
+
         Returns:
             List[Guest]: A list of all guests.
         """
 
-        all_guests = await self._guest_repository.get_all_guests()
+        all_guests = await self._guest_repository.get_all_guests(after, limit)
 
-        return [await self.parse_guest(guest) for guest in all_guests]
+        if "accessibility_options" not in expand:
+            return all_guests
+
+        guests = await self._guest_loader.load_many([guest.id for guest in all_guests])
+
+        return [guest for guest in guests if guest]
 
     async def get_by_id(self, guest_id: int) -> Guest | None:
         """
         Retrieve a guest by their unique ID.
 
+        The guest is loaded at most once per request, batched with the concurrent lookups.
+
         Args:
             guest_id (int): The ID of the guest.
 
@@ -63,9 +88,7 @@ class GuestService(IGuestService):
             Guest | None: The details of the guest if found, or None if not found.
         """
 
-        return await self.parse_guest(
-            await self._guest_repository.get_by_id(guest_id)
-        )
+        return await self._guest_loader.load(guest_id)
 
     async def get_by_first_name(self, first_name: str) -> List[Guest] | None:
         """
@@ -80,9 +103,7 @@ class GuestService(IGuestService):
 
         guests = await self._guest_repository.get_by_first_name(first_name)
 
-        return [
-            await self.parse_guest(guest) for guest in guests
-        ]
+        return await gather_bounded(*(self.parse_guest(guest) for guest in guests))
 
     async def get_by_last_name(self, last_name: str) -> List[Guest] | None:
         """
@@ -97,26 +118,27 @@ class GuestService(IGuestService):
 
         guests = await self._guest_repository.get_by_last_name(last_name)
 
-        return [
-            await self.parse_guest(guest) for guest in guests
-        ]
+        return await gather_bounded(*(self.parse_guest(guest) for guest in guests))
 
-    async def get_by_needle_in_name(self, needle: str) -> List[Guest] | None:
+    async def search(self, needle: str, mode: GuestSearchMode = "similar", limit: int = 20) -> List[Guest]:
         """
-        Search for guests whose names contain a specific substring.
+        Search for guests by their name, email, phone number or city, best matches first.
+
+        The found guests are loaded with their accessibility options in a single batch.
 
         Args:
-            needle (str): A substring to search for within guest names.
+            needle (str): The text to search for.
+            mode (GuestSearchMode, optional): Whether to match similar words or word prefixes. Defaults to "similar".
+            limit (int, optional): The maximum number of guests. Defaults to 20.
 
         Returns:
-            List[Guest] | None: A list of guests whose names contain the substring, or None if no match is found.
+            List[Guest]: The matching guests, ordered by their similarity to the needle.
         """
 
-        guests = await self._guest_repository.get_by_needle_in_name(needle)
+        found_guests = await self._guest_repository.search(needle, mode, limit)
+        guests = await self._guest_loader.load_many([guest.id for guest in found_guests])
 
-        return [
-            await self.parse_guest(guest) for guest in guests
-        ]
+        return [guest for guest in guests if guest]
 
     async def add_guest(self, data: GuestIn) -> Guest | None:
         """
@@ -149,12 +171,33 @@ class GuestService(IGuestService):
             Guest | None: The updated guest details, or None if the guest is not found.
         """
 
-        return await self.parse_guest(
-            await self._guest_repository.update_guest(
-                guest_id=guest_id,
-                data=data,
-            )
+        updated_guest = await self._guest_repository.update_guest(
+            guest_id=guest_id,
+            data=data,
         )
+        self._guest_loader.clear(guest_id)
+
+        return await self.parse_guest(updated_guest)
+
+    async def delete_guests(self, guest_ids: List[int]) -> List[int]:
+        """
+        Remove guests along with their accessibility options, with one statement per table.
+
+        The guests must no longer have reservations.
+
+        Args:
+            guest_ids (List[int]): The IDs of the guests to remove.
+
+        Returns:
+            List[int]: The IDs of the removed guests.
+        """
+
+        deleted_guest_ids = await self._guest_repository.delete_guests(guest_ids)
+
+        for guest_id in deleted_guest_ids:
+            self._guest_loader.clear(guest_id)
+
+        return deleted_guest_ids
 
     async def delete_guest(self, guest_id: int) -> bool:
         """
@@ -167,18 +210,18 @@ class GuestService(IGuestService):
             bool: True if the operation is successful, False otherwise.
         """
 
-        return await self._guest_repository.delete_guest(guest_id)
+        deleted = await self._guest_repository.delete_guest(guest_id)
+        self._guest_loader.clear(guest_id)
+
+        return deleted
 
     async def parse_guest(self, guest: Guest) -> Guest:
         if guest:
-            accessibility_options = []
-
             guest_accessibility_options = await self._guest_accessibility_option_repository.get_by_guest_id(guest.id)
 
-            for guest_accessibility_option in guest_accessibility_options:
-                accessibility_option = await self._accessibility_option_repository.get_by_id(guest_accessibility_option.accessibility_option_id)
-                accessibility_options.append(accessibility_option)
-
-            guest.accessibility_options = accessibility_options
+            guest.accessibility_options = await gather_bounded(*(
+                self._accessibility_option_repository.get_by_id(guest_accessibility_option.accessibility_option_id)
+                for guest_accessibility_option in guest_accessibility_options
+            ))
 
         return guest
@@ -0,0 +1,192 @@
+"""
+Module containing invalidation bus implementation.
+"""
+
+import asyncio
+import json
+import uuid
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Set
+
+import asyncpg
+from sqlalchemy import func, select
+
+from hotel_management_system.cache import caches
+from hotel_management_system.core.services.i_invalidation_bus import IInvalidationBus
+from hotel_management_system.db import database
+
+Handler = Callable[[Any], Awaitable[None]]
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more.
+MAX_PAYLOAD_SIZE = 7900
+
+
+class InvalidationBus(IInvalidationBus):
+    """
+    A class implementing the invalidation bus over PostgreSQL LISTEN/NOTIFY.
+
+    Events are sent with `pg_notify` on the connection of the current transaction, so
+    PostgreSQL delivers them only once it commits. Each worker listens on a dedicated
+    asyncpg connection. A topic named after a registered `TTLCache` evicts that cache
+    without an explicit subscription. After a lost connection every topic is evicted
+    in full, as the events sent in the meantime are gone.
+    """
+
+    _dsn: str
+    _channel: str
+    _reconnect_delay: float
+    _origin: str
+    _handlers: Dict[str, List[Handler]]
+    _connection: asyncpg.Connection | None
+    _listener: asyncio.Task | None
+    _dispatches: Set[asyncio.Task]
+
+    def __init__(self, dsn: str, channel: str, reconnect_delay: float) -> None:
+        """
+        The initializer of the `invalidation bus`.
+
+        Args:
+            dsn (str): The asyncpg connection string of the DB.
+            channel (str): The name of the notification channel.
+            reconnect_delay (float): Delay between the attempts to restore the listening connection, in seconds.
+        """
+
+        self._dsn = dsn
+        self._channel = channel
+        self._reconnect_delay = reconnect_delay
+        self._origin = uuid.uuid4().hex
+        self._handlers = defaultdict(list)
+        self._connection = None
+        self._listener = None
+        self._dispatches = set()
+
+    def subscribe(self, topic: str, handler: Handler) -> None:
+        """
+        Register a handler evicting the in-process state of a topic.
+
+        Args:
+            topic (str): The topic to handle.
+            handler (Callable[[Any], Awaitable[None]]): The coroutine function called with
+                the affected key, or with None when the whole state has to be evicted.
+        """
+
+        self._handlers[topic].append(handler)
+
+    async def publish(self, topic: str, key: Any = None) -> None:
+        """
+        Announce a change to the other workers once the current transaction commits.
+
+        The event is dropped when the transaction is rolled back. A key too large
+        for a single notification is replaced with None.
+
+        Args:
+            topic (str): The topic of the change.
+            key (Any, optional): The JSON-serializable affected key. Defaults to None, meaning everything.
+        """
+
+        payload = json.dumps({"origin": self._origin, "topic": topic, "key": key})
+
+        if len(payload.encode()) > MAX_PAYLOAD_SIZE:
+            payload = json.dumps({"origin": self._origin, "topic": topic, "key": None})
+
+        await database.execute(select(func.pg_notify(self._channel, payload)))
+
+    async def start(self) -> None:
+        """
+        Start receiving the change events of the other workers.
+        """
+
+        if not self._listener:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """
+        Stop receiving the change events.
+        """
+
+        if self._listener:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+        if self._connection:
+            await self._connection.close()
+            self._connection = None
+
+    async def _listen(self) -> None:
+        """A private method keeping the listening connection open, reconnecting when it is lost."""
+
+        reconnecting = False
+
+        while True:
+            try:
+                closed = asyncio.Event()
+                self._connection = await asyncpg.connect(self._dsn)
+                self._connection.add_termination_listener(lambda _: closed.set())
+                await self._connection.add_listener(self._channel, self._on_notification)
+
+                if reconnecting:
+                    await self._dispatch(None, None)
+
+                reconnecting = True
+                await closed.wait()
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+                print(f"Invalidation bus connection failed: {e}")
+
+            self._connection = None
+            await asyncio.sleep(self._reconnect_delay)
+
+    def _on_notification(self, _connection: asyncpg.Connection, _pid: int, _channel: str, payload: str) -> None:
+        """A private method scheduling the handling of a notification.
+
+        Args:
+            _connection (asyncpg.Connection): The listening connection.
+            _pid (int): The ID of the backend that sent the notification.
+            _channel (str): The notification channel.
+            payload (str): The JSON-encoded change event.
+        """
+
+        event = json.loads(payload)
+
+        if event["origin"] == self._origin:
+            return
+
+        dispatch = asyncio.create_task(self._dispatch(event["topic"], event["key"]))
+        self._dispatches.add(dispatch)
+        dispatch.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, topic: str | None, key: Any) -> None:
+        """A private method evicting the state of a topic, or of every topic when none is given.
+
+        Args:
+            topic (str | None): The topic of the change.
+            key (Any): The affected key, or None to evict everything.
+        """
+
+        topics = set(caches) | set(self._handlers) if topic is None else {topic}
+
+        for name in topics:
+            if cache := caches.get(name):
+                cache.invalidate(_to_hashable(key))
+
+            for handler in self._handlers.get(name, ()):
+                try:
+                    await handler(key)
+                except Exception as e:
+                    print(f"Invalidation of {name} failed: {e}")
+
+
+def _to_hashable(key: Any) -> Any:
+    """A private function restoring the tuples of a cache key that JSON turned into lists.
+
+    Args:
+        key (Any): The decoded key.
+
+    Returns:
+        Any: The key with every list converted to a tuple.
+    """
+
+    if isinstance(key, list):
+        return tuple(_to_hashable(item) for item in key)
+
+    return key
@@ -2,9 +2,9 @@
 Module containing invoice service implementation.
 """
 
-from typing import Iterable
+from typing import Collection, Iterable
 
-from hotel_management_system.core.domains.invoice import Invoice, InvoiceIn
+from hotel_management_system.core.domains.invoice import Invoice, InvoiceExpansion, InvoiceIn
 from hotel_management_system.core.repositories.i_invoice_repository import IInvoiceRepository
 from hotel_management_system.core.services.i_invoice_service import IInvoiceService
 from hotel_management_system.core.services.i_reservation_service import IReservationService
@@ -33,17 +33,40 @@ class InvoiceService(IInvoiceService):
         self._invoice_repository = invoice_repository
         self._reservation_service = reservation_service
 
-    async def get_all(self) -> Iterable[Invoice]:
+    async def get_all(
+            self,
+            after: int | None = None,
+            limit: int | None = None,
+            expand: Collection[InvoiceExpansion] = ("reservation",),
+    ) -> Iterable[Invoice]:
         """
         Retrieve all invoices from the data storage.
 
+        The reservations of the expanded invoices are loaded in a single batch rather than one by one.
+
+        Args:
+            after (int | None, optional): The ID of the last invoice of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of invoices. Defaults to None, meaning all of them.
+            expand (Collection[InvoiceExpansion], optional): The nested data to include. Defaults to all of it.
+
         Returns:
             List[Invoice]: A list of all invoices.
         """
 
-        all_invoices = await self._invoice_repository.get_all_invoices()
+        all_invoices = await self._invoice_repository.get_all_invoices(after, limit)
+
+        if "reservation" not in expand:
+            return all_invoices
+
+        reservations = await self._reservation_service.get_by_ids(
+            [invoice.reservation_id for invoice in all_invoices]
+        )
+
+        for invoice, reservation in zip(all_invoices, reservations):
+            invoice.reservation = reservation
+            invoice.total_sum = reservation.get_cost()
 
-        return [await self.parse_invoice(invoice) for invoice in all_invoices]
+        return all_invoices
 
     async def get_by_id(self, invoice_id: int) -> Invoice | None:
         """
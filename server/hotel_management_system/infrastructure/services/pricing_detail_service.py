@@ -5,7 +5,9 @@ Module containing pricing_detail service implementation.
 from typing import Iterable
 
 from hotel_management_system.core.domains.pricing_detail import PricingDetail, PricingDetailIn
+from hotel_management_system.core.repositories.i_daily_stats_repository import IDailyStatsRepository
 from hotel_management_system.core.repositories.i_pricing_detail_repository import IPricingDetailRepository
+from hotel_management_system.core.repositories.i_unit_of_work import IUnitOfWork
 from hotel_management_system.core.services.i_pricing_detail_service import IPricingDetailService
 
 
@@ -15,16 +17,26 @@ class PricingDetailService(IPricingDetailService):
     """
 
     _repository: IPricingDetailRepository
-
-    def __init__(self, repository: IPricingDetailRepository) -> None:
+    _daily_stats_repository: IDailyStatsRepository
+    _unit_of_work: IUnitOfWork
+
+    def __init__(self,
+                 repository: IPricingDetailRepository,
+                 daily_stats_repository: IDailyStatsRepository,
+                 unit_of_work: IUnitOfWork,
+                 ) -> None:
         """
         The initializer of the `pricing_detail service`.
 
         Args:
             repository (IPricingDetailRepository): The reference to the repository.
+            daily_stats_repository (IDailyStatsRepository): The reference to the daily_stats repository
+            unit_of_work (IUnitOfWork): The reference to the unit of work
         """
 
         self._repository = repository
+        self._daily_stats_repository = daily_stats_repository
+        self._unit_of_work = unit_of_work
 
     async def get_all(self) -> Iterable[PricingDetail]:
         """
@@ -83,6 +95,8 @@ class PricingDetailService(IPricingDetailService):
         """
         Update an existing pricing detail's data in the data storage.
 
+        The income of its bills is moved in the daily stats from the old price to the new one.
+
         Args:
             pricing_detail_id (int): The ID of the pricing detail to update.
             data (PricingDetailIn): The updated details for the pricing detail.
@@ -91,10 +105,17 @@ class PricingDetailService(IPricingDetailService):
             PricingDetail | None: The updated pricing detail details, or None if the pricing detail is not found.
         """
 
-        return await self._repository.update_pricing_detail(
-            pricing_detail_id=pricing_detail_id,
-            data=data,
-        )
+        async with self._unit_of_work.begin():
+            await self._daily_stats_repository.remove_pricing_detail_bills(pricing_detail_id)
+
+            updated_pricing_detail = await self._repository.update_pricing_detail(
+                pricing_detail_id=pricing_detail_id,
+                data=data,
+            )
+
+            await self._daily_stats_repository.add_pricing_detail_bills(pricing_detail_id)
+
+        return updated_pricing_detail
 
     async def delete_pricing_detail(self, pricing_detail_id: int) -> bool:
         """
@@ -107,4 +128,7 @@ class PricingDetailService(IPricingDetailService):
             bool: True if the operation is successful, False otherwise.
         """
 
-        return await self._repository.delete_pricing_detail(pricing_detail_id)
\ No newline at end of file
+        async with self._unit_of_work.begin():
+            await self._daily_stats_repository.remove_pricing_detail(pricing_detail_id)
+
+            return await self._repository.delete_pricing_detail(pricing_detail_id)
\ No newline at end of file
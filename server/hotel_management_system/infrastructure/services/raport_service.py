@@ -0,0 +1,83 @@
+"""
+Module containing raport service implementation.
+"""
+
+from datetime import date
+from typing import Dict
+
+from hotel_management_system.core.domains.raport import Raport, RaportGranularity
+from hotel_management_system.core.repositories.i_raport_repository import IRaportRepository
+from hotel_management_system.core.services.i_raport_service import IRaportService
+
+
+class RaportService(IRaportService):
+    """
+    A class implementing the raport service.
+    """
+
+    _repository: IRaportRepository
+
+    def __init__(self, repository: IRaportRepository) -> None:
+        """
+        The initializer of the `raport service`.
+
+        Args:
+            repository (IRaportRepository): The reference to the repository.
+        """
+
+        self._repository = repository
+
+    async def get_between_dates(self, start_date: date, end_date: date) -> Raport:
+        """
+        Summarize the reservations starting between the provided start and end dates.
+
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, inclusive.
+
+        Returns:
+            Raport: The summary of the reservations.
+        """
+
+        return await self._repository.get_between_dates(start_date, end_date)
+
+    async def get_by_month(self, year: int, month_number: int) -> Raport:
+        """
+        Summarize the reservations starting during the specified month.
+
+        Args:
+            year (int): The year of the reservations.
+            month_number (int): The month number (1 for January, 12 for December).
+
+        Returns:
+            Raport: The summary of the reservations.
+        """
+
+        return await self._repository.get_by_month(year, month_number)
+
+    async def get_by_year(self, year: int) -> Raport:
+        """
+        Summarize the reservations starting during the specified year.
+
+        Args:
+            year (int): The year of the reservations.
+
+        Returns:
+            Raport: The summary of the reservations.
+        """
+
+        return await self._repository.get_between_dates(date(year, 1, 1), date(year, 12, 31))
+
+    async def get_breakdown_by_year(self, year: int, granularity: RaportGranularity) -> Dict[date, Raport]:
+        """
+        Summarize the reservations starting during the specified year, per day, week or month.
+
+        Args:
+            year (int): The year of the reservations.
+            granularity (RaportGranularity): The length of a single period.
+
+        Returns:
+            Dict[date, Raport]: The summaries keyed by the first day of their period, including empty periods.
+        """
+
+        return await self._repository.get_breakdown(date(year, 1, 1), date(year, 12, 31), granularity)
@@ -2,11 +2,17 @@
 Module containing reservation_room service implementation.
 """
 
+from datetime import date
 from typing import Iterable, List
 
+from hotel_management_system.core.domains.reservation import Reservation
 from hotel_management_system.core.domains.reservation_room import ReservationRoom, ReservationRoomIn
 from hotel_management_system.core.repositories.i_reservation_room_repository import IReservationRoomRepository
+from hotel_management_system.core.repositories.i_unit_of_work import IUnitOfWork
+from hotel_management_system.core.services.i_availability_service import AVAILABILITY_TOPIC, IAvailabilityService
+from hotel_management_system.core.services.i_invalidation_bus import IInvalidationBus
 from hotel_management_system.core.services.i_reservation_room_service import IReservationRoomService
+from hotel_management_system.loader import DataLoader
 
 
 class ReservationRoomService(IReservationRoomService):
@@ -15,16 +21,34 @@ class ReservationRoomService(IReservationRoomService):
     """
 
     _repository: IReservationRoomRepository
-
-    def __init__(self, repository: IReservationRoomRepository) -> None:
+    _availability_service: IAvailabilityService
+    _invalidation_bus: IInvalidationBus
+    _unit_of_work: IUnitOfWork
+    _reservation_loader: DataLoader[Reservation]
+
+    def __init__(self,
+                 repository: IReservationRoomRepository,
+                 availability_service: IAvailabilityService,
+                 invalidation_bus: IInvalidationBus,
+                 unit_of_work: IUnitOfWork,
+                 reservation_loader: DataLoader[Reservation],
+                 ) -> None:
         """
         The initializer of the `reservation_room service`.
 
         Args:
             repository (IReservationRoomRepository): The reference to the repository.
+            availability_service (IAvailabilityService): The reference to the availability service
+            invalidation_bus (IInvalidationBus): The reference to the invalidation bus
+            unit_of_work (IUnitOfWork): The reference to the unit of work
+            reservation_loader (DataLoader[Reservation]): The reference to the reservation loader
         """
 
         self._repository = repository
+        self._availability_service = availability_service
+        self._invalidation_bus = invalidation_bus
+        self._unit_of_work = unit_of_work
+        self._reservation_loader = reservation_loader
 
     async def get_all(self) -> Iterable[ReservationRoom]:
         """
@@ -36,6 +60,20 @@ class ReservationRoomService(IReservationRoomService):
 
         return await self._repository.get_all_reservation_rooms()
 
+    async def get_occupied_room_ids(self, start_date: date, end_date: date) -> List[int]:
+        """
+        Retrieve the IDs of the rooms held by a reservation overlapping the provided dates.
+
+        Args:
+            start_date (date): The first night of the period.
+            end_date (date): The end of the period, exclusive.
+
+        Returns:
+            List[int]: The IDs of the occupied rooms.
+        """
+
+        return await self._repository.get_occupied_room_ids(start_date, end_date)
+
     async def get_by_id(self, room_id: int, reservation_id: int) -> List[ReservationRoom] | None:
         """
         Retrieve a reservation room by its unique room ID and reservation ID.
@@ -86,7 +124,16 @@ class ReservationRoomService(IReservationRoomService):
             ReservationRoom | None: The newly added reservation room, or None if the operation fails.
         """
 
-        return await self._repository.add_reservation_room(data)
+        new_reservation_room = await self._repository.add_reservation_room(data)
+
+        if new_reservation_room:
+            self._reservation_loader.clear(data.reservation_id)
+            await self._invalidation_bus.publish(AVAILABILITY_TOPIC, [data.reservation_id])
+            await self._unit_of_work.on_commit(
+                lambda: self._availability_service.add_room(data.reservation_id, data.room_id)
+            )
+
+        return new_reservation_room
 
     async def update_reservation_room(
             self,
@@ -106,12 +153,25 @@ class ReservationRoomService(IReservationRoomService):
             ReservationRoom | None: The updated reservation room details, or None if the reservation room is not found.
         """
 
-        return await self._repository.update_reservation_room(
+        updated_reservation_room = await self._repository.update_reservation_room(
             room_id=room_id,
             reservation_id=reservation_id,
             data=data,
         )
 
+        if updated_reservation_room:
+            self._reservation_loader.clear(reservation_id)
+            self._reservation_loader.clear(data.reservation_id)
+            await self._invalidation_bus.publish(AVAILABILITY_TOPIC, [reservation_id, data.reservation_id])
+            await self._unit_of_work.on_commit(
+                lambda: self._availability_service.remove_room(reservation_id, room_id)
+            )
+            await self._unit_of_work.on_commit(
+                lambda: self._availability_service.add_room(data.reservation_id, data.room_id)
+            )
+
+        return updated_reservation_room
+
     async def delete_reservation_room(self, room_id: int, reservation_id: int) -> bool:
         """
         Remove a reservation room from the data storage.
@@ -124,4 +184,13 @@ class ReservationRoomService(IReservationRoomService):
             bool: True if the operation is successful, False otherwise.
         """
 
-        return await self._repository.delete_reservation_room(room_id, reservation_id)
+        if await self._repository.delete_reservation_room(room_id, reservation_id):
+            self._reservation_loader.clear(reservation_id)
+            await self._invalidation_bus.publish(AVAILABILITY_TOPIC, [reservation_id])
+            await self._unit_of_work.on_commit(
+                lambda: self._availability_service.remove_room(reservation_id, room_id)
+            )
+
+            return True
+
+        return False
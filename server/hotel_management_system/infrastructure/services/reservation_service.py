@@ -2,17 +2,23 @@
 Module containing reservation service implementation.
 """
 
-from datetime import date, datetime
-from typing import List
+from datetime import date
+from typing import Collection, Iterable, List, get_args
 
-from hotel_management_system.core.domains.reservation import Reservation, ReservationIn
+from hotel_management_system.concurrency import gather_bounded
+from hotel_management_system.core.domains.reservation import Reservation, ReservationExpansion, ReservationIn
 from hotel_management_system.core.domains.room import Room
+from hotel_management_system.core.repositories.i_daily_stats_repository import IDailyStatsRepository
 from hotel_management_system.core.repositories.i_reservation_repository import IReservationRepository
+from hotel_management_system.core.repositories.i_unit_of_work import IUnitOfWork
+from hotel_management_system.core.services.i_availability_service import AVAILABILITY_TOPIC, IAvailabilityService
 from hotel_management_system.core.services.i_bill_service import IBillService
 from hotel_management_system.core.services.i_guest_service import IGuestService
+from hotel_management_system.core.services.i_invalidation_bus import IInvalidationBus
 from hotel_management_system.core.services.i_reservation_room_service import IReservationRoomService
 from hotel_management_system.core.services.i_reservation_service import IReservationService
 from hotel_management_system.core.services.i_room_service import IRoomService
+from hotel_management_system.loader import DataLoader
 
 
 class ReservationService(IReservationService):
@@ -25,6 +31,11 @@ class ReservationService(IReservationService):
     _guest_service: IGuestService
     _room_service: IRoomService
     _bill_service: IBillService
+    _availability_service: IAvailabilityService
+    _daily_stats_repository: IDailyStatsRepository
+    _invalidation_bus: IInvalidationBus
+    _unit_of_work: IUnitOfWork
+    _reservation_loader: DataLoader[Reservation]
 
     def __init__(self,
                  reservation_repository: IReservationRepository,
@@ -32,6 +43,11 @@ class ReservationService(IReservationService):
                  guest_service: IGuestService,
                  room_service: IRoomService,
                  bill_service: IBillService,
+                 availability_service: IAvailabilityService,
+                 daily_stats_repository: IDailyStatsRepository,
+                 invalidation_bus: IInvalidationBus,
+                 unit_of_work: IUnitOfWork,
+                 reservation_loader: DataLoader[Reservation],
                  ) -> None:
         """
         The initializer of the `reservation service`.
@@ -42,6 +58,11 @@ class ReservationService(IReservationService):
             guest_service (IGuestService): The reference to the guest service
             room_service (IRoomService): The reference to the room service
             bill_service (IBillService): The reference to the bill service
+            availability_service (IAvailabilityService): The reference to the availability service
+            daily_stats_repository (IDailyStatsRepository): The reference to the daily_stats repository
+            invalidation_bus (IInvalidationBus): The reference to the invalidation bus
+            unit_of_work (IUnitOfWork): The reference to the unit of work
+            reservation_loader (DataLoader[Reservation]): The reference to the reservation loader
         """
 
         self._reservation_repository = reservation_repository
@@ -49,23 +70,51 @@ class ReservationService(IReservationService):
         self._guest_service = guest_service
         self._room_service = room_service
         self._bill_service = bill_service
+        self._availability_service = availability_service
+        self._daily_stats_repository = daily_stats_repository
+        self._invalidation_bus = invalidation_bus
+        self._unit_of_work = unit_of_work
+        self._reservation_loader = reservation_loader
 
-    async def get_all(self) -> List[Reservation]:
+    async def get_all(
+            self,
+            after: int | None = None,
+            limit: int | None = None,
+            expand: Collection[ReservationExpansion] = ("guest", "rooms", "bills"),
+    ) -> List[Reservation]:
         """
         Retrieve all reservations from the data storage.
 
+        Only the requested nested data is loaded, with a fixed number of queries.
+
+        Args:
+            after (int | None, optional): The ID of the last reservation of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of reservations. Defaults to None, meaning all of them.
+            expand (Collection[ReservationExpansion], optional): The nested data to include. Defaults to all of it.
+
         Returns:
             List[Reservation]: A list of all reservations.
         """
 
-        all_reservations = await self._reservation_repository.get_all_reservations()
+        all_reservations = await self._reservation_repository.get_all_reservations(after, limit)
+
+        if not expand:
+            return all_reservations
+
+        if set(expand) < set(get_args(ReservationExpansion)):
+            return await self._reservation_repository.get_many_hydrated(
+                [reservation.id for reservation in all_reservations],
+                expand,
+            )
 
-        return [await self.parse_reservation(reservation) for reservation in all_reservations]
+        return await self.parse_reservations(all_reservations)
 
     async def get_by_id(self, reservation_id: int) -> Reservation | None:
         """
         Retrieve a reservation by its unique ID.
 
+        The reservation is loaded at most once per request, batched with the concurrent lookups.
+
         Args:
             reservation_id (int): The ID of the reservation.
 
@@ -73,9 +122,22 @@ class ReservationService(IReservationService):
             Reservation | None: The details of the reservation if found, or None if not found.
         """
 
-        return await self.parse_reservation(
-            await self._reservation_repository.get_by_id(reservation_id)
-        )
+        return await self._reservation_loader.load(reservation_id)
+
+    async def get_by_ids(self, reservation_ids: Iterable[int]) -> List[Reservation | None]:
+        """
+        Retrieve the reservations of several unique IDs.
+
+        The reservations not loaded yet in the request are fetched in a single batch.
+
+        Args:
+            reservation_ids (Iterable[int]): The IDs of the reservations.
+
+        Returns:
+            List[Reservation | None]: The reservations in the order of the IDs, with None for the missing ones.
+        """
+
+        return await self._reservation_loader.load_many(reservation_ids)
 
     async def get_by_guest_id(self, guest_id: int) -> List[Reservation] | None:
         """
@@ -87,10 +149,10 @@ class ReservationService(IReservationService):
         Returns:
             List[Reservation]: A list of all reservations with the guest_id.
         """
-        all_reservations = await self._reservation_repository.get_all_reservations()
-        all_reservations = [reservation for reservation in all_reservations if reservation.guest_id == guest_id]
 
-        return [await self.parse_reservation(reservation) for reservation in all_reservations]
+        return await self.parse_reservations(
+            await self._reservation_repository.get_by_guest_id(guest_id)
+        )
 
     async def get_by_month(self, year: int, month_number: int) -> List[Reservation]:
         """
@@ -104,7 +166,9 @@ class ReservationService(IReservationService):
             List[Reservation]: A list of reservations made in the specified month.
         """
 
-        return [await self.parse_reservation(reservation) for reservation in await self._reservation_repository.get_by_month(year, month_number)]
+        return await self.parse_reservations(
+            await self._reservation_repository.get_by_month(year, month_number)
+        )
 
     async def get_between_dates(self, start_date: date, end_date: date) -> List[Reservation]:
         """
@@ -112,13 +176,15 @@ class ReservationService(IReservationService):
 
         Args:
             start_date (date): The start date of the range.
-            end_date (date): The end date of the range.
+            end_date (date): The end date of the range, inclusive.
 
         Returns:
             List[Reservation]: A list of reservations made within the date range.
         """
 
-        return [await self.parse_reservation(reservation) for reservation in await self._reservation_repository.get_between_dates(start_date, end_date)]
+        return await self.parse_reservations(
+            await self._reservation_repository.get_between_dates(start_date, end_date)
+        )
 
     async def get_by_year(self, year: int) -> List[Reservation]:
         """
@@ -128,36 +194,64 @@ class ReservationService(IReservationService):
             year (int): The year of the reservations.
 
         Returns:
-            ist[Reservation]: A list of reservations made in the specified year.
+            List[Reservation]: A list of reservations made in the specified year.
         """
 
-        year_start = datetime.strptime(f'{year}-01-01', '%Y-%m-%d').date()
-        year_end = datetime.strptime(f'{year}-12-31', '%Y-%m-%d').date()
+        return await self.parse_reservations(
+            await self._reservation_repository.get_by_year(year)
+        )
 
-        return await self.get_between_dates(year_start, year_end)
+    async def get_active_between(self, start_date: date, end_date: date) -> List[Reservation]:
+        """
+        Retrieve reservations whose stay overlaps the provided period.
 
-    async def get_free_rooms(self, start_date: date, end_date: date) -> List[Room]:
+        Args:
+            start_date (date): The first day of the period.
+            end_date (date): The end of the period, exclusive.
+
+        Returns:
+            List[Reservation]: A list of reservations active during the period.
         """
-        Retrieve rooms that are not reserved within the provided start and end dates.
+
+        return await self.parse_reservations(
+            await self._reservation_repository.get_active_between(start_date, end_date)
+        )
+
+    async def get_active_by_month(self, year: int, month_number: int) -> List[Reservation]:
+        """
+        Retrieve reservations whose stay overlaps the specified month.
 
         Args:
-            start_date (date): The start date of the range.
-            end_date (date): The end date of the range.
+            year (int): The year of the reservations.
+            month_number (int): The month number (1 for January, 12 for December).
 
         Returns:
-            List[Room]: A list of free rooms within the date range.
+            List[Reservation]: A list of reservations active during the specified month.
         """
 
-        all_rooms = await self._room_service.get_all()
+        return await self.parse_reservations(
+            await self._reservation_repository.get_active_by_month(year, month_number)
+        )
 
-        reservations = await self.get_between_dates(start_date, end_date)
+    async def get_free_rooms(self, start_date: date, end_date: date) -> List[Room]:
+        """
+        Retrieve rooms that have no stay overlapping the provided start and end dates.
 
-        reserved_room_ids = set()
+        Args:
+            start_date (date): The start date of the range.
+            end_date (date): The end date of the range, exclusive.
 
-        for reservation in reservations:
-            reserved_room_ids.update([reserved_room.id for reserved_room in reservation.reserved_rooms])
+        Returns:
+            List[Room]: A list of free rooms within the date range.
+        """
+
+        all_rooms, occupied_rooms = await gather_bounded(
+            self._room_service.get_all(),
+            self._reservation_room_service.get_occupied_room_ids(start_date, end_date),
+        )
+        occupied_room_ids = set(occupied_rooms)
 
-        free_rooms = [room for room in all_rooms if room.id not in reserved_room_ids]
+        free_rooms = [room for room in all_rooms if room.id not in occupied_room_ids]
 
         return free_rooms
 
@@ -172,9 +266,53 @@ class ReservationService(IReservationService):
             Reservation | None: The newly added reservation, or None if the operation fails.
         """
 
-        return await self.parse_reservation(
-            await self._reservation_repository.add_reservation(data)
-        )
+        async with self._unit_of_work.begin():
+            new_reservation = await self._reservation_repository.add_reservation(data)
+
+            if new_reservation:
+                await self._daily_stats_repository.add_reservation(new_reservation.id)
+                await self._invalidation_bus.publish(AVAILABILITY_TOPIC, [new_reservation.id])
+                await self._unit_of_work.on_commit(lambda: self._availability_service.set_reservation(
+                    new_reservation.id,
+                    new_reservation.start_date,
+                    new_reservation.end_date,
+                ))
+
+        return await self.parse_reservation(new_reservation)
+
+    async def add_reservation_with_rooms(
+            self,
+            data: ReservationIn,
+            room_ids: List[int],
+            pricing_detail_id: int,
+    ) -> Reservation | None:
+        """
+        Add a new reservation together with its rooms and one bill per room per night.
+
+        Args:
+            data (ReservationIn): The details of the new reservation.
+            room_ids (List[int]): The IDs of the rooms to reserve.
+            pricing_detail_id (int): The ID of the pricing detail billed for every night.
+
+        Returns:
+            Reservation | None: The newly added reservation, or None if one of the rooms is already reserved.
+        """
+
+        async with self._unit_of_work.begin():
+            new_reservation = await self._reservation_repository.add_reservation_with_rooms(
+                data,
+                room_ids,
+                pricing_detail_id,
+            )
+
+            if new_reservation:
+                await self._daily_stats_repository.add_reservation(new_reservation.id)
+                await self._invalidation_bus.publish(AVAILABILITY_TOPIC, [new_reservation.id])
+                await self._unit_of_work.on_commit(
+                    lambda: self._index_reservation(new_reservation, room_ids)
+                )
+
+        return await self.parse_reservation(new_reservation)
 
     async def update_reservation(
             self,
@@ -192,16 +330,30 @@ class ReservationService(IReservationService):
             Reservation | None: The updated reservation details, or None if the reservation is not found.
         """
 
-        return await self.parse_reservation(
-            await self._reservation_repository.update_reservation(
+        async with self._unit_of_work.begin():
+            await self._daily_stats_repository.remove_reservation(reservation_id)
+
+            updated_reservation = await self._reservation_repository.update_reservation(
                 reservation_id=reservation_id,
                 data=data,
             )
-        )
+
+            await self._daily_stats_repository.add_reservation(reservation_id)
+            self._reservation_loader.clear(reservation_id)
+
+            if updated_reservation:
+                await self._invalidation_bus.publish(AVAILABILITY_TOPIC, [reservation_id])
+                await self._unit_of_work.on_commit(lambda: self._availability_service.set_reservation(
+                    updated_reservation.id,
+                    updated_reservation.start_date,
+                    updated_reservation.end_date,
+                ))
+
+        return await self.parse_reservation(updated_reservation)
 
     async def delete_reservation(self, reservation_id: int) -> bool:
         """
-        Remove a reservation from the data storage.
+        Remove a reservation from the data storage, along with its invoices, bills and rooms.
 
         Args:
             reservation_id (int): The ID of the reservation to remove.
@@ -210,18 +362,96 @@ class ReservationService(IReservationService):
             bool: True if the operation is successful, False otherwise.
         """
 
-        return await self._reservation_repository.delete_reservation(reservation_id)
+        return bool(await self.delete_reservations([reservation_id]))
+
+    async def delete_reservations(self, reservation_ids: List[int]) -> List[int]:
+        """
+        Remove reservations along with their invoices, bills and rooms, with one statement per table.
+
+        Args:
+            reservation_ids (List[int]): The IDs of the reservations to remove.
+
+        Returns:
+            List[int]: The IDs of the removed reservations.
+        """
+
+        if not reservation_ids:
+            return []
+
+        async with self._unit_of_work.begin():
+            await self._daily_stats_repository.remove_reservations(reservation_ids)
+
+            deleted_reservation_ids = await self._reservation_repository.delete_reservations(reservation_ids)
+
+            for reservation_id in deleted_reservation_ids:
+                self._reservation_loader.clear(reservation_id)
+
+            await self._invalidation_bus.publish(AVAILABILITY_TOPIC, deleted_reservation_ids)
+            await self._unit_of_work.on_commit(
+                lambda: self._unindex_reservations(deleted_reservation_ids)
+            )
+
+        return deleted_reservation_ids
+
+    async def delete_by_guest_ids(self, guest_ids: List[int]) -> List[int]:
+        """
+        Remove all reservations made by the specified guests, along with their invoices, bills and rooms.
+
+        Args:
+            guest_ids (List[int]): The IDs of the guests.
+
+        Returns:
+            List[int]: The IDs of the removed reservations.
+        """
+
+        return await self.delete_reservations(
+            await self._reservation_repository.get_ids_by_guest_ids(guest_ids)
+        )
+
+    async def _index_reservation(self, reservation: Reservation, room_ids: List[int]) -> None:
+        """A private method registering a new reservation and its rooms in the availability index.
+
+        Args:
+            reservation (Reservation): The new reservation.
+            room_ids (List[int]): The IDs of the reserved rooms.
+        """
+
+        await self._availability_service.set_reservation(
+            reservation.id,
+            reservation.start_date,
+            reservation.end_date,
+        )
+
+        for room_id in room_ids:
+            await self._availability_service.add_room(reservation.id, room_id)
+
+    async def _unindex_reservations(self, reservation_ids: List[int]) -> None:
+        """A private method releasing the rooms of removed reservations in the availability index.
+
+        Args:
+            reservation_ids (List[int]): The IDs of the removed reservations.
+        """
+
+        for reservation_id in reservation_ids:
+            await self._availability_service.remove_reservation(reservation_id)
 
     async def parse_reservation(self, reservation: Reservation) -> Reservation:
         if reservation:
-            guest = await self._guest_service.get_by_id(reservation.guest_id)
-            reservation.guest = guest
+            hydrated_reservations = await self._reservation_repository.get_many_hydrated([reservation.id])
 
-            reservation_rooms = await self._reservation_room_service.get_by_reservation_id(reservation.id)
-            reserved_rooms = [await self._room_service.get_by_id(reservation_room.room_id) for reservation_room in reservation_rooms]
-            reservation.reserved_rooms = reserved_rooms
+            if hydrated_reservations:
+                self._reservation_loader.prime(hydrated_reservations[0])
 
-            bills = await self._bill_service.get_by_reservation_id(reservation.id)
-            reservation.bills = bills
+                return hydrated_reservations[0]
 
         return reservation
+
+    async def parse_reservations(self, reservations: List[Reservation]) -> List[Reservation]:
+        hydrated_reservations = await self._reservation_repository.get_many_hydrated(
+            [reservation.id for reservation in reservations]
+        )
+
+        for reservation in hydrated_reservations:
+            self._reservation_loader.prime(reservation)
+
+        return hydrated_reservations
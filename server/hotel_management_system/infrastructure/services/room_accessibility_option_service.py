@@ -4,9 +4,11 @@ Module containing room_accessibility_option service implementation.
 
 from typing import Iterable, List
 
+from hotel_management_system.core.domains.room import Room
 from hotel_management_system.core.domains.room_accessibility_option import RoomAccessibilityOption, RoomAccessibilityOptionIn
 from hotel_management_system.core.repositories.i_room_accessibility_option_repository import IRoomAccessibilityOptionRepository
 from hotel_management_system.core.services.i_room_accessibility_option_service import IRoomAccessibilityOptionService
+from hotel_management_system.loader import DataLoader
 
 
 class RoomAccessibilityOptionService(IRoomAccessibilityOptionService):
@@ -15,16 +17,19 @@ class RoomAccessibilityOptionService(IRoomAccessibilityOptionService):
     """
 
     _repository: IRoomAccessibilityOptionRepository
+    _room_loader: DataLoader[Room]
 
-    def __init__(self, repository: IRoomAccessibilityOptionRepository) -> None:
+    def __init__(self, repository: IRoomAccessibilityOptionRepository, room_loader: DataLoader[Room]) -> None:
         """
         The initializer of the `room_accessibility_option service`.
 
         Args:
             repository (IRoomAccessibilityOptionRepository): The reference to the repository.
+            room_loader (DataLoader[Room]): The reference to the room loader.
         """
 
         self._repository = repository
+        self._room_loader = room_loader
 
     async def get_all(self) -> Iterable[RoomAccessibilityOption]:
         """
@@ -74,7 +79,10 @@ class RoomAccessibilityOptionService(IRoomAccessibilityOptionService):
             RoomAccessibilityOption | None: The newly added room accessibility option, or None if the operation fails.
         """
 
-        return await self._repository.add_room_accessibility_option(data)
+        new_room_accessibility_option = await self._repository.add_room_accessibility_option(data)
+        self._room_loader.clear(data.room_id)
+
+        return new_room_accessibility_option
 
     async def update_room_accessibility_option(
             self,
@@ -94,11 +102,15 @@ class RoomAccessibilityOptionService(IRoomAccessibilityOptionService):
             RoomAccessibilityOption | None: The updated room accessibility option details, or None if not found.
         """
 
-        return await self._repository.update_room_accessibility_option(
+        updated_room_accessibility_option = await self._repository.update_room_accessibility_option(
             room_id=room_id,
             accessibility_option_id=accessibility_option_id,
             data=data,
         )
+        self._room_loader.clear(room_id)
+        self._room_loader.clear(data.room_id)
+
+        return updated_room_accessibility_option
 
     async def delete_room_accessibility_option(self, room_id: int, accessibility_option_id: int) -> bool:
         """
@@ -112,4 +124,7 @@ class RoomAccessibilityOptionService(IRoomAccessibilityOptionService):
             bool: True if the operation is successful, False otherwise.
         """
 
-        return await self._repository.delete_room_accessibility_option(room_id, accessibility_option_id)
+        deleted = await self._repository.delete_room_accessibility_option(room_id, accessibility_option_id)
+        self._room_loader.clear(room_id)
+
+        return deleted
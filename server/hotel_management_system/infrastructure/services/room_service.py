@@ -3,15 +3,17 @@ Module containing room service implementation.
 """
 
 from datetime import date
-from typing import List
+from typing import Collection, List
 
-from hotel_management_system.core.domains.room import Room, RoomIn
+from hotel_management_system.concurrency import gather_bounded
+from hotel_management_system.core.domains.room import Room, RoomExpansion, RoomIn
 from hotel_management_system.core.repositories.i_accessibility_option_repository import IAccessibilityOptionRepository
 from hotel_management_system.core.repositories.i_room_accessibility_option_repository import \
     IRoomAccessibilityOptionRepository
 from hotel_management_system.core.repositories.i_room_repository import IRoomRepository
 from hotel_management_system.core.services.i_reservation_room_service import IReservationRoomService
 from hotel_management_system.core.services.i_room_service import IRoomService
+from hotel_management_system.loader import DataLoader
 
 
 class RoomService(IRoomService):
@@ -23,12 +25,14 @@ class RoomService(IRoomService):
     _room_accessibility_option_repository: IRoomAccessibilityOptionRepository
     _accessibility_option_repository: IAccessibilityOptionRepository
     _reservation_room_service: IReservationRoomService
+    _room_loader: DataLoader[Room]
 
     def __init__(self,
                  room_repository: IRoomRepository,
                  room_accessibility_option_repository: IRoomAccessibilityOptionRepository,
                  accessibility_option_repository: IAccessibilityOptionRepository,
                  reservation_room_service: IReservationRoomService,
+                 room_loader: DataLoader[Room],
                  ) -> None:
         """
         The initializer of the `room service`.
@@ -40,24 +44,43 @@ class RoomService(IRoomService):
             accessibility_option_repository (IAccessibilityOptionRepository): The reference to the
                                                                             accessibility_option_repository repository
             reservation_room_service (IReservationRoomService): The reference to the reservation_room service
+            room_loader (DataLoader[Room]): The reference to the room loader
         """
 
         self._room_repository = room_repository
         self._room_accessibility_option_repository = room_accessibility_option_repository
         self._accessibility_option_repository = accessibility_option_repository
         self._reservation_room_service = reservation_room_service
+        self._room_loader = room_loader
 
-    async def get_all(self) -> List[Room]:
+    async def get_all(
+            self,
+            after: int | None = None,
+            limit: int | None = None,
+            expand: Collection[RoomExpansion] = ("accessibility_options",),
+    ) -> List[Room]:
         """
         Retrieve all rooms from the data storage.
 
+        The expanded rooms are loaded in a single batch rather than one by one.
+
+        Args:
+            after (int | None, optional): The ID of the last room of the previous page. Defaults to None.
+            limit (int | None, optional): The maximum number of rooms. Defaults to None, meaning all of them.
+            expand (Collection[RoomExpansion], optional): The nested data to include. Defaults to all of it.
+
         Returns:
             List[Room]: A list of all rooms stored in the database.
         """
 
-        all_rooms = await self._room_repository.get_all_rooms()
+        all_rooms = await self._room_repository.get_all_rooms(after, limit)
+
+        if "accessibility_options" not in expand:
+            return all_rooms
+
+        rooms = await self._room_loader.load_many([room.id for room in all_rooms])
 
-        return [await self.parse_room(room) for room in all_rooms]
+        return [room for room in rooms if room]
 
     async def get_by_id(self, room_id: int) -> Room | None:
         """
@@ -70,9 +93,22 @@ class RoomService(IRoomService):
             Room | None: The room details if found, or None if no room with the given ID exists.
         """
 
-        return await self.parse_room(
-            await self._room_repository.get_by_id(room_id)
-        )
+        return await self._room_loader.load(room_id)
+
+    async def get_existing_ids(self, room_ids: List[int]) -> List[int]:
+        """
+        Retrieve which of the given room IDs exist, loading the missing rooms in a single batch.
+
+        The rooms already loaded during the request are not queried again.
+
+        Args:
+            room_ids (List[int]): The IDs of the rooms.
+
+        Returns:
+            List[int]: The IDs of the existing rooms.
+        """
+
+        return [room.id for room in await self._room_loader.load_many(room_ids) if room]
 
     async def add_room(self, data: RoomIn) -> Room | None:
         """
@@ -105,12 +141,13 @@ class RoomService(IRoomService):
             Room | None: The updated room details if successful, or None if no room with the given ID exists.
         """
 
-        return await self.parse_room(
-            await self._room_repository.update_room(
-                room_id=room_id,
-                data=data,
-            )
+        updated_room = await self._room_repository.update_room(
+            room_id=room_id,
+            data=data,
         )
+        self._room_loader.clear(room_id)
+
+        return await self.parse_room(updated_room)
 
     async def delete_room(self, room_id: int) -> bool:
         """
@@ -123,20 +160,18 @@ class RoomService(IRoomService):
             bool: True if the operation was successful, False otherwise.
         """
 
+        deleted = await self._room_repository.delete_room(room_id)
+        self._room_loader.clear(room_id)
 
-        return await self._room_repository.delete_room(room_id)
+        return deleted
 
     async def parse_room(self, room: Room) -> Room:
         if room:
             room_accessibility_options = await self._room_accessibility_option_repository.get_by_room_id(room.id)
 
-            accessibility_options = []
-
-            for room_accessibility_option in room_accessibility_options:
-                accessibility_option = await self._accessibility_option_repository.get_by_id(room_accessibility_option.accessibility_option_id)
-
-                accessibility_options.append(accessibility_option)
-
-            room.accessibility_options = accessibility_options
+            room.accessibility_options = await gather_bounded(*(
+                self._accessibility_option_repository.get_by_id(room_accessibility_option.accessibility_option_id)
+                for room_accessibility_option in room_accessibility_options
+            ))
 
         return room
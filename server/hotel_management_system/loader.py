@@ -0,0 +1,195 @@
+"""A module providing request-scoped batching loaders."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Iterable, List, TypeVar
+
+V = TypeVar("V")
+
+_loader_states: ContextVar[Dict["DataLoader", "_LoaderState"] | None] = ContextVar("loader_states", default=None)
+
+
+class _LoaderState:
+    """
+    The identity map, the lookups in flight and the IDs queued for the next batch of a loader within one scope.
+    """
+
+    __slots__ = ("values", "futures", "queue")
+
+    def __init__(self) -> None:
+        self.values: Dict[int, Any] = {}
+        self.futures: Dict[int, asyncio.Future] = {}
+        self.queue: List[int] = []
+
+
+@asynccontextmanager
+async def loader_scope() -> AsyncIterator[None]:
+    """Function opening a scope, e.g. an HTTP request, in which every loader keeps an identity map.
+
+    Yields:
+        None: Control to the code running inside the scope.
+    """
+
+    token = _loader_states.set({})
+
+    try:
+        yield
+    finally:
+        _loader_states.reset(token)
+
+
+class DataLoader(Generic[V]):
+    """
+    A class representing a loader of entities by ID that batches and deduplicates the lookups.
+
+    The IDs requested by concurrent `load` calls on the same tick of the event loop are
+    fetched together with a single call of the batch function. The batch runs in the task
+    of the first caller, so it reads through the connection and the transaction of that
+    caller rather than a connection of its own. Within a `loader_scope`
+    every entity is fetched at most once and the same instance is returned to every
+    caller, so the loaded entities must not be mutated. Outside a scope every call is
+    sent to the batch function on its own.
+    """
+
+    _batch_load: Callable[[List[int]], Awaitable[List[V]]]
+
+    def __init__(self, batch_load: Callable[[List[int]], Awaitable[List[V]]]) -> None:
+        """
+        The initializer of the `data loader`.
+
+        Args:
+            batch_load (Callable[[List[int]], Awaitable[List[V]]]): The coroutine function fetching
+                the entities of the given IDs with a single query. Missing entities are left out.
+        """
+
+        self._batch_load = batch_load
+
+    async def load(self, key: int) -> V | None:
+        """
+        Return the entity of an ID, batching the lookup with the concurrent ones.
+
+        Args:
+            key (int): The ID of the entity.
+
+        Returns:
+            V | None: The entity, or None if it does not exist.
+        """
+
+        return (await self.load_many([key]))[0]
+
+    async def load_many(self, keys: Iterable[int]) -> List[V | None]:
+        """
+        Return the entities of several IDs, fetching the missing ones in a single batch.
+
+        Args:
+            keys (Iterable[int]): The IDs of the entities.
+
+        Returns:
+            List[V | None]: The entities in the order of the given IDs, with None for the missing ones.
+        """
+
+        keys = list(keys)
+        state = self._state()
+
+        if state is None:
+            values = await self._fetch(list(set(keys)))
+
+            return [values.get(key) for key in keys]
+
+        leader = not state.queue
+        futures = {}
+
+        for key in keys:
+            if key in state.values:
+                continue
+
+            if key not in state.futures:
+                state.futures[key] = asyncio.get_running_loop().create_future()
+                state.queue.append(key)
+
+            futures[key] = state.futures[key]
+
+        values = {key: state.values[key] for key in keys if key not in futures}
+
+        if leader and state.queue:
+            await asyncio.sleep(0)
+            await self._dispatch(state)
+
+        for key, future in futures.items():
+            values[key] = await asyncio.shield(future)
+
+        return [values[key] for key in keys]
+
+    def prime(self, value: V) -> None:
+        """
+        Put an already fetched entity in the identity map of the current scope.
+
+        Args:
+            value (V): The entity.
+        """
+
+        if (state := self._state()) is not None:
+            state.values.setdefault(value.id, value)
+
+    def clear(self, key: int | None = None) -> None:
+        """
+        Forget a changed entity, or every entity when no ID is given, in the current scope.
+
+        Args:
+            key (int | None, optional): The ID of the entity. Defaults to None.
+        """
+
+        if (state := self._state()) is None:
+            return
+
+        if key is None:
+            state.values.clear()
+        else:
+            state.values.pop(key, None)
+
+    def _state(self) -> _LoaderState | None:
+        """A private method returning the state of the loader in the current scope.
+
+        Returns:
+            _LoaderState | None: The state, or None outside a scope.
+        """
+
+        states = _loader_states.get()
+
+        if states is None:
+            return None
+
+        return states.setdefault(self, _LoaderState())
+
+    async def _dispatch(self, state: _LoaderState) -> None:
+        """A private method fetching every queued ID with one call of the batch function.
+
+        Args:
+            state (_LoaderState): The state of the loader in the scope.
+        """
+
+        keys, state.queue = state.queue, []
+
+        try:
+            values = await self._fetch(keys)
+        except Exception as e:
+            for key in keys:
+                state.futures.pop(key).set_exception(e)
+            return
+
+        for key in keys:
+            state.values[key] = values.get(key)
+            state.futures.pop(key).set_result(state.values[key])
+
+    async def _fetch(self, keys: List[int]) -> Dict[int, V]:
+        """A private method calling the batch function and keying its result by ID.
+
+        Args:
+            keys (List[int]): The IDs of the entities.
+
+        Returns:
+            Dict[int, V]: The found entities keyed by ID.
+        """
+
+        return {value.id: value for value in await self._batch_load(keys)}
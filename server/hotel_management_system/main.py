@@ -8,6 +8,7 @@ from typing import AsyncGenerator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from hotel_management_system.api.middleware import LoaderScopeMiddleware, ReadYourWritesMiddleware
 from hotel_management_system.api.routers.guest_accessibility_option_router import router as guest_accessibility_option_router
 from hotel_management_system.api.routers.room_accessibility_option_router import router as room_accessibility_option_router
 from hotel_management_system.api.routers.accessibility_option_router import router as accessibility_option_router
@@ -17,11 +18,15 @@ from hotel_management_system.api.routers.reservation_router import router as res
 from hotel_management_system.api.routers.room_router import router as room_router
 from hotel_management_system.api.routers.pricing_detail_router import router as pricing_detail_router
 from hotel_management_system.api.routers.bill_router import router as bill_router
+from hotel_management_system.api.routers.cache_router import router as cache_router
+from hotel_management_system.api.routers.export_router import router as export_router
 from hotel_management_system.api.routers.invoice_router import router as invoice_router
+from hotel_management_system.api.routers.pool_router import router as pool_router
 from hotel_management_system.api.routers.raport_router import raport_router as raport_router
 from hotel_management_system.container import Container
+from hotel_management_system.core.services.i_availability_service import AVAILABILITY_TOPIC
 from hotel_management_system.db import database
-from hotel_management_system.db import init_db
+from hotel_management_system.migrations.migrator import check_schema_version
 from hotel_management_system.utils import setup
 
 container = Container()
@@ -37,6 +42,7 @@ container.wire(modules=[
     "hotel_management_system.api.routers.bill_router",
     "hotel_management_system.api.routers.invoice_router",
     "hotel_management_system.api.routers.raport_router",
+    "hotel_management_system.api.routers.export_router",
     "hotel_management_system.utils.setup",
 ])
 
@@ -46,10 +52,19 @@ async def lifespan(_: FastAPI) -> AsyncGenerator:
     """
     Lifespan function working on app startup.
     """
-    await init_db()
     await database.connect()
+    await check_schema_version()
+
+    availability_service = container.availability_service()
+    await availability_service.load()
+
+    invalidation_bus = container.invalidation_bus()
+    invalidation_bus.subscribe(AVAILABILITY_TOPIC, availability_service.reload_reservations)
+    await invalidation_bus.start()
+
     await setup.main()
     yield
+    await invalidation_bus.stop()
     await database.disconnect()
 
 
@@ -61,7 +76,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Link"],
 )
+app.add_middleware(LoaderScopeMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
 
 
 app.include_router(guest_router, prefix="/guest")
@@ -75,3 +93,6 @@ app.include_router(pricing_detail_router, prefix="/pricing_detail")
 app.include_router(bill_router, prefix="/bill")
 app.include_router(invoice_router, prefix="/invoice")
 app.include_router(raport_router, prefix="/raport")
+app.include_router(cache_router, prefix="/cache")
+app.include_router(pool_router, prefix="/pool")
+app.include_router(export_router, prefix="/export")
@@ -0,0 +1,45 @@
+"""
+Module providing the command line interface of the schema migrations.
+
+    python -m hotel_management_system.migrations upgrade [--to VERSION]
+    python -m hotel_management_system.migrations current
+    python -m hotel_management_system.migrations history
+"""
+
+import argparse
+import asyncio
+
+from hotel_management_system.migrations import migrator
+
+
+async def main() -> None:
+    """
+    Parse the command line and run the requested command.
+    """
+    parser = argparse.ArgumentParser(prog="python -m hotel_management_system.migrations")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    upgrade_parser = commands.add_parser("upgrade", help="apply the pending migrations")
+    upgrade_parser.add_argument("--to", type=int, default=None, help="the version to upgrade to")
+    commands.add_parser("current", help="print the applied and the latest version")
+    commands.add_parser("history", help="list the applied migrations")
+
+    arguments = parser.parse_args()
+
+    try:
+        if arguments.command == "upgrade":
+            applied = await migrator.upgrade(arguments.to)
+            print(f"Applied versions: {applied}" if applied else "Schema is up to date", flush=True)
+        elif arguments.command == "current":
+            history = await migrator.get_history()
+            current = history[-1].version if history else 0
+            print(f"Current version: {current}, latest version: {migrator.get_latest_version()}")
+        else:
+            for migration in await migrator.get_history():
+                print(f"{migration.version:>4}  {migration.applied_at:%Y-%m-%d %H:%M:%S}  {migration.description}")
+    finally:
+        await migrator.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,230 @@
+"""
+Module applying the versioned schema migrations.
+
+Every module in the `versions` package is a migration exposing:
+
+    VERSION (int): The consecutive version number, starting at 1.
+    DESCRIPTION (str): A short summary of the change.
+    TRANSACTIONAL (bool): Whether the migration runs in a single transaction.
+    upgrade (Callable[[AsyncConnection], Awaitable[None]]): The coroutine applying the change.
+
+Non-transactional migrations run on an autocommit connection, so they can build
+indexes concurrently and backfill in batches. They must be safe to re-run after an
+interruption, because their version is recorded only once they finish.
+"""
+
+import asyncio
+import importlib
+import pkgutil
+from types import ModuleType
+from typing import List
+
+import sqlalchemy
+from sqlalchemy.exc import OperationalError, DatabaseError
+from sqlalchemy.ext.asyncio import AsyncConnection
+from asyncpg.exceptions import (    # type: ignore
+    CannotConnectNowError,
+    ConnectionDoesNotExistError,
+)
+
+from hotel_management_system.db import database, engine
+from hotel_management_system.migrations import versions
+
+schema_migrations_table = sqlalchemy.Table(
+    "schema_migrations",
+    sqlalchemy.MetaData(),
+    sqlalchemy.Column("version", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("description", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column(
+        "applied_at",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+        server_default=sqlalchemy.func.now(),
+    ),
+)
+
+# Serializes concurrent `upgrade` runs, e.g. several replicas deploying at once.
+MIGRATION_LOCK_KEY = 7_301_001
+
+
+class SchemaVersionError(RuntimeError):
+    """Error raised when the database schema does not match the migrations."""
+
+
+class MigrationDataError(RuntimeError):
+    """Error raised when the existing data cannot be migrated without losing rows."""
+
+
+def load_migrations() -> List[ModuleType]:
+    """Function loading the migrations from the `versions` package.
+
+    Returns:
+        List[ModuleType]: The migration modules ordered by version.
+
+    Raises:
+        SchemaVersionError: If the versions are not consecutive numbers starting at 1.
+    """
+    migrations = sorted(
+        (
+            importlib.import_module(f"{versions.__name__}.{module.name}")
+            for module in pkgutil.iter_modules(versions.__path__)
+        ),
+        key=lambda migration: migration.VERSION,
+    )
+
+    if [migration.VERSION for migration in migrations] != list(range(1, len(migrations) + 1)):
+        raise SchemaVersionError("Migration versions must be consecutive numbers starting at 1")
+
+    return migrations
+
+
+def get_latest_version() -> int:
+    """Function returning the version the code expects the database to have.
+
+    Returns:
+        int: The version of the newest migration.
+    """
+    return len(load_migrations())
+
+
+async def get_current_version(connection: AsyncConnection) -> int:
+    """Function reading the version of the database schema.
+
+    Args:
+        connection (AsyncConnection): The connection to read the version with.
+
+    Returns:
+        int: The newest applied version, or 0 if no migration was applied.
+    """
+    query = sqlalchemy.select(sqlalchemy.func.coalesce(sqlalchemy.func.max(schema_migrations_table.c.version), 0))
+
+    return (await connection.execute(query)).scalar_one()
+
+
+async def get_history(retries: int = 5, delay: int = 5) -> List[sqlalchemy.Row]:
+    """Function listing the applied migrations.
+
+    Args:
+        retries (int, optional): Number of retries of connect to DB. Defaults to 5.
+        delay (int, optional): Delay between the retries, in seconds. Defaults to 5.
+
+    Returns:
+        List[sqlalchemy.Row]: The applied migrations ordered by version.
+    """
+    await _wait_for_database(retries, delay)
+
+    async with engine.connect() as connection:
+        await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.run_sync(schema_migrations_table.create, checkfirst=True)
+        query = sqlalchemy.select(schema_migrations_table).order_by(schema_migrations_table.c.version)
+
+        return list(await connection.execute(query))
+
+
+async def upgrade(target: int | None = None, retries: int = 5, delay: int = 5) -> List[int]:
+    """Function applying the pending migrations up to the target version.
+
+    Args:
+        target (int | None, optional): The version to upgrade to. Defaults to the newest one.
+        retries (int, optional): Number of retries of connect to DB. Defaults to 5.
+        delay (int, optional): Delay between the retries, in seconds. Defaults to 5.
+
+    Returns:
+        List[int]: The versions applied by this run.
+    """
+    migrations = load_migrations()
+    target = len(migrations) if target is None else target
+    applied = []
+
+    await _wait_for_database(retries, delay)
+
+    async with engine.connect() as connection:
+        await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(sqlalchemy.select(sqlalchemy.func.pg_advisory_lock(MIGRATION_LOCK_KEY)))
+
+        try:
+            await connection.run_sync(schema_migrations_table.create, checkfirst=True)
+            current = await get_current_version(connection)
+
+            for migration in migrations:
+                if not current < migration.VERSION <= target:
+                    continue
+
+                print(f"Applying migration {migration.VERSION}: {migration.DESCRIPTION}", flush=True)
+
+                if migration.TRANSACTIONAL:
+                    async with engine.begin() as transaction:
+                        await migration.upgrade(transaction)
+                        await _record(transaction, migration)
+                else:
+                    await migration.upgrade(connection)
+                    await _record(connection, migration)
+
+                applied.append(migration.VERSION)
+        finally:
+            await connection.execute(sqlalchemy.select(sqlalchemy.func.pg_advisory_unlock(MIGRATION_LOCK_KEY)))
+
+    return applied
+
+
+async def check_schema_version() -> None:
+    """Function verifying on startup that the database has all the migrations applied.
+
+    A database newer than the code is accepted, as migrations are kept backward compatible
+    for the duration of a rolling deployment.
+
+    Raises:
+        SchemaVersionError: If a migration is missing.
+    """
+    latest = get_latest_version()
+    current = 0
+
+    exists = sqlalchemy.func.to_regclass(schema_migrations_table.name).isnot(None)
+
+    if await database.fetch_val(sqlalchemy.select(exists)):
+        current = await database.fetch_val(
+            sqlalchemy.select(sqlalchemy.func.coalesce(sqlalchemy.func.max(schema_migrations_table.c.version), 0))
+        )
+
+    if current < latest:
+        raise SchemaVersionError(
+            f"Database schema is at version {current}, but version {latest} is required. "
+            f"Run `python -m hotel_management_system.migrations upgrade`."
+        )
+
+
+async def _wait_for_database(retries: int, delay: int) -> None:
+    """A private function waiting for the DB to accept connections.
+
+    Args:
+        retries (int): Number of retries of connect to DB.
+        delay (int): Delay between the retries, in seconds.
+    """
+    for attempt in range(retries):
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(sqlalchemy.select(1))
+            return
+        except (
+                OperationalError,
+                DatabaseError,
+                CannotConnectNowError,
+                ConnectionDoesNotExistError,
+                OSError,
+        ) as e:
+            if attempt == retries - 1:
+                raise
+
+            print(f"Attempt {attempt + 1} failed: {e}")
+            await asyncio.sleep(delay)
+
+
+async def _record(connection: AsyncConnection, migration: ModuleType) -> None:
+    """A private function marking a migration as applied.
+
+    Args:
+        connection (AsyncConnection): The connection to write with.
+        migration (ModuleType): The applied migration.
+    """
+    query = schema_migrations_table.insert().values(version=migration.VERSION, description=migration.DESCRIPTION)
+    await connection.execute(query)
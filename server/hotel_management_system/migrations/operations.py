@@ -0,0 +1,111 @@
+"""
+Module containing online-safe schema operations for the non-transactional migrations.
+
+The operations run on an autocommit connection and never hold a lock that blocks
+writes for longer than a single statement or batch. All of them can be re-run.
+"""
+
+import asyncio
+from typing import Callable, List
+
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+async def create_index_concurrently(
+        connection: AsyncConnection,
+        name: str,
+        table: str,
+        columns: List[str],
+        unique: bool = False,
+        using: str = "btree",
+) -> None:
+    """Function building an index without blocking writes to the table.
+
+    An invalid index left behind by an interrupted build is dropped and rebuilt.
+
+    Args:
+        connection (AsyncConnection): The autocommit connection.
+        name (str): The name of the index.
+        table (str): The name of the table.
+        columns (List[str]): The indexed columns or expressions.
+        unique (bool, optional): Whether the index is unique. Defaults to False.
+        using (str, optional): The index access method. Defaults to btree.
+    """
+    invalid = await connection.execute(
+        sqlalchemy.text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": name},
+    )
+
+    if invalid.scalar():
+        await connection.execute(sqlalchemy.text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+
+    await connection.execute(sqlalchemy.text(
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY IF NOT EXISTS {name} "
+        f"ON {table} USING {using} ({', '.join(columns)})"
+    ))
+
+
+async def add_primary_key(connection: AsyncConnection, table: str, columns: List[str]) -> None:
+    """Function adding a primary key to a populated table without blocking writes.
+
+    Duplicate rows are removed first. The unique index is then built concurrently
+    and attached as the primary key, which only takes a brief lock.
+
+    Args:
+        connection (AsyncConnection): The autocommit connection.
+        table (str): The name of the table.
+        columns (List[str]): The primary key columns.
+    """
+    has_primary_key = await connection.execute(
+        sqlalchemy.text("SELECT EXISTS (SELECT FROM pg_constraint WHERE conrelid = to_regclass(:table) "
+                        "AND contype = 'p')"),
+        {"table": table},
+    )
+
+    if has_primary_key.scalar():
+        return
+
+    await connection.execute(sqlalchemy.text(
+        f"DELETE FROM {table} AS duplicate USING {table} AS original "
+        f"WHERE duplicate.ctid > original.ctid AND "
+        + " AND ".join(f"duplicate.{column} = original.{column}" for column in columns)
+    ))
+
+    await create_index_concurrently(connection, f"{table}_pkey", table, columns, unique=True)
+    await connection.execute(sqlalchemy.text(
+        f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY USING INDEX {table}_pkey"
+    ))
+
+
+async def backfill_in_batches(
+        connection: AsyncConnection,
+        table: str,
+        key_column: str,
+        build_statement: Callable[[int, int], sqlalchemy.Executable],
+        batch_size: int = 10_000,
+        pause: float = 0.0,
+) -> None:
+    """Function running a backfill over consecutive key ranges, committing each batch.
+
+    The statement must be idempotent for its range, e.g. by ending with ON CONFLICT DO NOTHING,
+    so that an interrupted backfill can be resumed from the start.
+
+    Args:
+        connection (AsyncConnection): The autocommit connection.
+        table (str): The name of the table driving the backfill.
+        key_column (str): The integer column the batches are ranged over.
+        build_statement (Callable[[int, int], sqlalchemy.Executable]): The function building
+            the statement for the keys in [low, high).
+        batch_size (int, optional): The number of keys per batch. Defaults to 10 000.
+        pause (float, optional): Seconds to sleep between the batches. Defaults to 0.
+    """
+    bounds = await connection.execute(sqlalchemy.text(f"SELECT min({key_column}), max({key_column}) FROM {table}"))
+    low, high = bounds.one()
+
+    if low is None:
+        return
+
+    for batch_start in range(low, high + 1, batch_size):
+        await connection.execute(build_statement(batch_start, batch_start + batch_size))
+        await asyncio.sleep(pause)
@@ -0,0 +1,121 @@
+"""
+Migration creating the baseline schema.
+
+The tables are created only if missing, so databases set up by the former
+`metadata.create_all` startup step can adopt the migrations as they are.
+"""
+
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+VERSION = 1
+DESCRIPTION = "Baseline schema"
+TRANSACTIONAL = True
+
+STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS accessibility_options (
+        id SERIAL NOT NULL,
+        name VARCHAR,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS guests (
+        id SERIAL NOT NULL,
+        first_name VARCHAR,
+        last_name VARCHAR,
+        address VARCHAR,
+        city VARCHAR,
+        country VARCHAR,
+        zip_code VARCHAR,
+        phone_number VARCHAR,
+        email VARCHAR,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS pricing_details (
+        id SERIAL NOT NULL,
+        name VARCHAR,
+        price FLOAT,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS rooms (
+        id SERIAL NOT NULL,
+        alias VARCHAR,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS guests_accessibility_options_table (
+        guest_id INTEGER NOT NULL,
+        accessibility_option_id INTEGER NOT NULL,
+        FOREIGN KEY(guest_id) REFERENCES guests (id),
+        FOREIGN KEY(accessibility_option_id) REFERENCES accessibility_options (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS reservations (
+        id SERIAL NOT NULL,
+        guest_id INTEGER NOT NULL,
+        start_date DATE,
+        end_date DATE,
+        number_of_guests INTEGER,
+        PRIMARY KEY (id),
+        FOREIGN KEY(guest_id) REFERENCES guests (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS rooms_accessibility_options_table (
+        room_id INTEGER NOT NULL,
+        accessibility_option_id INTEGER NOT NULL,
+        FOREIGN KEY(room_id) REFERENCES rooms (id),
+        FOREIGN KEY(accessibility_option_id) REFERENCES accessibility_options (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS bills (
+        room_id INTEGER NOT NULL,
+        pricing_detail_id INTEGER NOT NULL,
+        reservation_id INTEGER NOT NULL,
+        FOREIGN KEY(room_id) REFERENCES rooms (id),
+        FOREIGN KEY(pricing_detail_id) REFERENCES pricing_details (id),
+        FOREIGN KEY(reservation_id) REFERENCES reservations (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS invoices (
+        id SERIAL NOT NULL,
+        date_of_issue DATE,
+        first_name VARCHAR,
+        last_name VARCHAR,
+        address VARCHAR,
+        nip VARCHAR,
+        reservation_id INTEGER NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY(reservation_id) REFERENCES reservations (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS reservation_rooms (
+        reservation_id INTEGER NOT NULL,
+        room_id INTEGER NOT NULL,
+        FOREIGN KEY(reservation_id) REFERENCES reservations (id),
+        FOREIGN KEY(room_id) REFERENCES rooms (id)
+    )
+    """,
+]
+
+
+async def upgrade(connection: AsyncConnection) -> None:
+    """
+    Create the baseline tables.
+
+    Args:
+        connection (AsyncConnection): The transactional connection.
+    """
+    for statement in STATEMENTS:
+        await connection.execute(sqlalchemy.text(statement))
@@ -0,0 +1,94 @@
+"""
+Migration adding the room_occupancy table guarded by a GiST exclusion constraint.
+"""
+
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from hotel_management_system.migrations.migrator import MigrationDataError
+from hotel_management_system.migrations.operations import backfill_in_batches
+
+VERSION = 2
+DESCRIPTION = "Room occupancy with exclusion constraint"
+TRANSACTIONAL = False
+
+# The reservations whose stay in a room overlaps another stay in the same room, grouped by room.
+OVERLAPPING_STAYS = """
+    SELECT room_id, array_agg(reservation_id ORDER BY reservation_id) AS reservation_ids
+    FROM (
+        SELECT
+            reservation_rooms.room_id,
+            reservations.id AS reservation_id,
+            reservations.start_date,
+            reservations.end_date,
+            max(reservations.end_date) OVER preceding_stays AS previous_end_date,
+            min(reservations.start_date) OVER following_stays AS next_start_date
+        FROM reservation_rooms JOIN reservations ON reservations.id = reservation_rooms.reservation_id
+        WHERE reservations.start_date < reservations.end_date
+        WINDOW
+            room_stays AS (PARTITION BY reservation_rooms.room_id ORDER BY reservations.start_date, reservations.id),
+            preceding_stays AS (room_stays ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING),
+            following_stays AS (room_stays ROWS BETWEEN 1 FOLLOWING AND UNBOUNDED FOLLOWING)
+    ) AS stays
+    WHERE previous_end_date > start_date OR next_start_date < end_date
+    GROUP BY room_id
+    ORDER BY room_id
+"""
+
+
+async def upgrade(connection: AsyncConnection) -> None:
+    """
+    Create room_occupancy and backfill it from reservation_rooms in batches of reservations.
+
+    Overlapping legacy stays cannot satisfy the exclusion constraint, and dropping them would
+    make their rooms look free, so the migration fails listing them until they are resolved.
+
+    Args:
+        connection (AsyncConnection): The autocommit connection.
+
+    Raises:
+        MigrationDataError: If stays of different reservations overlap in the same room.
+    """
+    overlapping_stays = (await connection.execute(sqlalchemy.text(OVERLAPPING_STAYS))).all()
+
+    if overlapping_stays:
+        raise MigrationDataError(
+            "Overlapping stays must be resolved before room_occupancy can be backfilled: "
+            + "; ".join(
+                f"room {room_id}: reservations {', '.join(map(str, reservation_ids))}"
+                for room_id, reservation_ids in overlapping_stays
+            )
+        )
+
+    await connection.execute(sqlalchemy.text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+    await connection.execute(sqlalchemy.text(
+        """
+        CREATE TABLE IF NOT EXISTS room_occupancy (
+            reservation_id INTEGER NOT NULL,
+            room_id INTEGER NOT NULL,
+            stay DATERANGE NOT NULL,
+            CONSTRAINT room_occupancy_no_overlap EXCLUDE USING gist (room_id WITH =, stay WITH &&),
+            FOREIGN KEY(reservation_id) REFERENCES reservations (id),
+            FOREIGN KEY(room_id) REFERENCES rooms (id)
+        )
+        """
+    ))
+
+    await backfill_in_batches(
+        connection,
+        "reservations",
+        "id",
+        lambda low, high: sqlalchemy.text(
+            """
+            INSERT INTO room_occupancy (reservation_id, room_id, stay)
+            SELECT reservations.id, reservation_rooms.room_id, daterange(reservations.start_date, reservations.end_date)
+            FROM reservation_rooms JOIN reservations ON reservations.id = reservation_rooms.reservation_id
+            WHERE reservations.id >= :low AND reservations.id < :high
+            AND NOT EXISTS (
+                SELECT FROM room_occupancy
+                WHERE room_occupancy.reservation_id = reservation_rooms.reservation_id
+                AND room_occupancy.room_id = reservation_rooms.room_id
+            )
+            """
+        ).bindparams(low=low, high=high),
+    )
@@ -0,0 +1,65 @@
+"""
+Migration adding the daily_stats and daily_revenue raport rollups.
+"""
+
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+VERSION = 3
+DESCRIPTION = "Daily raport rollups"
+TRANSACTIONAL = True
+
+STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS daily_stats (
+        date DATE NOT NULL,
+        reserved_rooms_count INTEGER DEFAULT '0' NOT NULL,
+        total_guests_count INTEGER DEFAULT '0' NOT NULL,
+        total_guests_with_accessibilities_count INTEGER DEFAULT '0' NOT NULL,
+        PRIMARY KEY (date)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS daily_revenue (
+        date DATE NOT NULL,
+        pricing_detail_id INTEGER NOT NULL,
+        total_income FLOAT DEFAULT '0' NOT NULL,
+        PRIMARY KEY (date, pricing_detail_id),
+        FOREIGN KEY(pricing_detail_id) REFERENCES pricing_details (id)
+    )
+    """,
+    """
+    INSERT INTO daily_stats (date, reserved_rooms_count, total_guests_count, total_guests_with_accessibilities_count)
+    SELECT
+        reservations.start_date,
+        count(*),
+        coalesce(sum(reservations.number_of_guests), 0),
+        count(*) FILTER (WHERE EXISTS (
+            SELECT FROM guests_accessibility_options_table
+            WHERE guests_accessibility_options_table.guest_id = reservations.guest_id
+        ))
+    FROM reservations
+    GROUP BY reservations.start_date
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO daily_revenue (date, pricing_detail_id, total_income)
+    SELECT reservations.start_date, bills.pricing_detail_id, sum(pricing_details.price)
+    FROM bills
+    JOIN reservations ON reservations.id = bills.reservation_id
+    JOIN pricing_details ON pricing_details.id = bills.pricing_detail_id
+    GROUP BY reservations.start_date, bills.pricing_detail_id
+    ON CONFLICT DO NOTHING
+    """,
+]
+
+
+async def upgrade(connection: AsyncConnection) -> None:
+    """
+    Create the rollup tables and fill them from the existing reservations and bills.
+
+    Args:
+        connection (AsyncConnection): The transactional connection.
+    """
+    for statement in STATEMENTS:
+        await connection.execute(sqlalchemy.text(statement))
@@ -0,0 +1,50 @@
+"""
+Migration adding the composite primary keys and the lookup indexes.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from hotel_management_system.migrations.operations import add_primary_key, create_index_concurrently
+
+VERSION = 4
+DESCRIPTION = "Composite keys and lookup indexes"
+TRANSACTIONAL = False
+
+PRIMARY_KEYS = [
+    ("reservation_rooms", ["reservation_id", "room_id"]),
+    ("room_occupancy", ["reservation_id", "room_id"]),
+    ("rooms_accessibility_options_table", ["room_id", "accessibility_option_id"]),
+    ("guests_accessibility_options_table", ["guest_id", "accessibility_option_id"]),
+]
+
+INDEXES = [
+    ("ix_accessibility_options_name", "accessibility_options", ["name"]),
+    ("ix_guests_first_name", "guests", ["first_name"]),
+    ("ix_guests_last_name_first_name", "guests", ["last_name", "first_name"]),
+    ("ix_pricing_details_name", "pricing_details", ["name"]),
+    ("ix_guests_accessibility_options_table_accessibility_option_id", "guests_accessibility_options_table",
+     ["accessibility_option_id"]),
+    ("ix_reservations_guest_id", "reservations", ["guest_id"]),
+    ("ix_reservations_start_date_end_date", "reservations", ["start_date", "end_date"]),
+    ("ix_rooms_accessibility_options_table_accessibility_option_id", "rooms_accessibility_options_table",
+     ["accessibility_option_id"]),
+    ("ix_bills_reservation_id", "bills", ["reservation_id"]),
+    ("ix_bills_room_id_pricing_detail_id", "bills", ["room_id", "pricing_detail_id"]),
+    ("ix_bills_pricing_detail_id", "bills", ["pricing_detail_id"]),
+    ("ix_invoices_reservation_id", "invoices", ["reservation_id"]),
+    ("ix_reservation_rooms_room_id", "reservation_rooms", ["room_id"]),
+]
+
+
+async def upgrade(connection: AsyncConnection) -> None:
+    """
+    Add the keys and indexes concurrently, without blocking writes.
+
+    Args:
+        connection (AsyncConnection): The autocommit connection.
+    """
+    for table, columns in PRIMARY_KEYS:
+        await add_primary_key(connection, table, columns)
+
+    for name, table, columns in INDEXES:
+        await create_index_concurrently(connection, name, table, columns)
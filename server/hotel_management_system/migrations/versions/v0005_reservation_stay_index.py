@@ -0,0 +1,27 @@
+"""
+Migration adding the GiST index serving the reservation overlap queries.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from hotel_management_system.migrations.operations import create_index_concurrently
+
+VERSION = 5
+DESCRIPTION = "Reservation stay overlap index"
+TRANSACTIONAL = False
+
+
+async def upgrade(connection: AsyncConnection) -> None:
+    """
+    Build the index on daterange(start_date, end_date) concurrently.
+
+    Args:
+        connection (AsyncConnection): The autocommit connection.
+    """
+    await create_index_concurrently(
+        connection,
+        "ix_reservations_stay",
+        "reservations",
+        ["daterange(start_date, end_date)"],
+        using="gist",
+    )
@@ -0,0 +1,34 @@
+"""
+Migration adding the trigram index serving the guest search.
+"""
+
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from hotel_management_system.migrations.operations import create_index_concurrently
+
+VERSION = 6
+DESCRIPTION = "Guest search trigram index"
+TRANSACTIONAL = False
+
+SEARCH_TEXT = (
+    "lower(coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || coalesce(email, '') "
+    "|| ' ' || coalesce(phone_number, '') || ' ' || coalesce(city, ''))"
+)
+
+
+async def upgrade(connection: AsyncConnection) -> None:
+    """
+    Enable pg_trgm and build the GIN index on the searchable guest fields concurrently.
+
+    Args:
+        connection (AsyncConnection): The autocommit connection.
+    """
+    await connection.execute(sqlalchemy.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    await create_index_concurrently(
+        connection,
+        "ix_guests_search_text",
+        "guests",
+        [f"({SEARCH_TEXT}) gin_trgm_ops"],
+        using="gin",
+    )
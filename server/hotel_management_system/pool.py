@@ -0,0 +1,459 @@
+"""A module providing the instrumented database connection pools, the read-replica routing and the compiled queries."""
+
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Dict, Iterator, List, Mapping, Tuple
+
+import databases
+from asyncpg import Record
+from databases.backends.postgres import PostgresBackend, PostgresConnection
+from sqlalchemy import Select
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.sql import ClauseElement
+
+
+class _PrimaryPin:
+    """
+    The time until which the reads of a request, or of the process outside requests, go to the primary.
+    """
+
+    __slots__ = ("until",)
+
+    def __init__(self, until: float = 0.0) -> None:
+        self.until = until
+
+
+_process_pin = _PrimaryPin()
+_request_pin: ContextVar[_PrimaryPin | None] = ContextVar("request_pin", default=None)
+
+
+@contextmanager
+def read_your_writes_scope(pinned_for: float = 0.0) -> Iterator[_PrimaryPin]:
+    """Function opening a scope, e.g. an HTTP request, whose reads follow its own writes.
+
+    The pin is shared by every task of the scope, so a write made by one of them sends
+    the reads of all of them to the primary.
+
+    Args:
+        pinned_for (float, optional): The seconds the reads are pinned to the primary from the start,
+            e.g. after a write of the previous request of the same client. Defaults to 0.
+
+    Yields:
+        _PrimaryPin: The pin of the scope, telling until when its reads go to the primary.
+    """
+
+    pin = _PrimaryPin(time.monotonic() + pinned_for)
+    token = _request_pin.set(pin)
+
+    try:
+        yield pin
+    finally:
+        _request_pin.reset(token)
+
+
+@contextmanager
+def read_from_primary() -> Iterator[None]:
+    """Function opening a scope whose reads go to the primary, e.g. to refresh a cache after a write.
+
+    Yields:
+        None: Control to the code running inside the scope.
+    """
+
+    with read_your_writes_scope(math.inf):
+        yield
+
+
+class CompiledQuery:
+    """
+    A class representing a SELECT compiled once into the SQL text of an asyncpg prepared statement.
+
+    asyncpg prepares a statement on a connection once and then finds it in the statement
+    cache by its text, so running a compiled query skips building and compiling the
+    SQLAlchemy expression, as well as the result processing of `databases`. The rows are
+    returned as asyncpg records, and the values are passed without type processing.
+    """
+
+    is_select = True
+    _dialect = PGDialect_asyncpg()
+
+    sql: str
+    _parameters: Tuple[str, ...]
+
+    def __init__(self, query: Select) -> None:
+        """
+        The initializer of the `compiled query`.
+
+        Args:
+            query (Select): The query, taking its values through named `bindparam`s.
+        """
+
+        compiled = query.compile(dialect=self._dialect)
+
+        self.sql = str(compiled)
+        self._parameters = tuple(compiled.positiontup or ())
+
+    def arguments(self, values: Mapping[str, Any] | None) -> List[Any]:
+        """
+        Order the values of the query parameters as the positional arguments of the statement.
+
+        Args:
+            values (Mapping[str, Any] | None): The values keyed by the names of the parameters.
+
+        Returns:
+            List[Any]: The arguments of the statement.
+        """
+
+        return [values[name] for name in self._parameters] if values else []
+
+
+class PoolMetrics:
+    """
+    A class representing the counters of the connections handed out by a pool.
+    """
+
+    __slots__ = ("acquisitions", "wait_time_total", "wait_time_max")
+
+    def __init__(self) -> None:
+        """
+        The initializer of the `pool metrics`.
+        """
+
+        self.acquisitions = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def record_wait(self, wait_time: float) -> None:
+        """
+        Count a connection handed out after waiting for the given time.
+
+        Args:
+            wait_time (float): The seconds spent waiting for the connection.
+        """
+
+        self.acquisitions += 1
+        self.wait_time_total += wait_time
+        self.wait_time_max = max(self.wait_time_max, wait_time)
+
+
+class InstrumentedPostgresConnection(PostgresConnection):
+    """
+    A class representing an asyncpg connection that records how long it waited for the pool.
+    """
+
+    _database: "InstrumentedPostgresBackend"
+
+    async def acquire(self) -> None:
+        """
+        Take a connection from the pool, recording the wait.
+        """
+
+        started = time.perf_counter()
+        await super().acquire()
+        self._database.metrics.record_wait(time.perf_counter() - started)
+
+
+class InstrumentedPostgresBackend(PostgresBackend):
+    """
+    A class representing the asyncpg backend of `databases` with pool metrics.
+    """
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        The initializer of the `instrumented postgres backend`.
+
+        Args:
+            *args: The positional arguments of the asyncpg backend.
+            **kwargs: The keyword arguments of the asyncpg backend, passed on to `asyncpg.create_pool`.
+        """
+
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connection(self) -> InstrumentedPostgresConnection:
+        """
+        Create a connection handle taking its connection from the pool on acquire.
+
+        Returns:
+            InstrumentedPostgresConnection: The connection handle.
+        """
+
+        return InstrumentedPostgresConnection(self, self._dialect)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the occupancy of the pool and the time spent waiting for its connections.
+
+        Returns:
+            Dict[str, float]: The pool sizes, the connections in use, and the wait times in milliseconds.
+        """
+
+        pool = self._pool
+        size = pool.get_size() if pool else 0
+        idle = pool.get_idle_size() if pool else 0
+        acquisitions = self.metrics.acquisitions
+
+        return {
+            "min_size": pool.get_min_size() if pool else 0,
+            "max_size": pool.get_max_size() if pool else 0,
+            "size": size,
+            "in_use": size - idle,
+            "idle": idle,
+            "acquisitions": acquisitions,
+            "wait_time_total_ms": self.metrics.wait_time_total * 1000,
+            "wait_time_avg_ms": self.metrics.wait_time_total * 1000 / acquisitions if acquisitions else 0.0,
+            "wait_time_max_ms": self.metrics.wait_time_max * 1000,
+        }
+
+
+class Database(databases.Database):
+    """
+    A class representing a `databases` database whose PostgreSQL pool reports its metrics.
+
+    With a replica, the SELECT queries read from the replica, unless they run inside a
+    transaction or a write was made within `read_your_writes_window` seconds: by the same
+    request within a `read_your_writes_scope`, or by the process outside of one.
+    Every other statement runs on the primary.
+    """
+
+    replica: "Database | None"
+    read_your_writes_window: float
+
+    SUPPORTED_BACKENDS = {
+        **databases.Database.SUPPORTED_BACKENDS,
+        "postgresql": "hotel_management_system.pool:InstrumentedPostgresBackend",
+        "postgres": "hotel_management_system.pool:InstrumentedPostgresBackend",
+    }
+
+    def __init__(
+            self,
+            url: str,
+            *,
+            replica_url: str | None = None,
+            read_your_writes_window: float = 0.0,
+            **options: Any,
+    ) -> None:
+        """
+        The initializer of the `database`.
+
+        Args:
+            url (str): The URL of the primary.
+            replica_url (str | None, optional): The URL of the read replica. Defaults to None, meaning no replica.
+            read_your_writes_window (float, optional): The seconds the reads stay on the primary after a write.
+                Defaults to 0.
+            **options (Any): The options of both pools, passed on to `asyncpg.create_pool`.
+        """
+
+        super().__init__(url, **options)
+        self.replica = Database(replica_url, **options) if replica_url else None
+        self.read_your_writes_window = read_your_writes_window
+
+    async def connect(self) -> None:
+        """
+        Open the connection pools of the primary and the replica.
+        """
+
+        await super().connect()
+
+        if self.replica:
+            await self.replica.connect()
+
+    async def disconnect(self) -> None:
+        """
+        Close the connection pools of the replica and the primary.
+        """
+
+        if self.replica:
+            await self.replica.disconnect()
+
+        await super().disconnect()
+
+    async def fetch_all(self, query: ClauseElement | CompiledQuery | str, values: dict | None = None) -> List[Any]:
+        """
+        Run a query and return all the rows, reading from the replica when it is safe.
+
+        Args:
+            query (ClauseElement | CompiledQuery | str): The query.
+            values (dict | None, optional): The values of the query parameters. Defaults to None.
+
+        Returns:
+            List[Any]: The rows.
+        """
+
+        if isinstance(query, CompiledQuery):
+            return await self._fetch_compiled(query, values, one=False)
+
+        if self._reads_from_replica(query):
+            return await self.replica.fetch_all(query, values)
+
+        self._pin_if_write(query)
+
+        return await super().fetch_all(query, values)
+
+    async def fetch_one(self, query: ClauseElement | CompiledQuery | str, values: dict | None = None) -> Any | None:
+        """
+        Run a query and return the first row, reading from the replica when it is safe.
+
+        Args:
+            query (ClauseElement | CompiledQuery | str): The query.
+            values (dict | None, optional): The values of the query parameters. Defaults to None.
+
+        Returns:
+            Any | None: The first row, or None if there is none.
+        """
+
+        if isinstance(query, CompiledQuery):
+            return await self._fetch_compiled(query, values, one=True)
+
+        if self._reads_from_replica(query):
+            return await self.replica.fetch_one(query, values)
+
+        self._pin_if_write(query)
+
+        return await super().fetch_one(query, values)
+
+    async def fetch_val(
+            self,
+            query: ClauseElement | str,
+            values: dict | None = None,
+            column: Any = 0,
+    ) -> Any | None:
+        """
+        Run a query and return a value of the first row, reading from the replica when it is safe.
+
+        Args:
+            query (ClauseElement | str): The query.
+            values (dict | None, optional): The values of the query parameters. Defaults to None.
+            column (Any, optional): The index or the name of the column. Defaults to the first one.
+
+        Returns:
+            Any | None: The value, or None if there is no row.
+        """
+
+        if self._reads_from_replica(query):
+            return await self.replica.fetch_val(query, values, column)
+
+        self._pin_if_write(query)
+
+        return await super().fetch_val(query, values, column)
+
+    async def iterate(self, query: ClauseElement | str, values: dict | None = None) -> AsyncGenerator[Mapping, None]:
+        """
+        Stream the rows of a query through a cursor, reading from the replica when it is safe.
+
+        Args:
+            query (ClauseElement | str): The query.
+            values (dict | None, optional): The values of the query parameters. Defaults to None.
+
+        Yields:
+            Mapping: The next row.
+        """
+
+        source = self.replica if self._reads_from_replica(query) else super()
+
+        async for record in source.iterate(query, values):
+            yield record
+
+    async def execute(self, query: ClauseElement | str, values: dict | None = None) -> Any:
+        """
+        Run a statement on the primary, pinning the following reads to it.
+
+        Args:
+            query (ClauseElement | str): The statement.
+            values (dict | None, optional): The values of the statement parameters. Defaults to None.
+
+        Returns:
+            Any: The result of the statement, e.g. the primary key of an inserted row.
+        """
+
+        self._pin()
+
+        return await super().execute(query, values)
+
+    async def execute_many(self, query: ClauseElement | str, values: List[dict]) -> None:
+        """
+        Run a statement on the primary once for every set of values, pinning the following reads to it.
+
+        Args:
+            query (ClauseElement | str): The statement.
+            values (List[dict]): The values of the statement parameters, one dictionary per run.
+        """
+
+        self._pin()
+
+        await super().execute_many(query, values)
+
+    def pool_stats(self) -> Dict[str, float]:
+        """
+        Get the occupancy of the connection pool and the time spent waiting for its connections.
+
+        Returns:
+            Dict[str, float]: The statistics of the pool.
+        """
+
+        return self._backend.stats()
+
+    async def _fetch_compiled(self, query: CompiledQuery, values: dict | None, one: bool) -> List[Record] | Record | None:
+        """A private method running a compiled query as a prepared statement on the connection of the current task.
+
+        Args:
+            query (CompiledQuery): The query.
+            values (dict | None): The values of the query parameters.
+            one (bool): Whether to return the first row only.
+
+        Returns:
+            List[Record] | Record | None: The rows, or the first row if `one` is set.
+        """
+
+        source = self.replica if self._reads_from_replica(query) else self
+
+        async with source.connection() as connection:
+            raw_connection = connection.raw_connection
+            arguments = query.arguments(values)
+
+            if one:
+                return await raw_connection.fetchrow(query.sql, *arguments)
+
+            return await raw_connection.fetch(query.sql, *arguments)
+
+    def _reads_from_replica(self, query: ClauseElement | CompiledQuery | str) -> bool:
+        """A private method telling whether a query can read from the replica.
+
+        Args:
+            query (ClauseElement | CompiledQuery | str): The query.
+
+        Returns:
+            bool: True for a SELECT outside a transaction and the read-your-writes window.
+        """
+
+        if self.replica is None or not getattr(query, "is_select", False):
+            return False
+
+        connection = self._connection
+
+        if connection is not None and connection._transaction_stack:
+            return False
+
+        return time.monotonic() >= (_request_pin.get() or _process_pin).until
+
+    def _pin_if_write(self, query: ClauseElement | str) -> None:
+        """A private method pinning the reads to the primary after a statement other than a SELECT.
+
+        Args:
+            query (ClauseElement | str): The statement.
+        """
+
+        if not getattr(query, "is_select", False):
+            self._pin()
+
+    def _pin(self) -> None:
+        """A private method keeping the reads of the request, or of the process, on the primary for a while."""
+
+        if self.replica is None:
+            return
+
+        pin = _request_pin.get() or _process_pin
+        pin.until = max(pin.until, time.monotonic() + self.read_your_writes_window)
@@ -0,0 +1,108 @@
+"""
+Module benchmarking the Python overhead of a lookup built per call against a compiled query.
+
+Only the work done before the statement is sent to the DB is measured, so no DB is needed.
+A lookup built per call constructs the SQLAlchemy expression and compiles it through
+`databases`, while a compiled query only orders the values of its parameters:
+
+    python -m hotel_management_system.utils.benchmark_compiled_queries
+"""
+
+import statistics
+import time
+from typing import Callable
+
+from databases.backends.common.records import create_column_maps
+from databases.backends.postgres import PostgresBackend
+from sqlalchemy import select
+
+from hotel_management_system.db import bills_table, guests_table
+from hotel_management_system.infrastructure.repositories.bill_repository import BILLS_BY_RESERVATION_ID
+from hotel_management_system.infrastructure.repositories.guest_repository import GUEST_BY_ID
+
+CALLS = 10_000
+REPEATS = 7
+
+connection = PostgresBackend("postgresql://localhost/benchmark").connection()
+
+
+def measure(lookup: Callable[[int], object]) -> float:
+    """
+    Run a lookup preparation `CALLS` times, repeatedly, and return the median cost of a call.
+
+    Args:
+        lookup (Callable[[int], object]): The function preparing the lookup of an ID.
+
+    Returns:
+        float: The median cost of a call, in microseconds.
+    """
+    durations = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+
+        for lookup_id in range(CALLS):
+            lookup(lookup_id)
+
+        durations.append((time.perf_counter() - start) / CALLS * 1_000_000)
+
+    return statistics.median(durations)
+
+
+def build_guest_by_id(guest_id: int) -> object:
+    """
+    Build and compile the guest lookup the way every call did before.
+
+    Args:
+        guest_id (int): The ID of the guest.
+
+    Returns:
+        object: The column maps of the rows, built for each call by `databases`.
+    """
+    query = guests_table.select().where(guests_table.c.id == guest_id)
+    _, _, result_columns = connection._compile(query)
+
+    return create_column_maps(result_columns)
+
+
+def build_bills_by_reservation_id(reservation_id: int) -> object:
+    """
+    Build and compile the bills lookup the way every call did before.
+
+    Args:
+        reservation_id (int): The ID of the reservation.
+
+    Returns:
+        object: The column maps of the rows, built for each call by `databases`.
+    """
+    query = select(bills_table).where(bills_table.c.reservation_id == reservation_id)
+    _, _, result_columns = connection._compile(query)
+
+    return create_column_maps(result_columns)
+
+
+def main() -> None:
+    """
+    Print the cost of a call of each lookup, built per call and compiled.
+    """
+    lookups = (
+        ("guest by ID", build_guest_by_id, lambda guest_id: GUEST_BY_ID.arguments({"guest_id": guest_id})),
+        (
+            "bills by reservation ID",
+            build_bills_by_reservation_id,
+            lambda reservation_id: BILLS_BY_RESERVATION_ID.arguments({"reservation_id": reservation_id}),
+        ),
+    )
+
+    for name, built, compiled in lookups:
+        built_cost = measure(built)
+        compiled_cost = measure(compiled)
+
+        print(
+            f"{name:<24} built per call: {built_cost:7.2f} us  "
+            f"compiled: {compiled_cost:5.2f} us  ({built_cost / compiled_cost:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Module benchmarking the conversion of DB records into domain models.
+
+The rows are real records, as the repositories receive them: asyncpg records, returned
+by the compiled queries, and the `databases` records wrapping them, returned by every
+other query. They are built in memory, so no DB is needed.
+
+Every model with a `from_record` is first checked to map both kinds of records into the
+same instance as validation does, including the records lacking an optional column.
+Then the models of the list endpoints are built from `ROWS` records, validated the way
+`from_record` did before and with its record mapper:
+
+    python -m hotel_management_system.utils.benchmark_record_mapping
+"""
+
+import datetime
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from asyncpg import Record
+from asyncpg.protocol.protocol import _create_record  # type: ignore
+from databases.backends.common.records import Record as DatabasesRecord, create_column_maps
+from databases.backends.postgres import PostgresBackend
+from pydantic import BaseModel
+from sqlalchemy import literal, select
+
+from hotel_management_system.core.domains.accessibility_option import AccessibilityOption
+from hotel_management_system.core.domains.bill import Bill
+from hotel_management_system.core.domains.guest import Guest
+from hotel_management_system.core.domains.guest_accessibility_option import GuestAccessibilityOption
+from hotel_management_system.core.domains.invoice import Invoice
+from hotel_management_system.core.domains.pricing_detail import PricingDetail
+from hotel_management_system.core.domains.raport import Raport
+from hotel_management_system.core.domains.reservation import Reservation
+from hotel_management_system.core.domains.reservation_room import ReservationRoom
+from hotel_management_system.core.domains.room import Room
+from hotel_management_system.core.domains.room_accessibility_option import RoomAccessibilityOption
+from hotel_management_system.core.domains.room_occupancy import RoomOccupancy
+
+ROWS = 100_000
+REPEATS = 5
+BENCHMARKED_MODELS = (Guest, Reservation, Bill, Invoice)
+
+ROW_VALUES: Dict[Type[BaseModel], Callable[[int], Dict[str, Any]]] = {
+    AccessibilityOption: lambda row_id: {"id": row_id, "name": "Wheelchair access"},
+    Bill: lambda row_id: {"room_id": row_id, "pricing_detail_id": 1, "reservation_id": row_id},
+    Guest: lambda row_id: {
+        "id": row_id,
+        "first_name": "Jan",
+        "last_name": "Kowalski",
+        "address": "ul. Słoneczna 15",
+        "city": "Warszawa",
+        "country": "Polska",
+        "zip_code": "00-123",
+        "phone_number": "+48 221 234 567",
+        "email": "jan.kowalski@example.com",
+    },
+    GuestAccessibilityOption: lambda row_id: {"guest_id": row_id, "accessibility_option_id": 1},
+    Invoice: lambda row_id: {
+        "id": row_id,
+        "date_of_issue": datetime.date(2024, 6, 4),
+        "first_name": "Jan",
+        "last_name": "Kowalski",
+        "address": "ul. Słoneczna 15",
+        "nip": "123-456-78-90",
+        "reservation_id": row_id,
+        "total_sum": 450.0,
+    },
+    PricingDetail: lambda row_id: {"id": row_id, "name": "Breakfast", "price": 45.0},
+    Raport: lambda row_id: {
+        "reserved_rooms_count": row_id,
+        "free_rooms_count": 10,
+        "total_income": 1250.0,
+        "total_guests_count": 30,
+        "total_guests_with_accessibilities_count": 2,
+    },
+    Reservation: lambda row_id: {
+        "id": row_id,
+        "guest_id": row_id,
+        "start_date": datetime.date(2024, 6, 1),
+        "end_date": datetime.date(2024, 6, 4),
+        "number_of_guests": 2,
+    },
+    ReservationRoom: lambda row_id: {"reservation_id": row_id, "room_id": 1},
+    Room: lambda row_id: {"id": row_id, "alias": "101"},
+    RoomAccessibilityOption: lambda row_id: {"room_id": row_id, "accessibility_option_id": 1},
+    RoomOccupancy: lambda row_id: {
+        "reservation_id": row_id,
+        "room_id": 1,
+        "start_date": datetime.date(2024, 6, 1),
+        "end_date": datetime.date(2024, 6, 4),
+    },
+}
+
+connection = PostgresBackend("postgresql://localhost/benchmark").connection()
+
+
+def build_records(values: List[Dict[str, Any]]) -> Tuple[List[Record], List[DatabasesRecord]]:
+    """
+    Build the asyncpg records of the rows, and the `databases` records wrapping them.
+
+    The `databases` records get the result columns of a query selecting the row values,
+    compiled the way `databases` compiles every query.
+
+    Args:
+        values (List[Dict[str, Any]]): The rows, all with the same columns.
+
+    Returns:
+        Tuple[List[Record], List[DatabasesRecord]]: The asyncpg and the `databases` records.
+    """
+    query = select(*(literal(value).label(name) for name, value in values[0].items()))
+    _, _, result_columns = connection._compile(query)
+    column_maps = create_column_maps(result_columns)
+    record_map = {name: index for index, name in enumerate(values[0])}
+
+    records = [_create_record(record_map, tuple(row.values())) for row in values]
+    databases_records = [
+        DatabasesRecord(record, result_columns, connection._dialect, column_maps) for record in records
+    ]
+
+    return records, databases_records
+
+
+def check() -> None:
+    """
+    Check every model maps both kinds of records into the same instance as validation does.
+
+    Raises:
+        AssertionError: If a mapped instance differs from the validated one.
+    """
+    for model, row_values in ROW_VALUES.items():
+        rows = [row_values(1)]
+
+        # The invoice lookup by ID selects no `total_sum`, so the mapper falls back to its default.
+        if model is Invoice:
+            rows.append({name: value for name, value in row_values(1).items() if name != "total_sum"})
+
+        for row in rows:
+            for record in build_records([row]):
+                mapped, validated = model.from_record(record[0]), model(**dict(record[0]))
+
+                if mapped != validated or mapped.model_dump_json() != validated.model_dump_json():
+                    raise AssertionError(f"{model.__name__}: {mapped!r} != {validated!r}")
+
+    print(f"Checked the record mappers of {len(ROW_VALUES)} models.")
+
+
+def measure(convert: Callable[[Record], BaseModel], records: List[Record]) -> float:
+    """
+    Convert all the records repeatedly and return the median duration.
+
+    Args:
+        convert (Callable[[Record], BaseModel]): The function converting a record.
+        records (List[Record]): The records.
+
+    Returns:
+        float: The median duration, in milliseconds.
+    """
+    durations = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+
+        for record in records:
+            convert(record)
+
+        durations.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(durations)
+
+
+def main() -> None:
+    """
+    Check the record mappers, then print the time of converting `ROWS` records into each model.
+    """
+    check()
+    print(f"{'model':<12} {'records':<10} {'validated':>10} {'from_record':>12}  speedup")
+
+    for model in BENCHMARKED_MODELS:
+        records, databases_records = build_records([ROW_VALUES[model](row_id) for row_id in range(ROWS)])
+
+        for kind, kind_records in (("asyncpg", records), ("databases", databases_records)):
+            validated = measure(lambda record: model(**dict(record)), kind_records)
+            mapped = measure(model.from_record, kind_records)
+
+            print(
+                f"{model.__name__:<12} {kind:<10} {validated:8.0f}ms {mapped:10.0f}ms  "
+                f"{validated / mapped:.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
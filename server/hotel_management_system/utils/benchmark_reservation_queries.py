@@ -0,0 +1,127 @@
+"""
+Module benchmarking the monthly reservation queries against growing tables.
+
+Every table size holds the same number of reservations in the measured month, so
+a query served by an index keeps a flat cost while a full scan grows with the table.
+The seeded rows are rolled back, so it is safe to run against a development DB:
+
+    python -m hotel_management_system.utils.benchmark_reservation_queries
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable
+
+from dependency_injector.wiring import inject, Provide
+from sqlalchemy import extract, select, text
+
+from hotel_management_system.container import Container
+from hotel_management_system.core.repositories.i_reservation_repository import IReservationRepository
+from hotel_management_system.db import database, reservations_table
+
+TABLE_SIZES = (10_000, 100_000, 1_000_000)
+MONTH_ROWS = 1_000
+REPEATS = 20
+YEAR, MONTH_NUMBER = 2000, 6
+
+
+async def seed(table_size: int) -> None:
+    """
+    Insert one guest and `table_size` reservations, `MONTH_ROWS` of which start in the measured month.
+
+    Args:
+        table_size (int): The number of reservations to insert.
+    """
+    guest_id = await database.execute(text("INSERT INTO guests (first_name) VALUES ('Benchmark') RETURNING id"))
+
+    await database.execute(
+        text(
+            """
+            INSERT INTO reservations (guest_id, start_date, end_date, number_of_guests)
+            SELECT :guest_id, stay.start_date, stay.start_date + 3, 1
+            FROM generate_series(1, :table_size) AS i,
+                LATERAL (SELECT CASE
+                    WHEN i <= :month_rows THEN make_date(:year, :month_number, 1) + i % 28
+                    ELSE make_date(:year + 1, 1, 1) + i % 36500
+                END AS start_date) AS stay
+            """
+        ).bindparams(
+            guest_id=guest_id,
+            table_size=table_size,
+            month_rows=MONTH_ROWS,
+            year=YEAR,
+            month_number=MONTH_NUMBER,
+        )
+    )
+    await database.execute(text("ANALYZE reservations"))
+
+
+async def measure(query: Callable[[], Awaitable]) -> float:
+    """
+    Run a query repeatedly and return its median duration.
+
+    Args:
+        query (Callable[[], Awaitable]): The coroutine function running the query.
+
+    Returns:
+        float: The median duration, in milliseconds.
+    """
+    durations = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        await query()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(durations)
+
+
+async def extract_by_month() -> None:
+    """
+    Run the former `extract`-based monthly query, kept as the baseline.
+    """
+    query = (
+        select(reservations_table)
+        .filter(extract('year', reservations_table.c.start_date) == YEAR)
+        .filter(extract('month', reservations_table.c.start_date) == MONTH_NUMBER)
+    )
+
+    await database.fetch_all(query)
+
+
+@inject
+async def main(
+        reservation_repository: IReservationRepository = Provide[Container.reservation_repository],
+) -> None:
+    """
+    Print the median duration of every monthly query for each table size.
+
+    Args:
+        reservation_repository (IReservationRepository, optional): The injected reservation repository dependency.
+    """
+    queries = {
+        "extract (baseline)": extract_by_month,
+        "get_by_month": lambda: reservation_repository.get_by_month(YEAR, MONTH_NUMBER),
+        "get_active_by_month": lambda: reservation_repository.get_active_by_month(YEAR, MONTH_NUMBER),
+    }
+
+    await database.connect()
+
+    try:
+        print(f"\n{'table size':>12}" + "".join(f"{name:>22}" for name in queries), flush=True)
+
+        for table_size in TABLE_SIZES:
+            async with database.transaction(force_rollback=True):
+                await seed(table_size)
+                durations = [await measure(query) for query in queries.values()]
+
+            print(f"{table_size:>12}" + "".join(f"{duration:>19.2f} ms" for duration in durations), flush=True)
+    finally:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    container = Container()
+    container.wire(modules=[__name__])
+    asyncio.run(main())
@@ -0,0 +1,257 @@
+"""
+Module exporting reservations, their rooms, bills and guests into Parquet datasets for the analytics pipeline.
+
+Reservations, reservation rooms and bills are partitioned by the year and month of the
+reservation start date (`year=2024/month=6/...`); guests have no date and are written
+unpartitioned. Every table is compressed with zstd.
+
+The rows are read through server-side cursors and written every `PARQUET_EXPORT_BATCH_SIZE`
+rows, so memory stays fixed however large the export is. A run exports only the reservations
+and guests with IDs above the watermark of the previous one, stored next to the datasets.
+
+Only a full run gives a complete and current dataset. The watermark is the highest exported
+ID, not a commit position, so an incremental run misses:
+
+- the rows committed after the previous run with a lower ID than its watermark, as IDs are
+  drawn from the sequence at insert time while transactions commit in any order,
+- the rooms and bills added to, and the changes and deletions of, the reservations already
+  exported, as the tables keep no change timestamp to find them by.
+
+Incremental runs suit a quick refresh between the full runs, which must be scheduled to
+keep the datasets exact:
+
+    python -m hotel_management_system.utils.export_parquet [--output DIR] [--full]
+
+It requires pyarrow, installed with `pip install -r requirements-export.txt`.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import uuid
+from typing import Any, Dict, List
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Integer, Select, cast, extract, func, select
+
+from hotel_management_system.config import config
+from hotel_management_system.db import (
+    bills_table,
+    guests_table,
+    pricing_details_table,
+    reservation_rooms_table,
+    reservations_table,
+    database,
+)
+
+WATERMARK_FILE = "_watermark.json"
+PARTITION_COLUMNS = ["year", "month"]
+
+PARTITIONS = (
+    cast(extract("year", reservations_table.c.start_date), Integer).label("year"),
+    cast(extract("month", reservations_table.c.start_date), Integer).label("month"),
+)
+
+SCHEMAS = {
+    "reservations": pa.schema([
+        ("id", pa.int32()),
+        ("guest_id", pa.int32()),
+        ("start_date", pa.date32()),
+        ("end_date", pa.date32()),
+        ("number_of_guests", pa.int32()),
+        ("year", pa.int16()),
+        ("month", pa.int8()),
+    ]),
+    "reservation_rooms": pa.schema([
+        ("reservation_id", pa.int32()),
+        ("room_id", pa.int32()),
+        ("year", pa.int16()),
+        ("month", pa.int8()),
+    ]),
+    "bills": pa.schema([
+        ("reservation_id", pa.int32()),
+        ("room_id", pa.int32()),
+        ("pricing_detail_id", pa.int32()),
+        ("pricing_detail_name", pa.string()),
+        ("price", pa.float64()),
+        ("year", pa.int16()),
+        ("month", pa.int8()),
+    ]),
+    "guests": pa.schema([
+        ("id", pa.int32()),
+        ("first_name", pa.string()),
+        ("last_name", pa.string()),
+        ("address", pa.string()),
+        ("city", pa.string()),
+        ("country", pa.string()),
+        ("zip_code", pa.string()),
+        ("phone_number", pa.string()),
+        ("email", pa.string()),
+    ]),
+}
+
+
+def read_watermark(output: str) -> Dict[str, int]:
+    """
+    Read the last exported reservation and guest IDs.
+
+    Args:
+        output (str): The directory of the datasets.
+
+    Returns:
+        Dict[str, int]: The last exported ID keyed by table, 0 for a first run.
+    """
+    try:
+        with open(os.path.join(output, WATERMARK_FILE)) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {"reservations": 0, "guests": 0}
+
+
+def write_watermark(output: str, watermark: Dict[str, int]) -> None:
+    """
+    Store the last exported reservation and guest IDs, replacing the previous watermark atomically.
+
+    Args:
+        output (str): The directory of the datasets.
+        watermark (Dict[str, int]): The last exported ID keyed by table.
+    """
+    os.makedirs(output, exist_ok=True)
+    path = os.path.join(output, WATERMARK_FILE)
+
+    with open(f"{path}.tmp", "w") as file:
+        json.dump(watermark, file)
+
+    os.replace(f"{path}.tmp", path)
+
+
+async def export_table(name: str, query: Select, output: str, run_id: str, batch_size: int) -> int:
+    """
+    Stream the rows of a query into a Parquet dataset, one batch of files at a time.
+
+    Args:
+        name (str): The name of the dataset.
+        query (Select): The query selecting the columns of the dataset schema.
+        output (str): The directory of the datasets.
+        run_id (str): The ID of the run, keeping the file names of the runs apart.
+        batch_size (int): The number of rows written at once.
+
+    Returns:
+        int: The number of exported rows.
+    """
+    schema = SCHEMAS[name]
+    partitioned = "year" in schema.names
+    rows: List[Dict[str, Any]] = []
+    batch_count = 0
+    row_count = 0
+
+    def flush() -> None:
+        nonlocal batch_count, row_count
+        batch_count += 1
+        row_count += len(rows)
+        pq.write_to_dataset(
+            pa.Table.from_pylist(rows, schema=schema),
+            root_path=os.path.join(output, name),
+            partition_cols=PARTITION_COLUMNS if partitioned else None,
+            basename_template=f"{run_id}-{batch_count}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+            compression="zstd",
+        )
+        rows.clear()
+
+    async for record in database.iterate(query):
+        rows.append(dict(record))
+
+        if len(rows) == batch_size:
+            flush()
+
+    if rows:
+        flush()
+
+    return row_count
+
+
+async def main(output: str, full: bool) -> None:
+    """
+    Export the reservations and guests with IDs above the watermark, or all of them.
+
+    Every table is read from the same snapshot, so the rooms and bills match the exported reservations.
+    An incremental run can miss rows, as described in the module, so only a full run is complete.
+
+    Args:
+        output (str): The directory of the datasets.
+        full (bool): Whether to replace the datasets with all the data instead of appending the new rows.
+    """
+    watermark = {"reservations": 0, "guests": 0} if full else read_watermark(output)
+    run_id = uuid.uuid4().hex
+    batch_size = config.PARQUET_EXPORT_BATCH_SIZE
+
+    if full:
+        for name in SCHEMAS:
+            shutil.rmtree(os.path.join(output, name), ignore_errors=True)
+
+    await database.connect()
+
+    try:
+        async with database.transaction(isolation="repeatable_read", readonly=True):
+            last_ids = {
+                "reservations": await database.fetch_val(select(func.coalesce(func.max(reservations_table.c.id), 0))),
+                "guests": await database.fetch_val(select(func.coalesce(func.max(guests_table.c.id), 0))),
+            }
+            new_reservations = reservations_table.c.id.between(watermark["reservations"] + 1, last_ids["reservations"])
+            new_guests = guests_table.c.id.between(watermark["guests"] + 1, last_ids["guests"])
+
+            queries = {
+                "reservations": (
+                    select(reservations_table, *PARTITIONS)
+                    .where(new_reservations)
+                    .order_by(reservations_table.c.id)
+                ),
+                "reservation_rooms": (
+                    select(reservation_rooms_table, *PARTITIONS)
+                    .select_from(reservation_rooms_table.join(reservations_table))
+                    .where(new_reservations)
+                    .order_by(reservation_rooms_table.c.reservation_id)
+                ),
+                "bills": (
+                    select(
+                        bills_table,
+                        pricing_details_table.c.name.label("pricing_detail_name"),
+                        pricing_details_table.c.price,
+                        *PARTITIONS,
+                    )
+                    .select_from(bills_table.join(pricing_details_table).join(reservations_table))
+                    .where(new_reservations)
+                    .order_by(bills_table.c.reservation_id)
+                ),
+                "guests": (
+                    select(guests_table)
+                    .where(new_guests)
+                    .order_by(guests_table.c.id)
+                ),
+            }
+
+            for name, query in queries.items():
+                print(f"=== Exporting {name} ===", flush=True)
+                count = await export_table(name, query, output, run_id, batch_size)
+                print(f"=== Exported {count} {name} ===", flush=True)
+    finally:
+        await database.disconnect()
+
+    write_watermark(output, last_ids)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the reservations, bills and guests into Parquet datasets.")
+    parser.add_argument("--output", default=config.PARQUET_EXPORT_DIR, help="The directory of the datasets.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Replace the datasets with all the data, the only complete export, instead of the rows above the watermark.",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(args.output, args.full))
@@ -0,0 +1,42 @@
+"""
+Module rebuilding the daily stats rollups from all reservations and bills.
+
+The services keep the rollups current, so run it to backfill them, or after rows
+were written to the DB outside the services:
+
+    python -m hotel_management_system.utils.rebuild_daily_stats
+"""
+
+import asyncio
+
+from dependency_injector.wiring import inject, Provide
+
+from hotel_management_system.container import Container
+from hotel_management_system.core.repositories.i_daily_stats_repository import IDailyStatsRepository
+from hotel_management_system.db import database
+
+
+@inject
+async def main(
+        daily_stats_repository: IDailyStatsRepository = Provide[Container.daily_stats_repository],
+) -> None:
+    """
+    Recompute the daily stats in a single transaction.
+
+    Args:
+        daily_stats_repository (IDailyStatsRepository, optional): The injected daily_stats repository dependency.
+    """
+    await database.connect()
+
+    try:
+        print('\n=== Rebuilding daily stats ===', flush=True)
+        await daily_stats_repository.rebuild()
+        print('\n=== Daily stats rebuilt ===', flush=True)
+    finally:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    container = Container()
+    container.wire(modules=[__name__])
+    asyncio.run(main())